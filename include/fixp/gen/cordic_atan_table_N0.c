@@ -0,0 +1,9 @@
+#include "cordic_atan_table_N0.h"
+
+const int64_t cordic_atan_table_N0[CORDIC_ATAN_TABLE_N0_LEN] FIXP_ATTR_ALIGN64 = {
+    0
+};
+
+const int64_t cordic_atanh_table_N0[CORDIC_ATANH_TABLE_N0_LEN] FIXP_ATTR_ALIGN64 = {
+    0
+};
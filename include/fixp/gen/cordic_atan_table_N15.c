@@ -0,0 +1,37 @@
+#include "cordic_atan_table_N15.h"
+
+const int64_t cordic_atan_table_N15[CORDIC_ATAN_TABLE_N15_LEN] FIXP_ATTR_ALIGN64 = {
+    25735,
+    15192,
+    8027,
+    4074,
+    2045,
+    1023,
+    511,
+    255,
+    127,
+    63,
+    31,
+    15,
+    7,
+    3,
+    1
+};
+
+const int64_t cordic_atanh_table_N15[CORDIC_ATANH_TABLE_N15_LEN] FIXP_ATTR_ALIGN64 = {
+    17999,
+    8369,
+    4117,
+    2050,
+    1024,
+    512,
+    256,
+    128,
+    64,
+    32,
+    16,
+    8,
+    4,
+    2,
+    1
+};
@@ -0,0 +1,25 @@
+#ifndef FIXP_CORDIC_ATAN_TABLE_N15_H
+#define FIXP_CORDIC_ATAN_TABLE_N15_H
+
+#include <stdint.h>
+
+// Cacheline alignment keeps each table on as few lines as possible and
+// gives vector gathers an aligned base.
+#ifndef FIXP_ATTR_ALIGN64
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ATTR_ALIGN64 __attribute__((aligned(64)))
+#else
+#define FIXP_ATTR_ALIGN64
+#endif
+#endif
+
+// Shared CORDIC tables for all Qm.15 formats:
+// atan(2^-i) scaled by 2^15, i = 0..14
+#define CORDIC_ATAN_TABLE_N15_LEN 15
+extern const int64_t cordic_atan_table_N15[CORDIC_ATAN_TABLE_N15_LEN] FIXP_ATTR_ALIGN64;
+
+// atanh(2^-i) scaled by 2^15, i = 1..15 (index i-1)
+#define CORDIC_ATANH_TABLE_N15_LEN 15
+extern const int64_t cordic_atanh_table_N15[CORDIC_ATANH_TABLE_N15_LEN] FIXP_ATTR_ALIGN64;
+
+#endif // FIXP_CORDIC_ATAN_TABLE_N15_H
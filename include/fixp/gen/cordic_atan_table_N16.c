@@ -0,0 +1,39 @@
+#include "cordic_atan_table_N16.h"
+
+const int64_t cordic_atan_table_N16[CORDIC_ATAN_TABLE_N16_LEN] FIXP_ATTR_ALIGN64 = {
+    51471,
+    30385,
+    16054,
+    8149,
+    4090,
+    2047,
+    1023,
+    511,
+    255,
+    127,
+    63,
+    31,
+    15,
+    7,
+    3,
+    1
+};
+
+const int64_t cordic_atanh_table_N16[CORDIC_ATANH_TABLE_N16_LEN] FIXP_ATTR_ALIGN64 = {
+    35999,
+    16738,
+    8235,
+    4101,
+    2048,
+    1024,
+    512,
+    256,
+    128,
+    64,
+    32,
+    16,
+    8,
+    4,
+    2,
+    1
+};
@@ -0,0 +1,25 @@
+#ifndef FIXP_CORDIC_ATAN_TABLE_N16_H
+#define FIXP_CORDIC_ATAN_TABLE_N16_H
+
+#include <stdint.h>
+
+// Cacheline alignment keeps each table on as few lines as possible and
+// gives vector gathers an aligned base.
+#ifndef FIXP_ATTR_ALIGN64
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ATTR_ALIGN64 __attribute__((aligned(64)))
+#else
+#define FIXP_ATTR_ALIGN64
+#endif
+#endif
+
+// Shared CORDIC tables for all Qm.16 formats:
+// atan(2^-i) scaled by 2^16, i = 0..15
+#define CORDIC_ATAN_TABLE_N16_LEN 16
+extern const int64_t cordic_atan_table_N16[CORDIC_ATAN_TABLE_N16_LEN] FIXP_ATTR_ALIGN64;
+
+// atanh(2^-i) scaled by 2^16, i = 1..16 (index i-1)
+#define CORDIC_ATANH_TABLE_N16_LEN 16
+extern const int64_t cordic_atanh_table_N16[CORDIC_ATANH_TABLE_N16_LEN] FIXP_ATTR_ALIGN64;
+
+#endif // FIXP_CORDIC_ATAN_TABLE_N16_H
@@ -0,0 +1,21 @@
+#include "cordic_atan_table_N7.h"
+
+const int64_t cordic_atan_table_N7[CORDIC_ATAN_TABLE_N7_LEN] FIXP_ATTR_ALIGN64 = {
+    100,
+    59,
+    31,
+    15,
+    7,
+    3,
+    1
+};
+
+const int64_t cordic_atanh_table_N7[CORDIC_ATANH_TABLE_N7_LEN] FIXP_ATTR_ALIGN64 = {
+    70,
+    32,
+    16,
+    8,
+    4,
+    2,
+    1
+};
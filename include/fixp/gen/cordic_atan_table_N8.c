@@ -0,0 +1,23 @@
+#include "cordic_atan_table_N8.h"
+
+const int64_t cordic_atan_table_N8[CORDIC_ATAN_TABLE_N8_LEN] FIXP_ATTR_ALIGN64 = {
+    201,
+    118,
+    62,
+    31,
+    15,
+    7,
+    3,
+    1
+};
+
+const int64_t cordic_atanh_table_N8[CORDIC_ATANH_TABLE_N8_LEN] FIXP_ATTR_ALIGN64 = {
+    140,
+    65,
+    32,
+    16,
+    8,
+    4,
+    2,
+    1
+};
@@ -0,0 +1,151 @@
+/**
+ * @file fixp_cordic_impl.h
+ * @brief Shared CORDIC kernel set for generated Qm.n formats (Generated)
+ *
+ * FIXP_CORDIC_DEFINE(M, N, ST, WT) expands the bit-scan helper and the
+ * rotation and vectoring kernels for one format: ST is the storage
+ * type, WT the wide type used for internals. The invoking .c file must
+ * define CORDIC_K_N, CORDIC_ITERATIONS, CORDIC_SCALE_FREE_N and the
+ * cordic_atan_table() accessor before the expansion; the Q{M}_{N}_MAX/
+ * MIN limits come from the format's math header. The kernels are
+ * static, so each implementation file expands a private copy and names
+ * never collide across translation units. Formats that serve sin/cos
+ * from the quarter-wave LUT expand only FIXP_CORDIC_HIBIT_DEFINE and
+ * FIXP_CORDIC_VECTOR_DEFINE, keeping the unused rotation kernel out of
+ * the TU (-Wunused-function).
+ */
+
+#ifndef FIXP_GEN_FIXP_CORDIC_IMPL_H
+#define FIXP_GEN_FIXP_CORDIC_IMPL_H
+
+#include <stdint.h>
+
+/*
+ * Index of the highest set bit; v must be positive. A single bit-scan
+ * instruction instead of the O(bits) shift loop; the sizeof selection
+ * folds at compile time.
+ */
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_CORDIC_HIBIT_DEFINE(M, N, ST) \
+static inline int q##M##_##N##_hibit(ST v) { \
+    return (int)(sizeof(ST) <= 4 ? 31 - __builtin_clz((uint32_t)v) \
+                                 : 63 - __builtin_clzll((uint64_t)v)); \
+}
+#elif defined(_MSC_VER) && (defined(_M_X64) || defined(_M_ARM64))
+#include <intrin.h>
+#define FIXP_CORDIC_HIBIT_DEFINE(M, N, ST) \
+static inline int q##M##_##N##_hibit(ST v) { \
+    unsigned long idx; \
+    if (sizeof(ST) <= 4) _BitScanReverse(&idx, (unsigned long)(uint32_t)v); \
+    else _BitScanReverse64(&idx, (unsigned __int64)v); \
+    return (int)idx; \
+}
+#else
+#define FIXP_CORDIC_HIBIT_DEFINE(M, N, ST) \
+static inline int q##M##_##N##_hibit(ST v) { \
+    int bit_pos = -1; \
+    while (v > 0) { \
+        v >>= 1; \
+        bit_pos++; \
+    } \
+    return bit_pos; \
+}
+#endif
+
+/*
+ * CORDIC rotation mode. Internals run in the wide type: the rotation
+ * gain drives the magnitude toward 1.0, which formats without integer
+ * bits cannot represent, so the results saturate on store.
+ *
+ * Phase 1 walks the fixed schedule below CORDIC_SCALE_FREE_N; the K
+ * constant assumes every one of those rotations is taken, so none may
+ * be skipped. Phase 2 is closest-angle recoding: jump straight to the
+ * rotation index nearest the residual angle instead of burning an
+ * iteration per zero-rotation of the fixed schedule; each step at
+ * least halves |z|, so the tail finishes in about half the iterations.
+ * Residuals above atan(1) would index past the front of the table and
+ * are clamped to the largest angle available.
+ *
+ * The sign dispatch is a branchless conditional negate -- sign is 0 or
+ * -1, and (v ^ sign) - sign conditionally negates v. Random angles
+ * mispredict a real branch ~50% of the time, costing more than the
+ * whole iteration body.
+ */
+#define FIXP_CORDIC_ROTATE_DEFINE(M, N, ST, WT) \
+static void cordic_rotate(q##M##_##N##_t* x, q##M##_##N##_t* y, q##M##_##N##_t z_in) { \
+    WT x_val = CORDIC_K_##N; \
+    WT y_val = 0; \
+    WT z = z_in; \
+ \
+    for (int i = 0; i < CORDIC_SCALE_FREE_##N; i++) { \
+        const WT sign = -(WT)(z < 0); \
+        WT dy = ((y_val >> i) ^ sign) - sign; \
+        WT dx = ((x_val >> i) ^ sign) - sign; \
+        WT da = ((WT)cordic_atan_table(i) ^ sign) - sign; \
+ \
+        x_val -= dy; \
+        y_val += dx; \
+        z -= da; \
+    } \
+ \
+    WT sign = -(WT)(z < 0); \
+    WT az = (z ^ sign) - sign; \
+    while (az != 0) { \
+        int k = (N) - q##M##_##N##_hibit((ST)az); \
+        if (k < 0) k = 0; \
+        if (k >= CORDIC_ITERATIONS) break; \
+        WT dy = ((y_val >> k) ^ sign) - sign; \
+        WT dx = ((x_val >> k) ^ sign) - sign; \
+        WT da = ((WT)cordic_atan_table(k) ^ sign) - sign; \
+ \
+        x_val -= dy; \
+        y_val += dx; \
+        z -= da; \
+        sign = -(WT)(z < 0); \
+        az = (z ^ sign) - sign; \
+    } \
+ \
+    if (x_val > Q##M##_##N##_MAX) x_val = Q##M##_##N##_MAX; \
+    if (x_val < Q##M##_##N##_MIN) x_val = Q##M##_##N##_MIN; \
+    if (y_val > Q##M##_##N##_MAX) y_val = Q##M##_##N##_MAX; \
+    if (y_val < Q##M##_##N##_MIN) y_val = Q##M##_##N##_MIN; \
+    *x = (q##M##_##N##_t)x_val; \
+    *y = (q##M##_##N##_t)y_val; \
+}
+
+/*
+ * CORDIC vectoring mode. Wide internals: the vectoring gain (~1.65)
+ * can push intermediates past the storage range for large inputs.
+ * Returns the rotation angle; the final x -- the input magnitude times
+ * the vectoring gain 1/K -- lands in *x_final for hypot_atan2. Same
+ * branchless conditional negate as rotation mode, keyed on the sign
+ * of y instead of the residual angle.
+ */
+#define FIXP_CORDIC_VECTOR_DEFINE(M, N, ST, WT) \
+static q##M##_##N##_t cordic_vector(q##M##_##N##_t x_in, q##M##_##N##_t y_in, WT* x_final) { \
+    WT x = x_in; \
+    WT y = y_in; \
+    WT z = 0; \
+ \
+    for (int i = 0; i < CORDIC_ITERATIONS; i++) { \
+        const WT sign = -(WT)(y < 0); \
+        WT dx = ((y >> i) ^ sign) - sign; \
+        WT dy = ((x >> i) ^ sign) - sign; \
+        WT da = ((WT)cordic_atan_table(i) ^ sign) - sign; \
+ \
+        x += dx; \
+        y -= dy; \
+        z += da; \
+    } \
+ \
+    *x_final = x; \
+    return (q##M##_##N##_t)z; \
+}
+
+// The full kernel set: bit-scan helper, rotation and vectoring.
+#define FIXP_CORDIC_DEFINE(M, N, ST, WT) \
+FIXP_CORDIC_HIBIT_DEFINE(M, N, ST) \
+FIXP_CORDIC_ROTATE_DEFINE(M, N, ST, WT) \
+FIXP_CORDIC_VECTOR_DEFINE(M, N, ST, WT)
+
+#endif // FIXP_GEN_FIXP_CORDIC_IMPL_H
@@ -0,0 +1,38 @@
+/**
+ * @file fixp_math.h
+ * @brief Umbrella header and format-keyed math dispatch (Generated)
+ *
+ * Pulls in every generated Qm.n math header and provides FIXP_*
+ * macros that paste the format token onto the matching entry point,
+ * e.g. FIXP_SIN(q15_16, a) -> q15_16_sin(a). Dispatch is keyed on the
+ * format token, not _Generic on the value: the q*_t handles are plain
+ * integer typedefs and several formats share one storage type, so a
+ * value-keyed _Generic could not tell them apart.
+ */
+
+#ifndef FIXP_GEN_FIXP_MATH_H
+#define FIXP_GEN_FIXP_MATH_H
+
+#include "q15_16_math.h"
+#include "q8_8_math.h"
+#include "q7_8_math.h"
+#include "q0_7_math.h"
+#include "q0_15_math.h"
+#include "q23_8_math.h"
+#include "q31_0_math.h"
+
+#define FIXP_SIN(fmt, x)                  fmt##_sin(x)
+#define FIXP_COS(fmt, x)                  fmt##_cos(x)
+#define FIXP_SINCOS(fmt, x, s, c)         fmt##_sincos(x, s, c)
+#define FIXP_TAN(fmt, x)                  fmt##_tan(x)
+#define FIXP_ATAN(fmt, x)                 fmt##_atan(x)
+#define FIXP_ATAN2(fmt, y, x)             fmt##_atan2(y, x)
+#define FIXP_HYPOT_ATAN2(fmt, y, x, h, a) fmt##_hypot_atan2(y, x, h, a)
+#define FIXP_SQRT(fmt, x)                 fmt##_sqrt(x)
+#define FIXP_EXP(fmt, x)                  fmt##_exp(x)
+#define FIXP_EXP2(fmt, x)                 fmt##_exp2(x)
+#define FIXP_LOG(fmt, x)                  fmt##_log(x)
+#define FIXP_LOG2(fmt, x)                 fmt##_log2(x)
+#define FIXP_POW(fmt, x, y)               fmt##_pow(x, y)
+
+#endif // FIXP_GEN_FIXP_MATH_H
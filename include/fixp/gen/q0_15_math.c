@@ -0,0 +1,373 @@
+#include "q0_15_math.h"
+#include "cordic_atan_table_N15.h"
+#include "fixp_cordic_impl.h"
+#include <stdint.h>
+
+// CORDIC constants
+#define CORDIC_K_15 ((q0_15_t)19898)
+#define CORDIC_ITERATIONS 15
+
+// Shared across all Qm.15 formats; values fit in q0_15_t.
+#define cordic_atan_table(i) ((q0_15_t)cordic_atan_table_N15[i])
+
+// Vectoring-mode kernels only; rotation trig is served by the sine LUT
+FIXP_CORDIC_HIBIT_DEFINE(0, 15, int16_t)
+FIXP_CORDIC_VECTOR_DEFINE(0, 15, int16_t, int32_t)
+
+// Quarter-wave sine table, Q15: sin on [0, π/2] at 257 points.
+// 514 bytes -- cacheline-aligned so it spans the minimum nine lines.
+static const int16_t sin_quad_15[257] FIXP_ATTR_ALIGN64 = {
+    0, 201, 402, 603, 804, 1005, 1206, 1407, 1608, 1809,
+    2009, 2210, 2411, 2611, 2811, 3012, 3212, 3412, 3612, 3812,
+    4011, 4211, 4410, 4609, 4808, 5007, 5205, 5404, 5602, 5800,
+    5998, 6195, 6393, 6590, 6787, 6983, 7180, 7376, 7571, 7767,
+    7962, 8157, 8351, 8546, 8740, 8933, 9127, 9319, 9512, 9704,
+    9896, 10088, 10279, 10469, 10660, 10850, 11039, 11228, 11417, 11605,
+    11793, 11980, 12167, 12354, 12540, 12725, 12910, 13095, 13279, 13463,
+    13646, 13828, 14010, 14192, 14373, 14553, 14733, 14912, 15091, 15269,
+    15447, 15624, 15800, 15976, 16151, 16326, 16500, 16673, 16846, 17018,
+    17190, 17361, 17531, 17700, 17869, 18037, 18205, 18372, 18538, 18703,
+    18868, 19032, 19195, 19358, 19520, 19681, 19841, 20001, 20160, 20318,
+    20475, 20632, 20788, 20943, 21097, 21251, 21403, 21555, 21706, 21856,
+    22006, 22154, 22302, 22449, 22595, 22740, 22884, 23028, 23170, 23312,
+    23453, 23593, 23732, 23870, 24008, 24144, 24279, 24414, 24548, 24680,
+    24812, 24943, 25073, 25202, 25330, 25457, 25583, 25708, 25833, 25956,
+    26078, 26199, 26320, 26439, 26557, 26674, 26791, 26906, 27020, 27133,
+    27246, 27357, 27467, 27576, 27684, 27791, 27897, 28002, 28106, 28209,
+    28311, 28411, 28511, 28610, 28707, 28803, 28899, 28993, 29086, 29178,
+    29269, 29359, 29448, 29535, 29622, 29707, 29792, 29875, 29957, 30038,
+    30118, 30196, 30274, 30350, 30425, 30499, 30572, 30644, 30715, 30784,
+    30853, 30920, 30986, 31050, 31114, 31177, 31238, 31298, 31357, 31415,
+    31471, 31527, 31581, 31634, 31686, 31737, 31786, 31834, 31881, 31927,
+    31972, 32015, 32058, 32099, 32138, 32177, 32214, 32251, 32286, 32319,
+    32352, 32383, 32413, 32442, 32470, 32496, 32522, 32546, 32568, 32590,
+    32610, 32629, 32647, 32664, 32679, 32693, 32706, 32718, 32729, 32738,
+    32746, 32753, 32758, 32762, 32766, 32767, 32767,
+};
+
+// Maps r in (-1, 1) (Q15) to an 8.8 table coordinate in one multiply
+#define SIN_LUT_INV_HALFPI_15 83443u
+
+// sin(r) by linear interpolation between adjacent table entries
+static q0_15_t sin_lut(int32_t r) {
+    uint32_t t = ((uint32_t)r * SIN_LUT_INV_HALFPI_15) >> 16;
+    uint32_t i = t >> 8;
+    int32_t frac = (int32_t)(t & 0xFF);
+    int32_t s0 = sin_quad_15[i];
+    int32_t s1 = sin_quad_15[i + 1];
+    return (q0_15_t)(s0 + (((s1 - s0) * frac) >> 8));
+}
+
+// cos(r) = sin(π/2 - r): walk the same table from the far end
+static q0_15_t cos_lut(int32_t r) {
+    uint32_t t = ((uint32_t)r * SIN_LUT_INV_HALFPI_15) >> 16;
+    uint32_t i = t >> 8;
+    int32_t frac = (int32_t)(t & 0xFF);
+    int32_t c0 = sin_quad_15[256 - i];
+    int32_t c1 = sin_quad_15[255 - i];
+    return (q0_15_t)(c0 + (((c1 - c0) * frac) >> 8));
+}
+
+q0_15_t q0_15_sin(q0_15_t angle) {
+    // |angle| < 1 < π/2: no reduction needed. The sign fold runs in
+    // int32 so negating the most negative storage value stays defined.
+    int32_t r = angle;
+    return r < 0 ? (q0_15_t)-sin_lut(-r) : sin_lut(r);
+}
+
+q0_15_t q0_15_cos(q0_15_t angle) {
+    int32_t r = angle;
+    return cos_lut(r < 0 ? -r : r);
+}
+
+void q0_15_sincos(q0_15_t angle, q0_15_t* s, q0_15_t* c) {
+    // No shared reduction to fuse here; two independent lookups.
+    int32_t r = angle;
+    if (r < 0) {
+        *s = (q0_15_t)-sin_lut(-r);
+        *c = cos_lut(-r);
+    } else {
+        *s = sin_lut(r);
+        *c = cos_lut(r);
+    }
+}
+
+void q0_15_sin_v(const q0_15_t* FIXP_RESTRICT angles,
+                q0_15_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(angles); FIXP_ASSUME_ALIGNED64_(out);
+    FIXP_VEC_LOOP_
+    for (size_t idx = 0; idx < count; idx++) {
+        out[idx] = q0_15_sin(angles[idx]);
+    }
+}
+
+void q0_15_cos_v(const q0_15_t* FIXP_RESTRICT angles,
+                q0_15_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(angles); FIXP_ASSUME_ALIGNED64_(out);
+    FIXP_VEC_LOOP_
+    for (size_t idx = 0; idx < count; idx++) {
+        out[idx] = q0_15_cos(angles[idx]);
+    }
+}
+
+void q0_15_hypot_atan2_v(const q0_15_t* FIXP_RESTRICT y, const q0_15_t* FIXP_RESTRICT x,
+                        q0_15_t* FIXP_RESTRICT h, q0_15_t* FIXP_RESTRICT ang, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(y); FIXP_ASSUME_ALIGNED64_(x);
+    FIXP_ASSUME_ALIGNED64_(h); FIXP_ASSUME_ALIGNED64_(ang);
+    FIXP_VEC_LOOP_
+    for (size_t idx = 0; idx < count; idx++) {
+        q0_15_hypot_atan2(y[idx], x[idx], &h[idx], &ang[idx]);
+    }
+}
+
+q0_15_t q0_15_tan(q0_15_t angle) {
+    q0_15_t s, c;
+    q0_15_sincos(angle, &s, &c);
+    
+    if (c == 0) return (s >= 0) ? Q0_15_MAX : Q0_15_MIN;
+    
+    // Wide quotient: s << n overflows the storage type once |sin| >= 0.5,
+    // and near ±π/2 the true tangent exceeds the format range anyway.
+    int32_t t = ((int32_t)s << 15) / c;
+    if (t > Q0_15_MAX) t = Q0_15_MAX;
+    if (t < Q0_15_MIN) t = Q0_15_MIN;
+    return (q0_15_t)t;
+}
+
+q0_15_t q0_15_atan2(q0_15_t y, q0_15_t x) {
+    // Half-plane bias indexed by the sign pair; replaces the nested
+    // quadrant branches. Vectoring runs on |x| (it only converges for
+    // x >= 0, and feeding a negative x also broke the y == 0, x < 0
+    // branch cut), then the left half-plane folds back through the
+    // table.
+    static const q0_15_t atan2_quadrant_bias[4] = {
+        0, Q0_15_PI, 0, (q0_15_t)-Q0_15_PI,
+    };
+
+    if (x == 0 && y == 0) return 0;
+
+    int idx = ((y < 0) << 1) | (x < 0);
+    q0_15_t ax = (x < 0) ? (q0_15_t)-x : x;
+    int32_t xf;
+    q0_15_t z = cordic_vector(ax, y, &xf);
+
+    return (q0_15_t)(atan2_quadrant_bias[idx] + ((x < 0) ? (q0_15_t)-z : z));
+}
+
+q0_15_t q0_15_atan(q0_15_t x) {{
+    // Direct vectoring pass; the atan2 quadrant fold can never trigger
+    // for a positive constant x input and is skipped entirely. ONE is
+    // not representable here, so vector on (ONE/2, x/2) -- same ratio,
+    // same angle.
+    int32_t xf;
+    return cordic_vector((q0_15_t)(1 << 14), (q0_15_t)(x >> 1), &xf);
+}}
+
+void q0_15_hypot_atan2(q0_15_t y, q0_15_t x,
+                      q0_15_t* h, q0_15_t* ang) {
+    if (x == 0 && y == 0) {
+        *h = 0;
+        *ang = 0;
+        return;
+    }
+
+    // One vectoring pass yields both outputs: z converges to the angle
+    // and the final x to gain * sqrt(x^2 + y^2), undone by the same K
+    // constant the rotation mode uses. Vectoring only converges for
+    // x >= 0, so run on |x| and fold the left half-plane back by pi.
+    q0_15_t ax = (x < 0) ? (q0_15_t)-x : x;
+    int32_t xf;
+    q0_15_t z = cordic_vector(ax, y, &xf);
+    if (x < 0) {
+        z = (y >= 0) ? (q0_15_t)(Q0_15_PI - z)
+                     : (q0_15_t)(-Q0_15_PI - z);
+    }
+
+    int32_t mag = (xf * CORDIC_K_15) >> 15;
+    if (mag > Q0_15_MAX) mag = Q0_15_MAX;
+
+    *h = (q0_15_t)mag;
+    *ang = z;
+}
+
+// 1/(4*K_h^2) in Q15+8, K_h over the full repetition schedule
+#define CORDIC_INV_4KH2_15 ((int32_t)3057751)
+// 8 fractional guard bits carried through normalization and
+// vectoring, with the iteration count extended to match, so the
+// residual stays below the format's LSB after the shift back.
+#define CORDIC_SQRT_GUARD_15 8
+#define CORDIC_SQRT_ITERS_15 23
+
+// CORDIC hyperbolic vectoring mode: drives y toward 0 and returns the
+// final x, which is sqrt(x0^2 - y0^2) scaled by K_h. Iterations start
+// at i=1; indices 4, 13, 40, ... repeat per the Walther convergence rule.
+static int32_t cordic_hyperbolic_vector(int32_t x, int32_t y) {
+    int repeat = 4;
+    for (int i = 1; i <= CORDIC_SQRT_ITERS_15; i++) {
+        int reps = 1;
+        if (i == repeat) {
+            reps = 2;
+            repeat = 3 * repeat + 1;
+        }
+        while (reps--) {
+            // Branchless conditional negate keyed on the sign of y
+            const int32_t sign = -(int32_t)(y < 0);
+            int32_t dx = ((y >> i) ^ sign) - sign;
+            int32_t dy = ((x >> i) ^ sign) - sign;
+            x -= dx;
+            y -= dy;
+        }
+    }
+    return x;
+}
+
+q0_15_t q0_15_sqrt(q0_15_t x) {
+    if (x <= 0) return 0;
+
+    // Normalize x = mant * 4^e with mant in [1/4, 1) so the vectoring
+    // angle stays inside the scheme's convergence bound (~1.11). The
+    // exponent comes straight from the highest set bit; mant lands in
+    // the guarded scale through a rounded shift, so the 2e low bits
+    // contribute instead of being discarded.
+    int e = (q0_15_hibit(x) - 15 + 2) >> 1;
+    int sh = 2 * e - CORDIC_SQRT_GUARD_15;
+    int32_t mant = (sh > 0)
+        ? ((int32_t)x + ((int32_t)1 << (sh - 1))) >> sh
+        : (int32_t)x << -sh;
+
+    // x0 = mant + 1/(4*Kh^2), y0 = mant - 1/(4*Kh^2) gives
+    // sqrt(x0^2 - y0^2) = sqrt(mant)/K_h, so the K_h vectoring gain
+    // cancels and x_n is sqrt(mant) directly -- no post-scaling.
+    int32_t xn = cordic_hyperbolic_vector(mant + CORDIC_INV_4KH2_15,
+                                              mant - CORDIC_INV_4KH2_15);
+
+    // Undo the normalization and drop the guard bits in one rounded
+    // shift: sqrt(mant * 4^e) = sqrt(mant) * 2^e, and e < guard always,
+    // so the count stays positive. Rounding up can graze one past the
+    // top of a zero-integer-bit range, hence the clamp.
+    int shr = CORDIC_SQRT_GUARD_15 - e;
+    int32_t res = (xn + ((int32_t)1 << (shr - 1))) >> shr;
+    if (res > Q0_15_MAX) res = Q0_15_MAX;
+    return (q0_15_t)res;
+}
+
+// 2^f on [0, 1): 5th-order minimax Horner (truncated Chebyshev fit)
+#define EXP2_POLY_C0_15 ((int32_t)32768)
+#define EXP2_POLY_C1_15 ((int32_t)22713)
+#define EXP2_POLY_C2_15 ((int32_t)7869)
+#define EXP2_POLY_C3_15 ((int32_t)1831)
+#define EXP2_POLY_C4_15 ((int32_t)293)
+#define EXP2_POLY_C5_15 ((int32_t)62)
+
+q0_15_t q0_15_exp2(q0_15_t x) {
+    // Arithmetic shift floors toward -inf, so frac_part is in [0, 1)
+    int int_part = x >> 15;
+    q0_15_t frac_part = x & (Q0_15_ONE - 1);
+
+    if (int_part >= 0) return Q0_15_MAX;
+    if (int_part < -15 - 1) return 0;
+
+    int32_t r = EXP2_POLY_C5_15;
+    r = ((r * frac_part + 16384) >> 15) + EXP2_POLY_C4_15;
+    r = ((r * frac_part + 16384) >> 15) + EXP2_POLY_C3_15;
+    r = ((r * frac_part + 16384) >> 15) + EXP2_POLY_C2_15;
+    r = ((r * frac_part + 16384) >> 15) + EXP2_POLY_C1_15;
+    r = ((r * frac_part + 16384) >> 15) + EXP2_POLY_C0_15;
+
+    // Scale by 2^int_part; negative exponents shift right instead of
+    // invoking the old left-shift-by-negative
+    int32_t res = (int_part >= 0) ? (r << int_part) : (r >> -int_part);
+    if (res > Q0_15_MAX) res = Q0_15_MAX;
+    return (q0_15_t)res;
+}
+
+// e^r on [0, ln2): 5th-order minimax Horner (truncated Chebyshev fit)
+#define EXP_POLY_C0_15 ((int32_t)32768)
+#define EXP_POLY_C1_15 ((int32_t)32768)
+#define EXP_POLY_C2_15 ((int32_t)16378)
+#define EXP_POLY_C3_15 ((int32_t)5497)
+#define EXP_POLY_C4_15 ((int32_t)1270)
+#define EXP_POLY_C5_15 ((int32_t)388)
+#define EXP_INV_LN2_15 ((int32_t)47274)  // 2^15 / ln2
+#define EXP_LN2_15     ((int32_t)22713)
+
+q0_15_t q0_15_exp(q0_15_t x) {
+    // Decompose x = k*ln2 + r with k = floor(x / ln2), r in [0, ln2),
+    // then e^x = e^r << k directly. The old path rescaled by log2(e)
+    // and had exp2 multiply the scale right back out -- two wide
+    // multiplies that cancel.
+    int k = (int)(((int32_t)x * EXP_INV_LN2_15) >> 30);
+
+    // The floored reciprocal can undershoot k by one; one correction
+    // step keeps r inside the kernel's fit range.
+    int32_t r = (int32_t)x - ((int32_t)k * EXP_LN2_15);
+    if (r >= EXP_LN2_15) {
+        r -= EXP_LN2_15;
+        k++;
+    }
+
+    if (k >= 0) return Q0_15_MAX;
+    if (k < -15 - 1) return 0;
+
+    int32_t er = EXP_POLY_C5_15;
+    er = ((er * r + 16384) >> 15) + EXP_POLY_C4_15;
+    er = ((er * r + 16384) >> 15) + EXP_POLY_C3_15;
+    er = ((er * r + 16384) >> 15) + EXP_POLY_C2_15;
+    er = ((er * r + 16384) >> 15) + EXP_POLY_C1_15;
+    er = ((er * r + 16384) >> 15) + EXP_POLY_C0_15;
+
+    int32_t res = (k >= 0) ? (er << k) : (er >> -k);
+    if (res > Q0_15_MAX) res = Q0_15_MAX;
+    return (q0_15_t)res;
+}
+
+// log2(1 + u) on [0, 1): order-4 minimax Horner (truncated Chebyshev fit)
+#define LOG2_POLY_C0_15 ((int32_t)3)
+#define LOG2_POLY_C1_15 ((int32_t)47098)
+#define LOG2_POLY_C2_15 ((int32_t)-22051)
+#define LOG2_POLY_C3_15 ((int32_t)10337)
+#define LOG2_POLY_C4_15 ((int32_t)-2622)
+
+q0_15_t q0_15_log2(q0_15_t x) {
+    if (x <= 0) return Q0_15_MIN;
+
+    // Position of the highest set bit: single bit-scan, no shift loop
+    int bit_pos = q0_15_hibit(x);
+
+    int int_part = bit_pos - 15;
+    
+    // Normalize to [1, 2)
+    q0_15_t normalized;
+    if (bit_pos >= 15) {
+        normalized = x >> (bit_pos - 15);
+    } else {
+        normalized = x << (15 - bit_pos);
+    }
+    
+    // log2(1 + u) on [0, 1): order-4 minimax Horner replaces the old
+    // linear approximation (worst case ~0.086 absolute)
+    q0_15_t u = normalized - Q0_15_ONE;
+    int32_t lf = LOG2_POLY_C4_15;
+    lf = ((lf * u + 16384) >> 15) + LOG2_POLY_C3_15;
+    lf = ((lf * u + 16384) >> 15) + LOG2_POLY_C2_15;
+    lf = ((lf * u + 16384) >> 15) + LOG2_POLY_C1_15;
+    lf = ((lf * u + 16384) >> 15) + LOG2_POLY_C0_15;
+
+    return (q0_15_t)(((int32_t)int_part << 15) + lf);
+}
+
+q0_15_t q0_15_log(q0_15_t x) {
+    q0_15_t log2_val = q0_15_log2(x);
+    q0_15_t ln2 = (q0_15_t)(0.693147 * (1LL << 15));
+    return (q0_15_t)(((int32_t)log2_val * ln2) >> 15);
+}
+
+q0_15_t q0_15_pow(q0_15_t base, q0_15_t exponent) {
+    if (base <= 0) return 0;
+    // x^y = 2^(y * log2(x)); wide multiply with saturation, as in exp
+    q0_15_t log_base = q0_15_log2(base);
+    int32_t scaled = ((int32_t)exponent * log_base) >> 15;
+    if (scaled > Q0_15_MAX) scaled = Q0_15_MAX;
+    if (scaled < Q0_15_MIN) scaled = Q0_15_MIN;
+    return q0_15_exp2((q0_15_t)scaled);
+}
@@ -0,0 +1,254 @@
+#ifndef FIXP_Q0_15_MATH_H
+#define FIXP_Q0_15_MATH_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include <stddef.h>
+
+#if defined(__AVX2__)
+#include <immintrin.h>
+#elif defined(__ARM_NEON)
+#include <arm_neon.h>
+#endif
+
+// Function attributes (GCC/Clang): const lets the compiler CSE repeated
+// calls with the same arguments, always_inline keeps the small helpers
+// inline even at -Os, and pure marks the out-of-line math functions,
+// which read only their arguments and immutable tables.
+#ifndef FIXP_ATTR_CONST
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ATTR_CONST __attribute__((const, always_inline))
+#define FIXP_ATTR_CONST_FN __attribute__((const))
+#define FIXP_ATTR_PURE __attribute__((pure))
+#else
+#define FIXP_ATTR_CONST
+#define FIXP_ATTR_CONST_FN
+#define FIXP_ATTR_PURE
+#endif
+#endif
+
+// Batch-pointer contract: restrict promises the source and destination
+// arrays of the *_v kernels never overlap, and the 64-byte alignment
+// assumption lets the vectorizer drop its runtime overlap checks and
+// unaligned-head peel loops. Callers must pass non-overlapping arrays
+// in 64-byte-aligned storage (alignas(64) / aligned_alloc).
+#ifndef FIXP_RESTRICT
+#ifdef __cplusplus
+#define FIXP_RESTRICT __restrict
+#else
+#define FIXP_RESTRICT restrict
+#endif
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ASSUME_ALIGNED64_(p) ((p) = (__typeof__(p))__builtin_assume_aligned((p), 64))
+#else
+#define FIXP_ASSUME_ALIGNED64_(p) ((void)0)
+#endif
+#endif
+
+// Vectorization hint ahead of the plain batch loops: `omp simd` under
+// OpenMP (also honoured by -fopenmp-simd), otherwise the compiler's
+// own no-loop-carried-dependence assertion.
+#ifndef FIXP_VEC_LOOP_
+#if defined(_OPENMP)
+#define FIXP_VEC_LOOP_ _Pragma("omp simd")
+#elif defined(__clang__)
+#define FIXP_VEC_LOOP_ _Pragma("clang loop vectorize(enable)")
+#elif defined(__GNUC__)
+#define FIXP_VEC_LOOP_ _Pragma("GCC ivdep")
+#else
+#define FIXP_VEC_LOOP_
+#endif
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+// Q0.15 format: 16-bit signed fixed-point
+// 0 integer bits, 15 fractional bits
+typedef int16_t q0_15_t;
+
+// Constants. ONE/MAX/MIN are shared with the arithmetic header for
+// formats that have one, so each is guarded to keep the headers
+// composable in either include order.
+#define Q0_15_PI       ((q0_15_t)(3.14159265358979323846 * (1LL << 15)))
+#define Q0_15_E        ((q0_15_t)(2.71828182845904523536 * (1LL << 15)))
+#ifndef Q0_15_ONE
+#define Q0_15_ONE      ((q0_15_t)(1LL << 15))
+#endif
+#define Q0_15_HALF     ((q0_15_t)(1LL << (15 - 1)))
+#ifndef Q0_15_MAX
+#define Q0_15_MAX      ((q0_15_t)((1LL << (16 - 1)) - 1))
+#endif
+#ifndef Q0_15_MIN
+#define Q0_15_MIN      ((q0_15_t)(-(1LL << (16 - 1))))
+#endif
+
+// Basic operations
+static inline FIXP_ATTR_CONST q0_15_t q0_15_abs(q0_15_t x) {
+    return (x < 0) ? -x : x;
+}
+
+static inline FIXP_ATTR_CONST q0_15_t q0_15_min(q0_15_t a, q0_15_t b) {
+    return (a < b) ? a : b;
+}
+
+static inline FIXP_ATTR_CONST q0_15_t q0_15_max(q0_15_t a, q0_15_t b) {
+    return (a > b) ? a : b;
+}
+
+static inline FIXP_ATTR_CONST q0_15_t q0_15_clamp(q0_15_t x, q0_15_t lo, q0_15_t hi) {
+    return q0_15_min(q0_15_max(x, lo), hi);
+}
+
+// Batch operations over arrays. SIMD-accelerated on AVX2/NEON, with a
+// scalar tail that also serves as the portable fallback.
+
+static inline void q0_15_abs_v(const q0_15_t* FIXP_RESTRICT src, q0_15_t* FIXP_RESTRICT dst, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + 16 <= count; i += 16) {
+        __m256i v = _mm256_loadu_si256((const __m256i*)(src + i));
+        _mm256_storeu_si256((__m256i*)(dst + i), _mm256_abs_epi16(v));
+    }
+#elif defined(__ARM_NEON)
+    for (; i + 8 <= count; i += 8) {
+        vst1q_s16(dst + i, vabsq_s16(vld1q_s16(src + i)));
+    }
+#endif
+    for (; i < count; i++) {
+        dst[i] = q0_15_abs(src[i]);
+    }
+}
+
+static inline void q0_15_min_v(const q0_15_t* FIXP_RESTRICT a, const q0_15_t* FIXP_RESTRICT b,
+                                 q0_15_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + 16 <= count; i += 16) {
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i));
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i));
+        _mm256_storeu_si256((__m256i*)(out + i), _mm256_min_epi16(va, vb));
+    }
+#elif defined(__ARM_NEON)
+    for (; i + 8 <= count; i += 8) {
+        vst1q_s16(out + i, vminq_s16(vld1q_s16(a + i), vld1q_s16(b + i)));
+    }
+#endif
+    for (; i < count; i++) {
+        out[i] = q0_15_min(a[i], b[i]);
+    }
+}
+
+static inline void q0_15_max_v(const q0_15_t* FIXP_RESTRICT a, const q0_15_t* FIXP_RESTRICT b,
+                                 q0_15_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + 16 <= count; i += 16) {
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i));
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i));
+        _mm256_storeu_si256((__m256i*)(out + i), _mm256_max_epi16(va, vb));
+    }
+#elif defined(__ARM_NEON)
+    for (; i + 8 <= count; i += 8) {
+        vst1q_s16(out + i, vmaxq_s16(vld1q_s16(a + i), vld1q_s16(b + i)));
+    }
+#endif
+    for (; i < count; i++) {
+        out[i] = q0_15_max(a[i], b[i]);
+    }
+}
+
+static inline void q0_15_clamp_v(const q0_15_t* FIXP_RESTRICT src, q0_15_t* FIXP_RESTRICT dst, size_t count,
+                                   q0_15_t lo, q0_15_t hi) {
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst);
+    size_t i = 0;
+#if defined(__AVX2__)
+    const __m256i vlo = _mm256_set1_epi16(lo);
+    const __m256i vhi = _mm256_set1_epi16(hi);
+    for (; i + 16 <= count; i += 16) {
+        __m256i v = _mm256_loadu_si256((const __m256i*)(src + i));
+        v = _mm256_min_epi16(_mm256_max_epi16(v, vlo), vhi);
+        _mm256_storeu_si256((__m256i*)(dst + i), v);
+    }
+#elif defined(__ARM_NEON)
+    const int16x8_t vlo = vdupq_n_s16(lo);
+    const int16x8_t vhi = vdupq_n_s16(hi);
+    for (; i + 8 <= count; i += 8) {
+        int16x8_t v = vld1q_s16(src + i);
+        vst1q_s16(dst + i, vminq_s16(vmaxq_s16(v, vlo), vhi));
+    }
+#endif
+    for (; i < count; i++) {
+        dst[i] = q0_15_clamp(src[i], lo, hi);
+    }
+}
+
+// Rounding functions
+static inline FIXP_ATTR_CONST q0_15_t q0_15_floor(q0_15_t x) {
+    const q0_15_t frac_mask = Q0_15_ONE - 1;
+    if (x >= 0) {
+        return x & ~frac_mask;
+    } else {
+        return (x & frac_mask) ? ((x & ~frac_mask) - Q0_15_ONE) : x;
+    }
+}
+
+static inline FIXP_ATTR_CONST q0_15_t q0_15_ceil(q0_15_t x) {
+    const q0_15_t frac_mask = Q0_15_ONE - 1;
+    if (x >= 0) {
+        return (x & frac_mask) ? ((x & ~frac_mask) + Q0_15_ONE) : x;
+    } else {
+        return x & ~frac_mask;
+    }
+}
+
+static inline FIXP_ATTR_CONST q0_15_t q0_15_round(q0_15_t x) {
+    if (x >= 0) {
+        return (x + Q0_15_HALF) & ~(Q0_15_ONE - 1);
+    } else {
+        return (x - Q0_15_HALF) & ~(Q0_15_ONE - 1);
+    }
+}
+
+static inline FIXP_ATTR_CONST q0_15_t q0_15_trunc(q0_15_t x) {
+    return x & ~(Q0_15_ONE - 1);
+}
+
+// Square root (Newton-Raphson)
+FIXP_ATTR_PURE q0_15_t q0_15_sqrt(q0_15_t x);
+
+// Trigonometric functions (CORDIC-based)
+FIXP_ATTR_PURE q0_15_t q0_15_sin(q0_15_t angle);
+FIXP_ATTR_PURE q0_15_t q0_15_cos(q0_15_t angle);
+// Fused: one range reduction and one CORDIC pass for both outputs.
+void q0_15_sincos(q0_15_t angle, q0_15_t* s, q0_15_t* c);
+FIXP_ATTR_PURE q0_15_t q0_15_tan(q0_15_t angle);
+FIXP_ATTR_PURE q0_15_t q0_15_atan(q0_15_t x);
+FIXP_ATTR_PURE q0_15_t q0_15_atan2(q0_15_t y, q0_15_t x);
+// Fused vectoring: magnitude and angle from a single CORDIC pass
+void q0_15_hypot_atan2(q0_15_t y, q0_15_t x, q0_15_t* h, q0_15_t* ang);
+
+// Batch trigonometry over angle arrays (SoA layout); AVX2-accelerated
+void q0_15_sin_v(const q0_15_t* FIXP_RESTRICT angles,
+                q0_15_t* FIXP_RESTRICT out, size_t count);
+void q0_15_cos_v(const q0_15_t* FIXP_RESTRICT angles,
+                q0_15_t* FIXP_RESTRICT out, size_t count);
+void q0_15_hypot_atan2_v(const q0_15_t* FIXP_RESTRICT y, const q0_15_t* FIXP_RESTRICT x,
+                        q0_15_t* FIXP_RESTRICT h, q0_15_t* FIXP_RESTRICT ang, size_t count);
+
+// Exponential and logarithmic
+FIXP_ATTR_PURE q0_15_t q0_15_exp(q0_15_t x);
+FIXP_ATTR_PURE q0_15_t q0_15_log(q0_15_t x);
+FIXP_ATTR_PURE q0_15_t q0_15_exp2(q0_15_t x);
+FIXP_ATTR_PURE q0_15_t q0_15_log2(q0_15_t x);
+FIXP_ATTR_PURE q0_15_t q0_15_pow(q0_15_t base, q0_15_t exponent);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // FIXP_Q0_15_MATH_H
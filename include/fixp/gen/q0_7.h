@@ -0,0 +1,59 @@
+/**
+ * @file q0_7.h
+ * @brief Q0.7 Fixed-Point Implementation (Generated)
+ *
+ * Format: 1 sign bit, 0 integer bits, 7 fractional bits.
+ * Underlying storage: int8_t (8-bit).
+ */
+
+#ifndef FIXP_GEN_Q0_7_H
+#define FIXP_GEN_Q0_7_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include "fixp_common.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef int8_t q0_7_t;
+
+#ifdef __cplusplus
+#define Q0_7_WRAP(raw) (q0_7_t{(raw)})
+#else
+#define Q0_7_WRAP(raw) ((q0_7_t)(raw))
+#endif
+
+#define Q0_7_RAW(x) (x)
+
+#define Q0_7_FRAC_BITS 7
+// Guarded: the math header for this format defines the same constants
+#ifndef Q0_7_ONE
+#define Q0_7_ONE Q0_7_WRAP(128)
+#endif
+#ifndef Q0_7_MAX
+#define Q0_7_MAX Q0_7_WRAP(INT8_MAX)
+#endif
+#ifndef Q0_7_MIN
+#define Q0_7_MIN Q0_7_WRAP(INT8_MIN)
+#endif
+
+// One expansion emits the scalar operation set for this format
+FIXP_DEFINE_Q(0, 7, int8_t, uint8_t, int16_t)
+
+// Division with a compile-time-constant denominator. When b folds to a
+// constant, the compiler strength-reduces the wide quotient inside
+// q0_7_div to an exact, branch-free multiply-high ("magic
+// number") sequence -- no hardware divide, and bit-identical to
+// q0_7_div for every input. A rounded-reciprocal multiply
+// would save one shift but costs up to |a| / 2^8 raw units of
+// error, half the format's precision. The denominator is the format's
+// raw representation, so e.g. dividing by 2.0 means b = 2 * Q0_7_ONE.
+#define q0_7_div_const(a, b) q0_7_div((a), (b))
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // FIXP_GEN_Q0_7_H
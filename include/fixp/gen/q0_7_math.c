@@ -0,0 +1,346 @@
+#include "q0_7_math.h"
+#include "cordic_atan_table_N7.h"
+#include "fixp_cordic_impl.h"
+#include <stdint.h>
+
+// CORDIC constants
+#define CORDIC_K_7 ((q0_7_t)77)
+#define CORDIC_ITERATIONS 7
+
+// Shared across all Qm.7 formats; values fit in q0_7_t.
+#define cordic_atan_table(i) ((q0_7_t)cordic_atan_table_N7[i])
+
+// Vectoring-mode kernels only; rotation trig is served by the sine LUT
+FIXP_CORDIC_HIBIT_DEFINE(0, 7, int8_t)
+FIXP_CORDIC_VECTOR_DEFINE(0, 7, int8_t, int16_t)
+
+// Quarter-wave sine table, Q7: sin on [0, π/2] at 257 points.
+// 514 bytes -- cacheline-aligned so it spans the minimum nine lines.
+static const int16_t sin_quad_7[257] FIXP_ATTR_ALIGN64 = {
+    0, 1, 2, 2, 3, 4, 5, 5, 6, 7,
+    8, 9, 9, 10, 11, 12, 13, 13, 14, 15,
+    16, 16, 17, 18, 19, 20, 20, 21, 22, 23,
+    23, 24, 25, 26, 27, 27, 28, 29, 30, 30,
+    31, 32, 33, 33, 34, 35, 36, 36, 37, 38,
+    39, 39, 40, 41, 42, 42, 43, 44, 45, 45,
+    46, 47, 48, 48, 49, 50, 50, 51, 52, 53,
+    53, 54, 55, 55, 56, 57, 58, 58, 59, 60,
+    60, 61, 62, 62, 63, 64, 64, 65, 66, 66,
+    67, 68, 68, 69, 70, 70, 71, 72, 72, 73,
+    74, 74, 75, 76, 76, 77, 78, 78, 79, 79,
+    80, 81, 81, 82, 82, 83, 84, 84, 85, 85,
+    86, 87, 87, 88, 88, 89, 89, 90, 91, 91,
+    92, 92, 93, 93, 94, 94, 95, 95, 96, 96,
+    97, 97, 98, 98, 99, 99, 100, 100, 101, 101,
+    102, 102, 103, 103, 104, 104, 105, 105, 106, 106,
+    106, 107, 107, 108, 108, 109, 109, 109, 110, 110,
+    111, 111, 111, 112, 112, 113, 113, 113, 114, 114,
+    114, 115, 115, 115, 116, 116, 116, 117, 117, 117,
+    118, 118, 118, 119, 119, 119, 119, 120, 120, 120,
+    121, 121, 121, 121, 122, 122, 122, 122, 122, 123,
+    123, 123, 123, 124, 124, 124, 124, 124, 125, 125,
+    125, 125, 125, 125, 126, 126, 126, 126, 126, 126,
+    126, 126, 127, 127, 127, 127, 127, 127, 127, 127,
+    127, 127, 127, 127, 127, 127, 127, 127, 127, 127,
+    127, 127, 127, 127, 127, 127, 127,
+};
+
+// Maps r in (-1, 1) (Q7) to an 8.8 table coordinate in one multiply
+#define SIN_LUT_INV_HALFPI_7 21361414u
+
+// sin(r) by linear interpolation between adjacent table entries
+static q0_7_t sin_lut(int32_t r) {
+    uint32_t t = ((uint32_t)r * SIN_LUT_INV_HALFPI_7) >> 16;
+    uint32_t i = t >> 8;
+    int32_t frac = (int32_t)(t & 0xFF);
+    int32_t s0 = sin_quad_7[i];
+    int32_t s1 = sin_quad_7[i + 1];
+    return (q0_7_t)(s0 + (((s1 - s0) * frac) >> 8));
+}
+
+// cos(r) = sin(π/2 - r): walk the same table from the far end
+static q0_7_t cos_lut(int32_t r) {
+    uint32_t t = ((uint32_t)r * SIN_LUT_INV_HALFPI_7) >> 16;
+    uint32_t i = t >> 8;
+    int32_t frac = (int32_t)(t & 0xFF);
+    int32_t c0 = sin_quad_7[256 - i];
+    int32_t c1 = sin_quad_7[255 - i];
+    return (q0_7_t)(c0 + (((c1 - c0) * frac) >> 8));
+}
+
+q0_7_t q0_7_sin(q0_7_t angle) {
+    // |angle| < 1 < π/2: no reduction needed. The sign fold runs in
+    // int32 so negating the most negative storage value stays defined.
+    int32_t r = angle;
+    return r < 0 ? (q0_7_t)-sin_lut(-r) : sin_lut(r);
+}
+
+q0_7_t q0_7_cos(q0_7_t angle) {
+    int32_t r = angle;
+    return cos_lut(r < 0 ? -r : r);
+}
+
+void q0_7_sincos(q0_7_t angle, q0_7_t* s, q0_7_t* c) {
+    // No shared reduction to fuse here; two independent lookups.
+    int32_t r = angle;
+    if (r < 0) {
+        *s = (q0_7_t)-sin_lut(-r);
+        *c = cos_lut(-r);
+    } else {
+        *s = sin_lut(r);
+        *c = cos_lut(r);
+    }
+}
+
+
+q0_7_t q0_7_tan(q0_7_t angle) {
+    q0_7_t s, c;
+    q0_7_sincos(angle, &s, &c);
+    
+    if (c == 0) return (s >= 0) ? Q0_7_MAX : Q0_7_MIN;
+    
+    // Wide quotient: s << n overflows the storage type once |sin| >= 0.5,
+    // and near ±π/2 the true tangent exceeds the format range anyway.
+    int16_t t = ((int16_t)s << 7) / c;
+    if (t > Q0_7_MAX) t = Q0_7_MAX;
+    if (t < Q0_7_MIN) t = Q0_7_MIN;
+    return (q0_7_t)t;
+}
+
+q0_7_t q0_7_atan2(q0_7_t y, q0_7_t x) {
+    // Half-plane bias indexed by the sign pair; replaces the nested
+    // quadrant branches. Vectoring runs on |x| (it only converges for
+    // x >= 0, and feeding a negative x also broke the y == 0, x < 0
+    // branch cut), then the left half-plane folds back through the
+    // table.
+    static const q0_7_t atan2_quadrant_bias[4] = {
+        0, Q0_7_PI, 0, (q0_7_t)-Q0_7_PI,
+    };
+
+    if (x == 0 && y == 0) return 0;
+
+    int idx = ((y < 0) << 1) | (x < 0);
+    q0_7_t ax = (x < 0) ? (q0_7_t)-x : x;
+    int16_t xf;
+    q0_7_t z = cordic_vector(ax, y, &xf);
+
+    return (q0_7_t)(atan2_quadrant_bias[idx] + ((x < 0) ? (q0_7_t)-z : z));
+}
+
+q0_7_t q0_7_atan(q0_7_t x) {{
+    // Direct vectoring pass; the atan2 quadrant fold can never trigger
+    // for a positive constant x input and is skipped entirely. ONE is
+    // not representable here, so vector on (ONE/2, x/2) -- same ratio,
+    // same angle.
+    int16_t xf;
+    return cordic_vector((q0_7_t)(1 << 6), (q0_7_t)(x >> 1), &xf);
+}}
+
+void q0_7_hypot_atan2(q0_7_t y, q0_7_t x,
+                      q0_7_t* h, q0_7_t* ang) {
+    if (x == 0 && y == 0) {
+        *h = 0;
+        *ang = 0;
+        return;
+    }
+
+    // One vectoring pass yields both outputs: z converges to the angle
+    // and the final x to gain * sqrt(x^2 + y^2), undone by the same K
+    // constant the rotation mode uses. Vectoring only converges for
+    // x >= 0, so run on |x| and fold the left half-plane back by pi.
+    q0_7_t ax = (x < 0) ? (q0_7_t)-x : x;
+    int16_t xf;
+    q0_7_t z = cordic_vector(ax, y, &xf);
+    if (x < 0) {
+        z = (y >= 0) ? (q0_7_t)(Q0_7_PI - z)
+                     : (q0_7_t)(-Q0_7_PI - z);
+    }
+
+    int16_t mag = (xf * CORDIC_K_7) >> 7;
+    if (mag > Q0_7_MAX) mag = Q0_7_MAX;
+
+    *h = (q0_7_t)mag;
+    *ang = z;
+}
+
+// 1/(4*K_h^2) in Q7+5, K_h over the full repetition schedule
+#define CORDIC_INV_4KH2_7 ((int16_t)1493)
+// 5 fractional guard bits carried through normalization and
+// vectoring, with the iteration count extended to match, so the
+// residual stays below the format's LSB after the shift back.
+#define CORDIC_SQRT_GUARD_7 5
+#define CORDIC_SQRT_ITERS_7 12
+
+// CORDIC hyperbolic vectoring mode: drives y toward 0 and returns the
+// final x, which is sqrt(x0^2 - y0^2) scaled by K_h. Iterations start
+// at i=1; indices 4, 13, 40, ... repeat per the Walther convergence rule.
+static int16_t cordic_hyperbolic_vector(int16_t x, int16_t y) {
+    int repeat = 4;
+    for (int i = 1; i <= CORDIC_SQRT_ITERS_7; i++) {
+        int reps = 1;
+        if (i == repeat) {
+            reps = 2;
+            repeat = 3 * repeat + 1;
+        }
+        while (reps--) {
+            // Branchless conditional negate keyed on the sign of y
+            const int16_t sign = -(int16_t)(y < 0);
+            int16_t dx = ((y >> i) ^ sign) - sign;
+            int16_t dy = ((x >> i) ^ sign) - sign;
+            x -= dx;
+            y -= dy;
+        }
+    }
+    return x;
+}
+
+q0_7_t q0_7_sqrt(q0_7_t x) {
+    if (x <= 0) return 0;
+
+    // Normalize x = mant * 4^e with mant in [1/4, 1) so the vectoring
+    // angle stays inside the scheme's convergence bound (~1.11). The
+    // exponent comes straight from the highest set bit; mant lands in
+    // the guarded scale through a rounded shift, so the 2e low bits
+    // contribute instead of being discarded.
+    int e = (q0_7_hibit(x) - 7 + 2) >> 1;
+    int sh = 2 * e - CORDIC_SQRT_GUARD_7;
+    int16_t mant = (sh > 0)
+        ? ((int16_t)x + ((int16_t)1 << (sh - 1))) >> sh
+        : (int16_t)x << -sh;
+
+    // x0 = mant + 1/(4*Kh^2), y0 = mant - 1/(4*Kh^2) gives
+    // sqrt(x0^2 - y0^2) = sqrt(mant)/K_h, so the K_h vectoring gain
+    // cancels and x_n is sqrt(mant) directly -- no post-scaling.
+    int16_t xn = cordic_hyperbolic_vector(mant + CORDIC_INV_4KH2_7,
+                                              mant - CORDIC_INV_4KH2_7);
+
+    // Undo the normalization and drop the guard bits in one rounded
+    // shift: sqrt(mant * 4^e) = sqrt(mant) * 2^e, and e < guard always,
+    // so the count stays positive. Rounding up can graze one past the
+    // top of a zero-integer-bit range, hence the clamp.
+    int shr = CORDIC_SQRT_GUARD_7 - e;
+    int16_t res = (xn + ((int16_t)1 << (shr - 1))) >> shr;
+    if (res > Q0_7_MAX) res = Q0_7_MAX;
+    return (q0_7_t)res;
+}
+
+// 2^f on [0, 1): 5th-order minimax Horner (truncated Chebyshev fit)
+#define EXP2_POLY_C0_7 ((int16_t)128)
+#define EXP2_POLY_C1_7 ((int16_t)89)
+#define EXP2_POLY_C2_7 ((int16_t)31)
+#define EXP2_POLY_C3_7 ((int16_t)7)
+#define EXP2_POLY_C4_7 ((int16_t)1)
+#define EXP2_POLY_C5_7 ((int16_t)0)
+
+q0_7_t q0_7_exp2(q0_7_t x) {
+    // Arithmetic shift floors toward -inf, so frac_part is in [0, 1)
+    int int_part = x >> 7;
+    q0_7_t frac_part = x & (Q0_7_ONE - 1);
+
+    if (int_part >= 0) return Q0_7_MAX;
+    if (int_part < -7 - 1) return 0;
+
+    int16_t r = EXP2_POLY_C5_7;
+    r = ((r * frac_part + 64) >> 7) + EXP2_POLY_C4_7;
+    r = ((r * frac_part + 64) >> 7) + EXP2_POLY_C3_7;
+    r = ((r * frac_part + 64) >> 7) + EXP2_POLY_C2_7;
+    r = ((r * frac_part + 64) >> 7) + EXP2_POLY_C1_7;
+    r = ((r * frac_part + 64) >> 7) + EXP2_POLY_C0_7;
+
+    // Scale by 2^int_part; negative exponents shift right instead of
+    // invoking the old left-shift-by-negative
+    int16_t res = (int_part >= 0) ? (r << int_part) : (r >> -int_part);
+    if (res > Q0_7_MAX) res = Q0_7_MAX;
+    return (q0_7_t)res;
+}
+
+// e^r on [0, ln2): 5th-order minimax Horner (truncated Chebyshev fit)
+#define EXP_POLY_C0_7 ((int16_t)128)
+#define EXP_POLY_C1_7 ((int16_t)128)
+#define EXP_POLY_C2_7 ((int16_t)64)
+#define EXP_POLY_C3_7 ((int16_t)21)
+#define EXP_POLY_C4_7 ((int16_t)5)
+#define EXP_POLY_C5_7 ((int16_t)2)
+#define EXP_INV_LN2_7 ((int16_t)184)  // 2^7 / ln2
+#define EXP_LN2_7     ((int16_t)89)
+
+q0_7_t q0_7_exp(q0_7_t x) {
+    // Decompose x = k*ln2 + r with k = floor(x / ln2), r in [0, ln2),
+    // then e^x = e^r << k directly. The old path rescaled by log2(e)
+    // and had exp2 multiply the scale right back out -- two wide
+    // multiplies that cancel.
+    int k = (int)(((int16_t)x * EXP_INV_LN2_7) >> 14);
+
+    // The floored reciprocal can undershoot k by one; one correction
+    // step keeps r inside the kernel's fit range.
+    int16_t r = (int16_t)x - ((int16_t)k * EXP_LN2_7);
+    if (r >= EXP_LN2_7) {
+        r -= EXP_LN2_7;
+        k++;
+    }
+
+    if (k >= 0) return Q0_7_MAX;
+    if (k < -7 - 1) return 0;
+
+    int16_t er = EXP_POLY_C5_7;
+    er = ((er * r + 64) >> 7) + EXP_POLY_C4_7;
+    er = ((er * r + 64) >> 7) + EXP_POLY_C3_7;
+    er = ((er * r + 64) >> 7) + EXP_POLY_C2_7;
+    er = ((er * r + 64) >> 7) + EXP_POLY_C1_7;
+    er = ((er * r + 64) >> 7) + EXP_POLY_C0_7;
+
+    int16_t res = (k >= 0) ? (er << k) : (er >> -k);
+    if (res > Q0_7_MAX) res = Q0_7_MAX;
+    return (q0_7_t)res;
+}
+
+// log2(1 + u) on [0, 1): order-4 minimax Horner (truncated Chebyshev fit)
+#define LOG2_POLY_C0_7 ((int16_t)0)
+#define LOG2_POLY_C1_7 ((int16_t)184)
+#define LOG2_POLY_C2_7 ((int16_t)-86)
+#define LOG2_POLY_C3_7 ((int16_t)40)
+#define LOG2_POLY_C4_7 ((int16_t)-10)
+
+q0_7_t q0_7_log2(q0_7_t x) {
+    if (x <= 0) return Q0_7_MIN;
+
+    // Position of the highest set bit: single bit-scan, no shift loop
+    int bit_pos = q0_7_hibit(x);
+
+    int int_part = bit_pos - 7;
+    
+    // Normalize to [1, 2)
+    q0_7_t normalized;
+    if (bit_pos >= 7) {
+        normalized = x >> (bit_pos - 7);
+    } else {
+        normalized = x << (7 - bit_pos);
+    }
+    
+    // log2(1 + u) on [0, 1): order-4 minimax Horner replaces the old
+    // linear approximation (worst case ~0.086 absolute)
+    q0_7_t u = normalized - Q0_7_ONE;
+    int16_t lf = LOG2_POLY_C4_7;
+    lf = ((lf * u + 64) >> 7) + LOG2_POLY_C3_7;
+    lf = ((lf * u + 64) >> 7) + LOG2_POLY_C2_7;
+    lf = ((lf * u + 64) >> 7) + LOG2_POLY_C1_7;
+    lf = ((lf * u + 64) >> 7) + LOG2_POLY_C0_7;
+
+    return (q0_7_t)(((int16_t)int_part << 7) + lf);
+}
+
+q0_7_t q0_7_log(q0_7_t x) {
+    q0_7_t log2_val = q0_7_log2(x);
+    q0_7_t ln2 = (q0_7_t)(0.693147 * (1LL << 7));
+    return (q0_7_t)(((int16_t)log2_val * ln2) >> 7);
+}
+
+q0_7_t q0_7_pow(q0_7_t base, q0_7_t exponent) {
+    if (base <= 0) return 0;
+    // x^y = 2^(y * log2(x)); wide multiply with saturation, as in exp
+    q0_7_t log_base = q0_7_log2(base);
+    int16_t scaled = ((int16_t)exponent * log_base) >> 7;
+    if (scaled > Q0_7_MAX) scaled = Q0_7_MAX;
+    if (scaled < Q0_7_MIN) scaled = Q0_7_MIN;
+    return q0_7_exp2((q0_7_t)scaled);
+}
@@ -0,0 +1,153 @@
+#ifndef FIXP_Q0_7_MATH_H
+#define FIXP_Q0_7_MATH_H
+
+#include <stdint.h>
+#include <stdbool.h>
+
+// Function attributes (GCC/Clang): const lets the compiler CSE repeated
+// calls with the same arguments, always_inline keeps the small helpers
+// inline even at -Os, and pure marks the out-of-line math functions,
+// which read only their arguments and immutable tables.
+#ifndef FIXP_ATTR_CONST
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ATTR_CONST __attribute__((const, always_inline))
+#define FIXP_ATTR_CONST_FN __attribute__((const))
+#define FIXP_ATTR_PURE __attribute__((pure))
+#else
+#define FIXP_ATTR_CONST
+#define FIXP_ATTR_CONST_FN
+#define FIXP_ATTR_PURE
+#endif
+#endif
+
+// Batch-pointer contract: restrict promises the source and destination
+// arrays of the *_v kernels never overlap, and the 64-byte alignment
+// assumption lets the vectorizer drop its runtime overlap checks and
+// unaligned-head peel loops. Callers must pass non-overlapping arrays
+// in 64-byte-aligned storage (alignas(64) / aligned_alloc).
+#ifndef FIXP_RESTRICT
+#ifdef __cplusplus
+#define FIXP_RESTRICT __restrict
+#else
+#define FIXP_RESTRICT restrict
+#endif
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ASSUME_ALIGNED64_(p) ((p) = (__typeof__(p))__builtin_assume_aligned((p), 64))
+#else
+#define FIXP_ASSUME_ALIGNED64_(p) ((void)0)
+#endif
+#endif
+
+// Vectorization hint ahead of the plain batch loops: `omp simd` under
+// OpenMP (also honoured by -fopenmp-simd), otherwise the compiler's
+// own no-loop-carried-dependence assertion.
+#ifndef FIXP_VEC_LOOP_
+#if defined(_OPENMP)
+#define FIXP_VEC_LOOP_ _Pragma("omp simd")
+#elif defined(__clang__)
+#define FIXP_VEC_LOOP_ _Pragma("clang loop vectorize(enable)")
+#elif defined(__GNUC__)
+#define FIXP_VEC_LOOP_ _Pragma("GCC ivdep")
+#else
+#define FIXP_VEC_LOOP_
+#endif
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+// Q0.7 format: 8-bit signed fixed-point
+// 0 integer bits, 7 fractional bits
+typedef int8_t q0_7_t;
+
+// Constants. ONE/MAX/MIN are shared with the arithmetic header for
+// formats that have one, so each is guarded to keep the headers
+// composable in either include order.
+#define Q0_7_PI       ((q0_7_t)(3.14159265358979323846 * (1LL << 7)))
+#define Q0_7_E        ((q0_7_t)(2.71828182845904523536 * (1LL << 7)))
+#ifndef Q0_7_ONE
+#define Q0_7_ONE      ((q0_7_t)(1LL << 7))
+#endif
+#define Q0_7_HALF     ((q0_7_t)(1LL << (7 - 1)))
+#ifndef Q0_7_MAX
+#define Q0_7_MAX      ((q0_7_t)((1LL << (8 - 1)) - 1))
+#endif
+#ifndef Q0_7_MIN
+#define Q0_7_MIN      ((q0_7_t)(-(1LL << (8 - 1))))
+#endif
+
+// Basic operations
+static inline FIXP_ATTR_CONST q0_7_t q0_7_abs(q0_7_t x) {
+    return (x < 0) ? -x : x;
+}
+
+static inline FIXP_ATTR_CONST q0_7_t q0_7_min(q0_7_t a, q0_7_t b) {
+    return (a < b) ? a : b;
+}
+
+static inline FIXP_ATTR_CONST q0_7_t q0_7_max(q0_7_t a, q0_7_t b) {
+    return (a > b) ? a : b;
+}
+
+static inline FIXP_ATTR_CONST q0_7_t q0_7_clamp(q0_7_t x, q0_7_t lo, q0_7_t hi) {
+    return q0_7_min(q0_7_max(x, lo), hi);
+}
+
+// Rounding functions
+static inline FIXP_ATTR_CONST q0_7_t q0_7_floor(q0_7_t x) {
+    const q0_7_t frac_mask = Q0_7_ONE - 1;
+    if (x >= 0) {
+        return x & ~frac_mask;
+    } else {
+        return (x & frac_mask) ? ((x & ~frac_mask) - Q0_7_ONE) : x;
+    }
+}
+
+static inline FIXP_ATTR_CONST q0_7_t q0_7_ceil(q0_7_t x) {
+    const q0_7_t frac_mask = Q0_7_ONE - 1;
+    if (x >= 0) {
+        return (x & frac_mask) ? ((x & ~frac_mask) + Q0_7_ONE) : x;
+    } else {
+        return x & ~frac_mask;
+    }
+}
+
+static inline FIXP_ATTR_CONST q0_7_t q0_7_round(q0_7_t x) {
+    if (x >= 0) {
+        return (x + Q0_7_HALF) & ~(Q0_7_ONE - 1);
+    } else {
+        return (x - Q0_7_HALF) & ~(Q0_7_ONE - 1);
+    }
+}
+
+static inline FIXP_ATTR_CONST q0_7_t q0_7_trunc(q0_7_t x) {
+    return x & ~(Q0_7_ONE - 1);
+}
+
+// Square root (Newton-Raphson)
+FIXP_ATTR_PURE q0_7_t q0_7_sqrt(q0_7_t x);
+
+// Trigonometric functions (CORDIC-based)
+FIXP_ATTR_PURE q0_7_t q0_7_sin(q0_7_t angle);
+FIXP_ATTR_PURE q0_7_t q0_7_cos(q0_7_t angle);
+// Fused: one range reduction and one CORDIC pass for both outputs.
+void q0_7_sincos(q0_7_t angle, q0_7_t* s, q0_7_t* c);
+FIXP_ATTR_PURE q0_7_t q0_7_tan(q0_7_t angle);
+FIXP_ATTR_PURE q0_7_t q0_7_atan(q0_7_t x);
+FIXP_ATTR_PURE q0_7_t q0_7_atan2(q0_7_t y, q0_7_t x);
+// Fused vectoring: magnitude and angle from a single CORDIC pass
+void q0_7_hypot_atan2(q0_7_t y, q0_7_t x, q0_7_t* h, q0_7_t* ang);
+
+// Exponential and logarithmic
+FIXP_ATTR_PURE q0_7_t q0_7_exp(q0_7_t x);
+FIXP_ATTR_PURE q0_7_t q0_7_log(q0_7_t x);
+FIXP_ATTR_PURE q0_7_t q0_7_exp2(q0_7_t x);
+FIXP_ATTR_PURE q0_7_t q0_7_log2(q0_7_t x);
+FIXP_ATTR_PURE q0_7_t q0_7_pow(q0_7_t base, q0_7_t exponent);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // FIXP_Q0_7_MATH_H
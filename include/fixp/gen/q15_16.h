@@ -0,0 +1,62 @@
+/**
+ * @file q15_16.h
+ * @brief Q15.16 Fixed-Point Implementation (Generated)
+ *
+ * Format: 1 sign bit, 15 integer bits, 16 fractional bits.
+ * Underlying storage: int32_t (32-bit).
+ */
+
+#ifndef FIXP_GEN_Q15_16_H
+#define FIXP_GEN_Q15_16_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include "fixp_common.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef int32_t q15_16_t;
+
+#ifdef __cplusplus
+#define Q15_16_WRAP(raw) (q15_16_t{(raw)})
+#else
+#define Q15_16_WRAP(raw) ((q15_16_t)(raw))
+#endif
+
+#define Q15_16_RAW(x) (x)
+
+#define Q15_16_FRAC_BITS 16
+// Guarded: the math header for this format defines the same constants
+#ifndef Q15_16_ONE
+#define Q15_16_ONE Q15_16_WRAP(65536)
+#endif
+#ifndef Q15_16_MAX
+#define Q15_16_MAX Q15_16_WRAP(INT32_MAX)
+#endif
+#ifndef Q15_16_MIN
+#define Q15_16_MIN Q15_16_WRAP(INT32_MIN)
+#endif
+
+// One expansion emits the scalar operation set for this format
+FIXP_DEFINE_Q(15, 16, int32_t, uint32_t, int64_t)
+
+// Division with a compile-time-constant denominator. When b folds to a
+// constant, the compiler strength-reduces the wide quotient inside
+// q15_16_div to an exact, branch-free multiply-high ("magic
+// number") sequence -- no hardware divide, and bit-identical to
+// q15_16_div for every input. A rounded-reciprocal multiply
+// would save one shift but costs up to |a| / 2^17 raw units of
+// error, half the format's precision. The denominator is the format's
+// raw representation, so e.g. dividing by 2.0 means b = 2 * Q15_16_ONE.
+#define q15_16_div_const(a, b) q15_16_div((a), (b))
+
+// Batch operations over arrays (SIMD on AVX2/NEON, scalar fallback)
+FIXP_DEFINE_Q_BATCH_W32(15, 16)
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // FIXP_GEN_Q15_16_H
@@ -0,0 +1,522 @@
+#include "q15_16_math.h"
+#include "cordic_atan_table_N16.h"
+#include "fixp_cordic_impl.h"
+#include <stdint.h>
+
+// CORDIC constants
+#define CORDIC_K_16 ((q15_16_t)39796)
+#define CORDIC_ITERATIONS 16
+
+// Shared across all Qm.16 formats; values fit in q15_16_t.
+#define cordic_atan_table(i) ((q15_16_t)cordic_atan_table_N16[i])
+
+// First rotation index whose gain factor is 1 at this precision
+#define CORDIC_SCALE_FREE_16 9
+
+FIXP_CORDIC_DEFINE(15, 16, int32_t, int64_t)
+
+// Range-reduction constants, carried with 17 guard bits (Q16+17)
+#define CORDIC_TWO_PI_G_16    ((int64_t)53972150818)
+#define CORDIC_HALF_PI_G_16   ((int64_t)13493037705)
+#define CORDIC_INV_2PI_16     ((int64_t)10430)      // 2^16 / 2π
+#define CORDIC_INV_HALF_PI_16 ((int64_t)41722)  // 2^16 / (π/2)
+
+// Constant-time reduction: writes r in [0, π/2) and returns the 2-bit
+// quadrant index, so angle ≈ quadrant * π/2 + r (mod 2π). The multiply
+// by the 2π reciprocal replaces the O(angle/π) subtract loop; the
+// reciprocal's rounding makes the quotient off by at most 1, fixed by
+// a single correction step. The remainder itself is computed in
+// Q16+17 so the rounding of 2π does not accumulate across wraps.
+static int cordic_reduce_angle(q15_16_t angle, q15_16_t* r_out) {
+    int64_t k = ((int64_t)angle * CORDIC_INV_2PI_16) >> 32;
+    int64_t a = ((int64_t)angle << 17) - k * CORDIC_TWO_PI_G_16;
+    if (a < 0) a += CORDIC_TWO_PI_G_16;
+    else if (a >= CORDIC_TWO_PI_G_16) a -= CORDIC_TWO_PI_G_16;
+
+    int quadrant = (int)((a * CORDIC_INV_HALF_PI_16) >> 49);
+    int64_t r = a - (int64_t)quadrant * CORDIC_HALF_PI_G_16;
+    if (r < 0) {
+        r += CORDIC_HALF_PI_G_16;
+        quadrant--;
+    } else if (r >= CORDIC_HALF_PI_G_16) {
+        r -= CORDIC_HALF_PI_G_16;
+        quadrant++;
+    }
+
+    *r_out = (q15_16_t)(r >> 17);
+    return quadrant & 3;
+}
+
+void q15_16_sincos(q15_16_t angle, q15_16_t* s, q15_16_t* c) {
+    // One reduction and one rotation serve both outputs; the quadrant
+    // only decides the sign and sin/cos swap.
+    q15_16_t r, x, y;
+    int quadrant = cordic_reduce_angle(angle, &r);
+
+    cordic_rotate(&x, &y, r);
+
+    switch (quadrant) {
+        case 0:  *s = y;                   *c = x;                   break;
+        case 1:  *s = x;                   *c = (q15_16_t)-y;     break;
+        case 2:  *s = (q15_16_t)-y;     *c = (q15_16_t)-x;     break;
+        default: *s = (q15_16_t)-x;     *c = y;                   break;
+    }
+}
+
+q15_16_t q15_16_sin(q15_16_t angle) {
+    q15_16_t s, c;
+    q15_16_sincos(angle, &s, &c);
+    return s;
+}
+
+q15_16_t q15_16_cos(q15_16_t angle) {
+    q15_16_t s, c;
+    q15_16_sincos(angle, &s, &c);
+    return c;
+}
+
+#if defined(__AVX2__)
+// 8-lane SoA CORDIC rotation in 32-bit lanes. All lanes share the
+// iteration index and table entry; the sign dispatch is a vector
+// conditional negate on sign(z) via _mm256_sign_epi32. Lanes keep the
+// fixed iteration schedule -- the scalar path's closest-angle recoding
+// is data-dependent per lane -- so vector results may differ from the
+// scalar functions by an LSB.
+static void cordic_rotate_v8(__m256i* x_out, __m256i* y_out, __m256i z) {
+    __m256i x = _mm256_set1_epi32((int32_t)CORDIC_K_16);
+    __m256i y = _mm256_setzero_si256();
+    const __m256i one = _mm256_set1_epi32(1);
+
+    for (int i = 0; i < CORDIC_ITERATIONS; i++) {
+        __m128i cnt = _mm_cvtsi32_si128(i);
+        __m256i at = _mm256_set1_epi32((int32_t)cordic_atan_table(i));
+        // dir = +1 where z >= 0, -1 where z < 0
+        __m256i dir = _mm256_or_si256(_mm256_srai_epi32(z, 31), one);
+        __m256i ys = _mm256_sra_epi32(y, cnt);
+        __m256i xs = _mm256_sra_epi32(x, cnt);
+        x = _mm256_sub_epi32(x, _mm256_sign_epi32(ys, dir));
+        y = _mm256_add_epi32(y, _mm256_sign_epi32(xs, dir));
+        z = _mm256_sub_epi32(z, _mm256_sign_epi32(at, dir));
+    }
+
+    *x_out = x;
+    *y_out = y;
+}
+#endif // __AVX2__
+
+void q15_16_sin_v(const q15_16_t* FIXP_RESTRICT angles,
+                q15_16_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(angles); FIXP_ASSUME_ALIGNED64_(out);
+    size_t idx = 0;
+#if defined(__AVX2__)
+    for (; idx + 8 <= count; idx += 8) {
+        int32_t r[8];
+        int quadrant[8];
+        for (size_t l = 0; l < 8; l++) {
+            q15_16_t rl;
+            quadrant[l] = cordic_reduce_angle(angles[idx + l], &rl);
+            r[l] = rl;
+        }
+
+        __m256i x, y;
+        cordic_rotate_v8(&x, &y, _mm256_loadu_si256((const __m256i*)r));
+
+        int32_t xs[8], ys[8];
+        _mm256_storeu_si256((__m256i*)xs, x);
+        _mm256_storeu_si256((__m256i*)ys, y);
+
+        for (size_t l = 0; l < 8; l++) {
+            int32_t v;
+            switch (quadrant[l]) {
+                case 0: v = ys[l]; break;
+                case 1: v = xs[l]; break;
+                case 2: v = -ys[l]; break;
+                default: v = -xs[l]; break;
+            }
+            if (v > Q15_16_MAX) v = Q15_16_MAX;
+            if (v < Q15_16_MIN) v = Q15_16_MIN;
+            out[idx + l] = (q15_16_t)v;
+        }
+    }
+#endif
+    for (; idx < count; idx++) {
+        out[idx] = q15_16_sin(angles[idx]);
+    }
+}
+
+void q15_16_cos_v(const q15_16_t* FIXP_RESTRICT angles,
+                q15_16_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(angles); FIXP_ASSUME_ALIGNED64_(out);
+    size_t idx = 0;
+#if defined(__AVX2__)
+    for (; idx + 8 <= count; idx += 8) {
+        int32_t r[8];
+        int quadrant[8];
+        for (size_t l = 0; l < 8; l++) {
+            q15_16_t rl;
+            quadrant[l] = cordic_reduce_angle(angles[idx + l], &rl);
+            r[l] = rl;
+        }
+
+        __m256i x, y;
+        cordic_rotate_v8(&x, &y, _mm256_loadu_si256((const __m256i*)r));
+
+        int32_t xs[8], ys[8];
+        _mm256_storeu_si256((__m256i*)xs, x);
+        _mm256_storeu_si256((__m256i*)ys, y);
+
+        for (size_t l = 0; l < 8; l++) {
+            int32_t v;
+            switch (quadrant[l]) {
+                case 0: v = xs[l]; break;
+                case 1: v = -ys[l]; break;
+                case 2: v = -xs[l]; break;
+                default: v = ys[l]; break;
+            }
+            if (v > Q15_16_MAX) v = Q15_16_MAX;
+            if (v < Q15_16_MIN) v = Q15_16_MIN;
+            out[idx + l] = (q15_16_t)v;
+        }
+    }
+#endif
+    for (; idx < count; idx++) {
+        out[idx] = q15_16_cos(angles[idx]);
+    }
+}
+
+#if defined(__AVX2__)
+// 8-lane SoA CORDIC vectoring, same structure as cordic_rotate_v8 with
+// the sign dispatch keyed on sign(y). Writes the final x (magnitude
+// times the vectoring gain) and the accumulated angle.
+static void cordic_vector_v8(__m256i x, __m256i y, __m256i* x_final, __m256i* z_out) {
+    __m256i z = _mm256_setzero_si256();
+    const __m256i one = _mm256_set1_epi32(1);
+
+    for (int i = 0; i < CORDIC_ITERATIONS; i++) {
+        __m128i cnt = _mm_cvtsi32_si128(i);
+        __m256i at = _mm256_set1_epi32((int32_t)cordic_atan_table(i));
+        // dir = +1 where y >= 0, -1 where y < 0
+        __m256i dir = _mm256_or_si256(_mm256_srai_epi32(y, 31), one);
+        __m256i ys = _mm256_sra_epi32(y, cnt);
+        __m256i xs = _mm256_sra_epi32(x, cnt);
+        x = _mm256_add_epi32(x, _mm256_sign_epi32(ys, dir));
+        y = _mm256_sub_epi32(y, _mm256_sign_epi32(xs, dir));
+        z = _mm256_add_epi32(z, _mm256_sign_epi32(at, dir));
+    }
+
+    *x_final = x;
+    *z_out = z;
+}
+#endif // __AVX2__
+
+void q15_16_hypot_atan2_v(const q15_16_t* FIXP_RESTRICT y, const q15_16_t* FIXP_RESTRICT x,
+                        q15_16_t* FIXP_RESTRICT h, q15_16_t* FIXP_RESTRICT ang, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(y); FIXP_ASSUME_ALIGNED64_(x);
+    FIXP_ASSUME_ALIGNED64_(h); FIXP_ASSUME_ALIGNED64_(ang);
+    size_t idx = 0;
+#if defined(__AVX2__)
+    for (; idx + 8 <= count; idx += 8) {
+        // Scalar prepass: fold into the right half-plane and pre-shift
+        // lanes whose magnitude would overflow 32-bit lanes once the
+        // vectoring gain (~1.65, times sqrt(2) worst case) applies.
+        int32_t xs[8], ys[8];
+        int sh[8];
+        for (size_t l = 0; l < 8; l++) {
+            int32_t xv = x[idx + l];
+            int32_t yv = y[idx + l];
+            int32_t axv = (xv < 0) ? -xv : xv;
+            int32_t ayv = (yv < 0) ? -yv : yv;
+            int32_t mx = (axv > ayv) ? axv : ayv;
+            int shl = 0;
+            if (mx >> 28) {
+                shl = q15_16_hibit(mx) - 28;
+            }
+            sh[l] = shl;
+            xs[l] = axv >> shl;
+            ys[l] = yv >> shl;
+        }
+
+        __m256i xf, zf;
+        cordic_vector_v8(_mm256_loadu_si256((const __m256i*)xs),
+                         _mm256_loadu_si256((const __m256i*)ys), &xf, &zf);
+
+        int32_t xo[8], zo[8];
+        _mm256_storeu_si256((__m256i*)xo, xf);
+        _mm256_storeu_si256((__m256i*)zo, zf);
+
+        for (size_t l = 0; l < 8; l++) {
+            int32_t xv = x[idx + l];
+            int32_t yv = y[idx + l];
+            if (xv == 0 && yv == 0) {
+                h[idx + l] = 0;
+                ang[idx + l] = 0;
+                continue;
+            }
+            int32_t z = zo[l];
+            if (xv < 0) {
+                z = (yv >= 0) ? (int32_t)(Q15_16_PI - z)
+                              : (int32_t)(-Q15_16_PI - z);
+            }
+            int64_t mag = (((int64_t)xo[l] * CORDIC_K_16) >> 16) << sh[l];
+            if (mag > Q15_16_MAX) mag = Q15_16_MAX;
+            h[idx + l] = (q15_16_t)mag;
+            ang[idx + l] = (q15_16_t)z;
+        }
+    }
+#endif
+    for (; idx < count; idx++) {
+        q15_16_hypot_atan2(y[idx], x[idx], &h[idx], &ang[idx]);
+    }
+}
+
+q15_16_t q15_16_tan(q15_16_t angle) {
+    q15_16_t s, c;
+    q15_16_sincos(angle, &s, &c);
+    
+    if (c == 0) return (s >= 0) ? Q15_16_MAX : Q15_16_MIN;
+    
+    // Wide quotient: s << n overflows the storage type once |sin| >= 0.5,
+    // and near ±π/2 the true tangent exceeds the format range anyway.
+    int64_t t = ((int64_t)s << 16) / c;
+    if (t > Q15_16_MAX) t = Q15_16_MAX;
+    if (t < Q15_16_MIN) t = Q15_16_MIN;
+    return (q15_16_t)t;
+}
+
+q15_16_t q15_16_atan2(q15_16_t y, q15_16_t x) {
+    // Half-plane bias indexed by the sign pair; replaces the nested
+    // quadrant branches. Vectoring runs on |x| (it only converges for
+    // x >= 0, and feeding a negative x also broke the y == 0, x < 0
+    // branch cut), then the left half-plane folds back through the
+    // table.
+    static const q15_16_t atan2_quadrant_bias[4] = {
+        0, Q15_16_PI, 0, (q15_16_t)-Q15_16_PI,
+    };
+
+    if (x == 0 && y == 0) return 0;
+
+    int idx = ((y < 0) << 1) | (x < 0);
+    q15_16_t ax = (x < 0) ? (q15_16_t)-x : x;
+    int64_t xf;
+    q15_16_t z = cordic_vector(ax, y, &xf);
+
+    return (q15_16_t)(atan2_quadrant_bias[idx] + ((x < 0) ? (q15_16_t)-z : z));
+}
+
+q15_16_t q15_16_atan(q15_16_t x) {{
+    // Direct vectoring pass: the x argument is the constant ONE, so the
+    // atan2 quadrant fold can never trigger and is skipped entirely.
+    // |x| > 1 needs no reciprocal identity -- the vectoring internals
+    // are wide and atan stays inside the convergence range.
+    int64_t xf;
+    return cordic_vector(Q15_16_ONE, x, &xf);
+}}
+
+void q15_16_hypot_atan2(q15_16_t y, q15_16_t x,
+                      q15_16_t* h, q15_16_t* ang) {
+    if (x == 0 && y == 0) {
+        *h = 0;
+        *ang = 0;
+        return;
+    }
+
+    // One vectoring pass yields both outputs: z converges to the angle
+    // and the final x to gain * sqrt(x^2 + y^2), undone by the same K
+    // constant the rotation mode uses. Vectoring only converges for
+    // x >= 0, so run on |x| and fold the left half-plane back by pi.
+    q15_16_t ax = (x < 0) ? (q15_16_t)-x : x;
+    int64_t xf;
+    q15_16_t z = cordic_vector(ax, y, &xf);
+    if (x < 0) {
+        z = (y >= 0) ? (q15_16_t)(Q15_16_PI - z)
+                     : (q15_16_t)(-Q15_16_PI - z);
+    }
+
+    int64_t mag = (xf * CORDIC_K_16) >> 16;
+    if (mag > Q15_16_MAX) mag = Q15_16_MAX;
+
+    *h = (q15_16_t)mag;
+    *ang = z;
+}
+
+// 1/(4*K_h^2) in Q16+14, K_h over the full repetition schedule
+#define CORDIC_INV_4KH2_16 ((int64_t)391392093)
+// 14 fractional guard bits carried through normalization and
+// vectoring, with the iteration count extended to match, so the
+// residual stays below the format's LSB after the shift back.
+#define CORDIC_SQRT_GUARD_16 14
+#define CORDIC_SQRT_ITERS_16 30
+
+// CORDIC hyperbolic vectoring mode: drives y toward 0 and returns the
+// final x, which is sqrt(x0^2 - y0^2) scaled by K_h. Iterations start
+// at i=1; indices 4, 13, 40, ... repeat per the Walther convergence rule.
+static int64_t cordic_hyperbolic_vector(int64_t x, int64_t y) {
+    int repeat = 4;
+    for (int i = 1; i <= CORDIC_SQRT_ITERS_16; i++) {
+        int reps = 1;
+        if (i == repeat) {
+            reps = 2;
+            repeat = 3 * repeat + 1;
+        }
+        while (reps--) {
+            // Branchless conditional negate keyed on the sign of y
+            const int64_t sign = -(int64_t)(y < 0);
+            int64_t dx = ((y >> i) ^ sign) - sign;
+            int64_t dy = ((x >> i) ^ sign) - sign;
+            x -= dx;
+            y -= dy;
+        }
+    }
+    return x;
+}
+
+q15_16_t q15_16_sqrt(q15_16_t x) {
+    if (x <= 0) return 0;
+
+    // Normalize x = mant * 4^e with mant in [1/4, 1) so the vectoring
+    // angle stays inside the scheme's convergence bound (~1.11). The
+    // exponent comes straight from the highest set bit; mant lands in
+    // the guarded scale through a rounded shift, so the 2e low bits
+    // contribute instead of being discarded.
+    int e = (q15_16_hibit(x) - 16 + 2) >> 1;
+    int sh = 2 * e - CORDIC_SQRT_GUARD_16;
+    int64_t mant = (sh > 0)
+        ? ((int64_t)x + ((int64_t)1 << (sh - 1))) >> sh
+        : (int64_t)x << -sh;
+
+    // x0 = mant + 1/(4*Kh^2), y0 = mant - 1/(4*Kh^2) gives
+    // sqrt(x0^2 - y0^2) = sqrt(mant)/K_h, so the K_h vectoring gain
+    // cancels and x_n is sqrt(mant) directly -- no post-scaling.
+    int64_t xn = cordic_hyperbolic_vector(mant + CORDIC_INV_4KH2_16,
+                                              mant - CORDIC_INV_4KH2_16);
+
+    // Undo the normalization and drop the guard bits in one rounded
+    // shift: sqrt(mant * 4^e) = sqrt(mant) * 2^e, and e < guard always,
+    // so the count stays positive. Rounding up can graze one past the
+    // top of a zero-integer-bit range, hence the clamp.
+    int shr = CORDIC_SQRT_GUARD_16 - e;
+    int64_t res = (xn + ((int64_t)1 << (shr - 1))) >> shr;
+    if (res > Q15_16_MAX) res = Q15_16_MAX;
+    return (q15_16_t)res;
+}
+
+// 2^f on [0, 1): 5th-order minimax Horner (truncated Chebyshev fit)
+#define EXP2_POLY_C0_16 ((int64_t)65536)
+#define EXP2_POLY_C1_16 ((int64_t)45427)
+#define EXP2_POLY_C2_16 ((int64_t)15738)
+#define EXP2_POLY_C3_16 ((int64_t)3661)
+#define EXP2_POLY_C4_16 ((int64_t)586)
+#define EXP2_POLY_C5_16 ((int64_t)124)
+
+q15_16_t q15_16_exp2(q15_16_t x) {
+    // Arithmetic shift floors toward -inf, so frac_part is in [0, 1)
+    int int_part = x >> 16;
+    q15_16_t frac_part = x & (Q15_16_ONE - 1);
+
+    if (int_part >= 15) return Q15_16_MAX;
+    if (int_part < -16 - 1) return 0;
+
+    int64_t r = EXP2_POLY_C5_16;
+    r = ((r * frac_part + 32768) >> 16) + EXP2_POLY_C4_16;
+    r = ((r * frac_part + 32768) >> 16) + EXP2_POLY_C3_16;
+    r = ((r * frac_part + 32768) >> 16) + EXP2_POLY_C2_16;
+    r = ((r * frac_part + 32768) >> 16) + EXP2_POLY_C1_16;
+    r = ((r * frac_part + 32768) >> 16) + EXP2_POLY_C0_16;
+
+    // Scale by 2^int_part; negative exponents shift right instead of
+    // invoking the old left-shift-by-negative
+    int64_t res = (int_part >= 0) ? (r << int_part) : (r >> -int_part);
+    if (res > Q15_16_MAX) res = Q15_16_MAX;
+    return (q15_16_t)res;
+}
+
+// e^r on [0, ln2): 5th-order minimax Horner (truncated Chebyshev fit)
+#define EXP_POLY_C0_16 ((int64_t)65536)
+#define EXP_POLY_C1_16 ((int64_t)65537)
+#define EXP_POLY_C2_16 ((int64_t)32756)
+#define EXP_POLY_C3_16 ((int64_t)10993)
+#define EXP_POLY_C4_16 ((int64_t)2540)
+#define EXP_POLY_C5_16 ((int64_t)776)
+#define EXP_INV_LN2_16 ((int64_t)94548)  // 2^16 / ln2
+#define EXP_LN2_16     ((int64_t)45426)
+
+q15_16_t q15_16_exp(q15_16_t x) {
+    // Decompose x = k*ln2 + r with k = floor(x / ln2), r in [0, ln2),
+    // then e^x = e^r << k directly. The old path rescaled by log2(e)
+    // and had exp2 multiply the scale right back out -- two wide
+    // multiplies that cancel.
+    int k = (int)(((int64_t)x * EXP_INV_LN2_16) >> 32);
+
+    // The floored reciprocal can undershoot k by one; one correction
+    // step keeps r inside the kernel's fit range.
+    int64_t r = (int64_t)x - ((int64_t)k * EXP_LN2_16);
+    if (r >= EXP_LN2_16) {
+        r -= EXP_LN2_16;
+        k++;
+    }
+
+    if (k >= 15) return Q15_16_MAX;
+    if (k < -16 - 1) return 0;
+
+    int64_t er = EXP_POLY_C5_16;
+    er = ((er * r + 32768) >> 16) + EXP_POLY_C4_16;
+    er = ((er * r + 32768) >> 16) + EXP_POLY_C3_16;
+    er = ((er * r + 32768) >> 16) + EXP_POLY_C2_16;
+    er = ((er * r + 32768) >> 16) + EXP_POLY_C1_16;
+    er = ((er * r + 32768) >> 16) + EXP_POLY_C0_16;
+
+    int64_t res = (k >= 0) ? (er << k) : (er >> -k);
+    if (res > Q15_16_MAX) res = Q15_16_MAX;
+    return (q15_16_t)res;
+}
+
+// log2(1 + u) on [0, 1): order-4 minimax Horner (truncated Chebyshev fit)
+#define LOG2_POLY_C0_16 ((int64_t)7)
+#define LOG2_POLY_C1_16 ((int64_t)94195)
+#define LOG2_POLY_C2_16 ((int64_t)-44101)
+#define LOG2_POLY_C3_16 ((int64_t)20674)
+#define LOG2_POLY_C4_16 ((int64_t)-5244)
+
+q15_16_t q15_16_log2(q15_16_t x) {
+    if (x <= 0) return Q15_16_MIN;
+
+    // Position of the highest set bit: single bit-scan, no shift loop
+    int bit_pos = q15_16_hibit(x);
+
+    int int_part = bit_pos - 16;
+    
+    // Normalize to [1, 2)
+    q15_16_t normalized;
+    if (bit_pos >= 16) {
+        normalized = x >> (bit_pos - 16);
+    } else {
+        normalized = x << (16 - bit_pos);
+    }
+    
+    // log2(1 + u) on [0, 1): order-4 minimax Horner replaces the old
+    // linear approximation (worst case ~0.086 absolute)
+    q15_16_t u = normalized - Q15_16_ONE;
+    int64_t lf = LOG2_POLY_C4_16;
+    lf = ((lf * u + 32768) >> 16) + LOG2_POLY_C3_16;
+    lf = ((lf * u + 32768) >> 16) + LOG2_POLY_C2_16;
+    lf = ((lf * u + 32768) >> 16) + LOG2_POLY_C1_16;
+    lf = ((lf * u + 32768) >> 16) + LOG2_POLY_C0_16;
+
+    return (q15_16_t)(((int64_t)int_part << 16) + lf);
+}
+
+q15_16_t q15_16_log(q15_16_t x) {
+    q15_16_t log2_val = q15_16_log2(x);
+    q15_16_t ln2 = (q15_16_t)(0.693147 * (1LL << 16));
+    return (q15_16_t)(((int64_t)log2_val * ln2) >> 16);
+}
+
+q15_16_t q15_16_pow(q15_16_t base, q15_16_t exponent) {
+    if (base <= 0) return 0;
+    // x^y = 2^(y * log2(x)); wide multiply with saturation, as in exp
+    q15_16_t log_base = q15_16_log2(base);
+    int64_t scaled = ((int64_t)exponent * log_base) >> 16;
+    if (scaled > Q15_16_MAX) scaled = Q15_16_MAX;
+    if (scaled < Q15_16_MIN) scaled = Q15_16_MIN;
+    return q15_16_exp2((q15_16_t)scaled);
+}
@@ -0,0 +1,254 @@
+#ifndef FIXP_Q15_16_MATH_H
+#define FIXP_Q15_16_MATH_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include <stddef.h>
+
+#if defined(__AVX2__)
+#include <immintrin.h>
+#elif defined(__ARM_NEON)
+#include <arm_neon.h>
+#endif
+
+// Function attributes (GCC/Clang): const lets the compiler CSE repeated
+// calls with the same arguments, always_inline keeps the small helpers
+// inline even at -Os, and pure marks the out-of-line math functions,
+// which read only their arguments and immutable tables.
+#ifndef FIXP_ATTR_CONST
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ATTR_CONST __attribute__((const, always_inline))
+#define FIXP_ATTR_CONST_FN __attribute__((const))
+#define FIXP_ATTR_PURE __attribute__((pure))
+#else
+#define FIXP_ATTR_CONST
+#define FIXP_ATTR_CONST_FN
+#define FIXP_ATTR_PURE
+#endif
+#endif
+
+// Batch-pointer contract: restrict promises the source and destination
+// arrays of the *_v kernels never overlap, and the 64-byte alignment
+// assumption lets the vectorizer drop its runtime overlap checks and
+// unaligned-head peel loops. Callers must pass non-overlapping arrays
+// in 64-byte-aligned storage (alignas(64) / aligned_alloc).
+#ifndef FIXP_RESTRICT
+#ifdef __cplusplus
+#define FIXP_RESTRICT __restrict
+#else
+#define FIXP_RESTRICT restrict
+#endif
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ASSUME_ALIGNED64_(p) ((p) = (__typeof__(p))__builtin_assume_aligned((p), 64))
+#else
+#define FIXP_ASSUME_ALIGNED64_(p) ((void)0)
+#endif
+#endif
+
+// Vectorization hint ahead of the plain batch loops: `omp simd` under
+// OpenMP (also honoured by -fopenmp-simd), otherwise the compiler's
+// own no-loop-carried-dependence assertion.
+#ifndef FIXP_VEC_LOOP_
+#if defined(_OPENMP)
+#define FIXP_VEC_LOOP_ _Pragma("omp simd")
+#elif defined(__clang__)
+#define FIXP_VEC_LOOP_ _Pragma("clang loop vectorize(enable)")
+#elif defined(__GNUC__)
+#define FIXP_VEC_LOOP_ _Pragma("GCC ivdep")
+#else
+#define FIXP_VEC_LOOP_
+#endif
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+// Q15.16 format: 32-bit signed fixed-point
+// 15 integer bits, 16 fractional bits
+typedef int32_t q15_16_t;
+
+// Constants. ONE/MAX/MIN are shared with the arithmetic header for
+// formats that have one, so each is guarded to keep the headers
+// composable in either include order.
+#define Q15_16_PI       ((q15_16_t)(3.14159265358979323846 * (1LL << 16)))
+#define Q15_16_E        ((q15_16_t)(2.71828182845904523536 * (1LL << 16)))
+#ifndef Q15_16_ONE
+#define Q15_16_ONE      ((q15_16_t)(1LL << 16))
+#endif
+#define Q15_16_HALF     ((q15_16_t)(1LL << (16 - 1)))
+#ifndef Q15_16_MAX
+#define Q15_16_MAX      ((q15_16_t)((1LL << (32 - 1)) - 1))
+#endif
+#ifndef Q15_16_MIN
+#define Q15_16_MIN      ((q15_16_t)(-(1LL << (32 - 1))))
+#endif
+
+// Basic operations
+static inline FIXP_ATTR_CONST q15_16_t q15_16_abs(q15_16_t x) {
+    return (x < 0) ? -x : x;
+}
+
+static inline FIXP_ATTR_CONST q15_16_t q15_16_min(q15_16_t a, q15_16_t b) {
+    return (a < b) ? a : b;
+}
+
+static inline FIXP_ATTR_CONST q15_16_t q15_16_max(q15_16_t a, q15_16_t b) {
+    return (a > b) ? a : b;
+}
+
+static inline FIXP_ATTR_CONST q15_16_t q15_16_clamp(q15_16_t x, q15_16_t lo, q15_16_t hi) {
+    return q15_16_min(q15_16_max(x, lo), hi);
+}
+
+// Batch operations over arrays. SIMD-accelerated on AVX2/NEON, with a
+// scalar tail that also serves as the portable fallback.
+
+static inline void q15_16_abs_v(const q15_16_t* FIXP_RESTRICT src, q15_16_t* FIXP_RESTRICT dst, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + 8 <= count; i += 8) {
+        __m256i v = _mm256_loadu_si256((const __m256i*)(src + i));
+        _mm256_storeu_si256((__m256i*)(dst + i), _mm256_abs_epi32(v));
+    }
+#elif defined(__ARM_NEON)
+    for (; i + 4 <= count; i += 4) {
+        vst1q_s32(dst + i, vabsq_s32(vld1q_s32(src + i)));
+    }
+#endif
+    for (; i < count; i++) {
+        dst[i] = q15_16_abs(src[i]);
+    }
+}
+
+static inline void q15_16_min_v(const q15_16_t* FIXP_RESTRICT a, const q15_16_t* FIXP_RESTRICT b,
+                                 q15_16_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + 8 <= count; i += 8) {
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i));
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i));
+        _mm256_storeu_si256((__m256i*)(out + i), _mm256_min_epi32(va, vb));
+    }
+#elif defined(__ARM_NEON)
+    for (; i + 4 <= count; i += 4) {
+        vst1q_s32(out + i, vminq_s32(vld1q_s32(a + i), vld1q_s32(b + i)));
+    }
+#endif
+    for (; i < count; i++) {
+        out[i] = q15_16_min(a[i], b[i]);
+    }
+}
+
+static inline void q15_16_max_v(const q15_16_t* FIXP_RESTRICT a, const q15_16_t* FIXP_RESTRICT b,
+                                 q15_16_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + 8 <= count; i += 8) {
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i));
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i));
+        _mm256_storeu_si256((__m256i*)(out + i), _mm256_max_epi32(va, vb));
+    }
+#elif defined(__ARM_NEON)
+    for (; i + 4 <= count; i += 4) {
+        vst1q_s32(out + i, vmaxq_s32(vld1q_s32(a + i), vld1q_s32(b + i)));
+    }
+#endif
+    for (; i < count; i++) {
+        out[i] = q15_16_max(a[i], b[i]);
+    }
+}
+
+static inline void q15_16_clamp_v(const q15_16_t* FIXP_RESTRICT src, q15_16_t* FIXP_RESTRICT dst, size_t count,
+                                   q15_16_t lo, q15_16_t hi) {
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst);
+    size_t i = 0;
+#if defined(__AVX2__)
+    const __m256i vlo = _mm256_set1_epi32(lo);
+    const __m256i vhi = _mm256_set1_epi32(hi);
+    for (; i + 8 <= count; i += 8) {
+        __m256i v = _mm256_loadu_si256((const __m256i*)(src + i));
+        v = _mm256_min_epi32(_mm256_max_epi32(v, vlo), vhi);
+        _mm256_storeu_si256((__m256i*)(dst + i), v);
+    }
+#elif defined(__ARM_NEON)
+    const int32x4_t vlo = vdupq_n_s32(lo);
+    const int32x4_t vhi = vdupq_n_s32(hi);
+    for (; i + 4 <= count; i += 4) {
+        int32x4_t v = vld1q_s32(src + i);
+        vst1q_s32(dst + i, vminq_s32(vmaxq_s32(v, vlo), vhi));
+    }
+#endif
+    for (; i < count; i++) {
+        dst[i] = q15_16_clamp(src[i], lo, hi);
+    }
+}
+
+// Rounding functions
+static inline FIXP_ATTR_CONST q15_16_t q15_16_floor(q15_16_t x) {
+    const q15_16_t frac_mask = Q15_16_ONE - 1;
+    if (x >= 0) {
+        return x & ~frac_mask;
+    } else {
+        return (x & frac_mask) ? ((x & ~frac_mask) - Q15_16_ONE) : x;
+    }
+}
+
+static inline FIXP_ATTR_CONST q15_16_t q15_16_ceil(q15_16_t x) {
+    const q15_16_t frac_mask = Q15_16_ONE - 1;
+    if (x >= 0) {
+        return (x & frac_mask) ? ((x & ~frac_mask) + Q15_16_ONE) : x;
+    } else {
+        return x & ~frac_mask;
+    }
+}
+
+static inline FIXP_ATTR_CONST q15_16_t q15_16_round(q15_16_t x) {
+    if (x >= 0) {
+        return (x + Q15_16_HALF) & ~(Q15_16_ONE - 1);
+    } else {
+        return (x - Q15_16_HALF) & ~(Q15_16_ONE - 1);
+    }
+}
+
+static inline FIXP_ATTR_CONST q15_16_t q15_16_trunc(q15_16_t x) {
+    return x & ~(Q15_16_ONE - 1);
+}
+
+// Square root (Newton-Raphson)
+FIXP_ATTR_PURE q15_16_t q15_16_sqrt(q15_16_t x);
+
+// Trigonometric functions (CORDIC-based)
+FIXP_ATTR_PURE q15_16_t q15_16_sin(q15_16_t angle);
+FIXP_ATTR_PURE q15_16_t q15_16_cos(q15_16_t angle);
+// Fused: one range reduction and one CORDIC pass for both outputs.
+void q15_16_sincos(q15_16_t angle, q15_16_t* s, q15_16_t* c);
+FIXP_ATTR_PURE q15_16_t q15_16_tan(q15_16_t angle);
+FIXP_ATTR_PURE q15_16_t q15_16_atan(q15_16_t x);
+FIXP_ATTR_PURE q15_16_t q15_16_atan2(q15_16_t y, q15_16_t x);
+// Fused vectoring: magnitude and angle from a single CORDIC pass
+void q15_16_hypot_atan2(q15_16_t y, q15_16_t x, q15_16_t* h, q15_16_t* ang);
+
+// Batch trigonometry over angle arrays (SoA layout); AVX2-accelerated
+void q15_16_sin_v(const q15_16_t* FIXP_RESTRICT angles,
+                q15_16_t* FIXP_RESTRICT out, size_t count);
+void q15_16_cos_v(const q15_16_t* FIXP_RESTRICT angles,
+                q15_16_t* FIXP_RESTRICT out, size_t count);
+void q15_16_hypot_atan2_v(const q15_16_t* FIXP_RESTRICT y, const q15_16_t* FIXP_RESTRICT x,
+                        q15_16_t* FIXP_RESTRICT h, q15_16_t* FIXP_RESTRICT ang, size_t count);
+
+// Exponential and logarithmic
+FIXP_ATTR_PURE q15_16_t q15_16_exp(q15_16_t x);
+FIXP_ATTR_PURE q15_16_t q15_16_log(q15_16_t x);
+FIXP_ATTR_PURE q15_16_t q15_16_exp2(q15_16_t x);
+FIXP_ATTR_PURE q15_16_t q15_16_log2(q15_16_t x);
+FIXP_ATTR_PURE q15_16_t q15_16_pow(q15_16_t base, q15_16_t exponent);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // FIXP_Q15_16_MATH_H
@@ -0,0 +1,59 @@
+/**
+ * @file q16_16.h
+ * @brief Q16.16 Fixed-Point Implementation (Generated)
+ *
+ * Format: 1 sign bit, 16 integer bits, 16 fractional bits.
+ * Underlying storage: int64_t (64-bit).
+ */
+
+#ifndef FIXP_GEN_Q16_16_H
+#define FIXP_GEN_Q16_16_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include "fixp_common.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef int64_t q16_16_t;
+
+#ifdef __cplusplus
+#define Q16_16_WRAP(raw) (q16_16_t{(raw)})
+#else
+#define Q16_16_WRAP(raw) ((q16_16_t)(raw))
+#endif
+
+#define Q16_16_RAW(x) (x)
+
+#define Q16_16_FRAC_BITS 16
+// Guarded: the math header for this format defines the same constants
+#ifndef Q16_16_ONE
+#define Q16_16_ONE Q16_16_WRAP(65536)
+#endif
+#ifndef Q16_16_MAX
+#define Q16_16_MAX Q16_16_WRAP(INT64_MAX)
+#endif
+#ifndef Q16_16_MIN
+#define Q16_16_MIN Q16_16_WRAP(INT64_MIN)
+#endif
+
+// One expansion emits the scalar operation set for this format
+FIXP_DEFINE_Q(16, 16, int64_t, uint64_t, __int128_t)
+
+// Division with a compile-time-constant denominator. When b folds to a
+// constant, the compiler strength-reduces the wide quotient inside
+// q16_16_div to an exact, branch-free multiply-high ("magic
+// number") sequence -- no hardware divide, and bit-identical to
+// q16_16_div for every input. A rounded-reciprocal multiply
+// would save one shift but costs up to |a| / 2^17 raw units of
+// error, half the format's precision. The denominator is the format's
+// raw representation, so e.g. dividing by 2.0 means b = 2 * Q16_16_ONE.
+#define q16_16_div_const(a, b) q16_16_div((a), (b))
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // FIXP_GEN_Q16_16_H
@@ -0,0 +1,62 @@
+/**
+ * @file q1_30.h
+ * @brief Q1.30 Fixed-Point Implementation (Generated)
+ *
+ * Format: 1 sign bit, 1 integer bits, 30 fractional bits.
+ * Underlying storage: int32_t (32-bit).
+ */
+
+#ifndef FIXP_GEN_Q1_30_H
+#define FIXP_GEN_Q1_30_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include "fixp_common.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef int32_t q1_30_t;
+
+#ifdef __cplusplus
+#define Q1_30_WRAP(raw) (q1_30_t{(raw)})
+#else
+#define Q1_30_WRAP(raw) ((q1_30_t)(raw))
+#endif
+
+#define Q1_30_RAW(x) (x)
+
+#define Q1_30_FRAC_BITS 30
+// Guarded: the math header for this format defines the same constants
+#ifndef Q1_30_ONE
+#define Q1_30_ONE Q1_30_WRAP(1073741824)
+#endif
+#ifndef Q1_30_MAX
+#define Q1_30_MAX Q1_30_WRAP(INT32_MAX)
+#endif
+#ifndef Q1_30_MIN
+#define Q1_30_MIN Q1_30_WRAP(INT32_MIN)
+#endif
+
+// One expansion emits the scalar operation set for this format
+FIXP_DEFINE_Q(1, 30, int32_t, uint32_t, int64_t)
+
+// Division with a compile-time-constant denominator. When b folds to a
+// constant, the compiler strength-reduces the wide quotient inside
+// q1_30_div to an exact, branch-free multiply-high ("magic
+// number") sequence -- no hardware divide, and bit-identical to
+// q1_30_div for every input. A rounded-reciprocal multiply
+// would save one shift but costs up to |a| / 2^31 raw units of
+// error, half the format's precision. The denominator is the format's
+// raw representation, so e.g. dividing by 2.0 means b = 2 * Q1_30_ONE.
+#define q1_30_div_const(a, b) q1_30_div((a), (b))
+
+// Batch operations over arrays (SIMD on AVX2/NEON, scalar fallback)
+FIXP_DEFINE_Q_BATCH_W32(1, 30)
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // FIXP_GEN_Q1_30_H
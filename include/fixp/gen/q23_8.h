@@ -0,0 +1,62 @@
+/**
+ * @file q23_8.h
+ * @brief Q23.8 Fixed-Point Implementation (Generated)
+ *
+ * Format: 1 sign bit, 23 integer bits, 8 fractional bits.
+ * Underlying storage: int32_t (32-bit).
+ */
+
+#ifndef FIXP_GEN_Q23_8_H
+#define FIXP_GEN_Q23_8_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include "fixp_common.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef int32_t q23_8_t;
+
+#ifdef __cplusplus
+#define Q23_8_WRAP(raw) (q23_8_t{(raw)})
+#else
+#define Q23_8_WRAP(raw) ((q23_8_t)(raw))
+#endif
+
+#define Q23_8_RAW(x) (x)
+
+#define Q23_8_FRAC_BITS 8
+// Guarded: the math header for this format defines the same constants
+#ifndef Q23_8_ONE
+#define Q23_8_ONE Q23_8_WRAP(256)
+#endif
+#ifndef Q23_8_MAX
+#define Q23_8_MAX Q23_8_WRAP(INT32_MAX)
+#endif
+#ifndef Q23_8_MIN
+#define Q23_8_MIN Q23_8_WRAP(INT32_MIN)
+#endif
+
+// One expansion emits the scalar operation set for this format
+FIXP_DEFINE_Q(23, 8, int32_t, uint32_t, int64_t)
+
+// Division with a compile-time-constant denominator. When b folds to a
+// constant, the compiler strength-reduces the wide quotient inside
+// q23_8_div to an exact, branch-free multiply-high ("magic
+// number") sequence -- no hardware divide, and bit-identical to
+// q23_8_div for every input. A rounded-reciprocal multiply
+// would save one shift but costs up to |a| / 2^9 raw units of
+// error, half the format's precision. The denominator is the format's
+// raw representation, so e.g. dividing by 2.0 means b = 2 * Q23_8_ONE.
+#define q23_8_div_const(a, b) q23_8_div((a), (b))
+
+// Batch operations over arrays (SIMD on AVX2/NEON, scalar fallback)
+FIXP_DEFINE_Q_BATCH_W32(23, 8)
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // FIXP_GEN_Q23_8_H
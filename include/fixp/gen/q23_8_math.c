@@ -0,0 +1,420 @@
+#include "q23_8_math.h"
+#include "cordic_atan_table_N8.h"
+#include "fixp_cordic_impl.h"
+#include <stdint.h>
+
+// CORDIC constants
+#define CORDIC_K_8 ((q23_8_t)155)
+#define CORDIC_ITERATIONS 8
+
+// Shared across all Qm.8 formats; values fit in q23_8_t.
+#define cordic_atan_table(i) ((q23_8_t)cordic_atan_table_N8[i])
+
+// Vectoring-mode kernels only; rotation trig is served by the sine LUT
+FIXP_CORDIC_HIBIT_DEFINE(23, 8, int32_t)
+FIXP_CORDIC_VECTOR_DEFINE(23, 8, int32_t, int64_t)
+
+// Quarter-wave sine table, Q8: sin on [0, π/2] at 257 points.
+// 514 bytes -- cacheline-aligned so it spans the minimum nine lines.
+static const int16_t sin_quad_8[257] FIXP_ATTR_ALIGN64 = {
+    0, 2, 3, 5, 6, 8, 9, 11, 13, 14,
+    16, 17, 19, 20, 22, 24, 25, 27, 28, 30,
+    31, 33, 34, 36, 38, 39, 41, 42, 44, 45,
+    47, 48, 50, 51, 53, 55, 56, 58, 59, 61,
+    62, 64, 65, 67, 68, 70, 71, 73, 74, 76,
+    77, 79, 80, 82, 83, 85, 86, 88, 89, 91,
+    92, 94, 95, 97, 98, 99, 101, 102, 104, 105,
+    107, 108, 109, 111, 112, 114, 115, 117, 118, 119,
+    121, 122, 123, 125, 126, 128, 129, 130, 132, 133,
+    134, 136, 137, 138, 140, 141, 142, 144, 145, 146,
+    147, 149, 150, 151, 152, 154, 155, 156, 157, 159,
+    160, 161, 162, 164, 165, 166, 167, 168, 170, 171,
+    172, 173, 174, 175, 177, 178, 179, 180, 181, 182,
+    183, 184, 185, 186, 188, 189, 190, 191, 192, 193,
+    194, 195, 196, 197, 198, 199, 200, 201, 202, 203,
+    204, 205, 206, 207, 207, 208, 209, 210, 211, 212,
+    213, 214, 215, 215, 216, 217, 218, 219, 220, 220,
+    221, 222, 223, 224, 224, 225, 226, 227, 227, 228,
+    229, 229, 230, 231, 231, 232, 233, 233, 234, 235,
+    235, 236, 237, 237, 238, 238, 239, 239, 240, 241,
+    241, 242, 242, 243, 243, 244, 244, 245, 245, 245,
+    246, 246, 247, 247, 248, 248, 248, 249, 249, 249,
+    250, 250, 250, 251, 251, 251, 252, 252, 252, 252,
+    253, 253, 253, 253, 254, 254, 254, 254, 254, 255,
+    255, 255, 255, 255, 255, 255, 256, 256, 256, 256,
+    256, 256, 256, 256, 256, 256, 256,
+};
+
+// Maps r in [0, π/2) (Q8) to an 8.8 table coordinate in one multiply
+#define SIN_LUT_INV_HALFPI_8 10680707u
+
+// sin(r) by linear interpolation between adjacent table entries
+static q23_8_t sin_lut(int32_t r) {
+    uint32_t t = ((uint32_t)r * SIN_LUT_INV_HALFPI_8) >> 16;
+    uint32_t i = t >> 8;
+    int32_t frac = (int32_t)(t & 0xFF);
+    int32_t s0 = sin_quad_8[i];
+    int32_t s1 = sin_quad_8[i + 1];
+    return (q23_8_t)(s0 + (((s1 - s0) * frac) >> 8));
+}
+
+// cos(r) = sin(π/2 - r): walk the same table from the far end
+static q23_8_t cos_lut(int32_t r) {
+    uint32_t t = ((uint32_t)r * SIN_LUT_INV_HALFPI_8) >> 16;
+    uint32_t i = t >> 8;
+    int32_t frac = (int32_t)(t & 0xFF);
+    int32_t c0 = sin_quad_8[256 - i];
+    int32_t c1 = sin_quad_8[255 - i];
+    return (q23_8_t)(c0 + (((c1 - c0) * frac) >> 8));
+}
+
+// Range-reduction constants, carried with 25 guard bits (Q8+25)
+#define CORDIC_TWO_PI_G_8    ((int64_t)53972150818)
+#define CORDIC_HALF_PI_G_8   ((int64_t)13493037705)
+#define CORDIC_INV_2PI_8     ((int64_t)2670177)      // 2^24 / 2π
+#define CORDIC_INV_HALF_PI_8 ((int64_t)10680707)  // 2^24 / (π/2)
+
+// Constant-time reduction: writes r in [0, π/2) and returns the 2-bit
+// quadrant index, so angle ≈ quadrant * π/2 + r (mod 2π). The multiply
+// by the 2π reciprocal replaces the O(angle/π) subtract loop; the
+// reciprocal's rounding makes the quotient off by at most 1, fixed by
+// a single correction step. The remainder itself is computed in
+// Q8+25 so the rounding of 2π does not accumulate across wraps.
+static int cordic_reduce_angle(q23_8_t angle, q23_8_t* r_out) {
+    int64_t k = ((int64_t)angle * CORDIC_INV_2PI_8) >> 32;
+    int64_t a = ((int64_t)angle << 25) - k * CORDIC_TWO_PI_G_8;
+    if (a < 0) a += CORDIC_TWO_PI_G_8;
+    else if (a >= CORDIC_TWO_PI_G_8) a -= CORDIC_TWO_PI_G_8;
+
+    int quadrant = (int)((a * CORDIC_INV_HALF_PI_8) >> 57);
+    int64_t r = a - (int64_t)quadrant * CORDIC_HALF_PI_G_8;
+    if (r < 0) {
+        r += CORDIC_HALF_PI_G_8;
+        quadrant--;
+    } else if (r >= CORDIC_HALF_PI_G_8) {
+        r -= CORDIC_HALF_PI_G_8;
+        quadrant++;
+    }
+
+    *r_out = (q23_8_t)(r >> 25);
+    return quadrant & 3;
+}
+
+q23_8_t q23_8_sin(q23_8_t angle) {
+    q23_8_t r;
+    int quadrant = cordic_reduce_angle(angle, &r);
+
+    switch (quadrant) {
+        case 0: return sin_lut(r);
+        case 1: return cos_lut(r);
+        case 2: return (q23_8_t)-sin_lut(r);
+        default: return (q23_8_t)-cos_lut(r);
+    }
+}
+
+q23_8_t q23_8_cos(q23_8_t angle) {
+    q23_8_t r;
+    int quadrant = cordic_reduce_angle(angle, &r);
+
+    switch (quadrant) {
+        case 0: return cos_lut(r);
+        case 1: return (q23_8_t)-sin_lut(r);
+        case 2: return (q23_8_t)-cos_lut(r);
+        default: return sin_lut(r);
+    }
+}
+
+void q23_8_sincos(q23_8_t angle, q23_8_t* s, q23_8_t* c) {
+    // Fuses the reduction; the two kernels stay separate lookups.
+    q23_8_t r;
+    int quadrant = cordic_reduce_angle(angle, &r);
+    q23_8_t sp = sin_lut(r);
+    q23_8_t cp = cos_lut(r);
+
+    switch (quadrant) {
+        case 0:  *s = sp;                   *c = cp;                   break;
+        case 1:  *s = cp;                   *c = (q23_8_t)-sp;     break;
+        case 2:  *s = (q23_8_t)-sp;     *c = (q23_8_t)-cp;     break;
+        default: *s = (q23_8_t)-cp;     *c = sp;                   break;
+    }
+}
+
+void q23_8_sin_v(const q23_8_t* FIXP_RESTRICT angles,
+                q23_8_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(angles); FIXP_ASSUME_ALIGNED64_(out);
+    FIXP_VEC_LOOP_
+    for (size_t idx = 0; idx < count; idx++) {
+        out[idx] = q23_8_sin(angles[idx]);
+    }
+}
+
+void q23_8_cos_v(const q23_8_t* FIXP_RESTRICT angles,
+                q23_8_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(angles); FIXP_ASSUME_ALIGNED64_(out);
+    FIXP_VEC_LOOP_
+    for (size_t idx = 0; idx < count; idx++) {
+        out[idx] = q23_8_cos(angles[idx]);
+    }
+}
+
+void q23_8_hypot_atan2_v(const q23_8_t* FIXP_RESTRICT y, const q23_8_t* FIXP_RESTRICT x,
+                        q23_8_t* FIXP_RESTRICT h, q23_8_t* FIXP_RESTRICT ang, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(y); FIXP_ASSUME_ALIGNED64_(x);
+    FIXP_ASSUME_ALIGNED64_(h); FIXP_ASSUME_ALIGNED64_(ang);
+    FIXP_VEC_LOOP_
+    for (size_t idx = 0; idx < count; idx++) {
+        q23_8_hypot_atan2(y[idx], x[idx], &h[idx], &ang[idx]);
+    }
+}
+
+q23_8_t q23_8_tan(q23_8_t angle) {
+    q23_8_t s, c;
+    q23_8_sincos(angle, &s, &c);
+    
+    if (c == 0) return (s >= 0) ? Q23_8_MAX : Q23_8_MIN;
+    
+    // Wide quotient: s << n overflows the storage type once |sin| >= 0.5,
+    // and near ±π/2 the true tangent exceeds the format range anyway.
+    int64_t t = ((int64_t)s << 8) / c;
+    if (t > Q23_8_MAX) t = Q23_8_MAX;
+    if (t < Q23_8_MIN) t = Q23_8_MIN;
+    return (q23_8_t)t;
+}
+
+q23_8_t q23_8_atan2(q23_8_t y, q23_8_t x) {
+    // Half-plane bias indexed by the sign pair; replaces the nested
+    // quadrant branches. Vectoring runs on |x| (it only converges for
+    // x >= 0, and feeding a negative x also broke the y == 0, x < 0
+    // branch cut), then the left half-plane folds back through the
+    // table.
+    static const q23_8_t atan2_quadrant_bias[4] = {
+        0, Q23_8_PI, 0, (q23_8_t)-Q23_8_PI,
+    };
+
+    if (x == 0 && y == 0) return 0;
+
+    int idx = ((y < 0) << 1) | (x < 0);
+    q23_8_t ax = (x < 0) ? (q23_8_t)-x : x;
+    int64_t xf;
+    q23_8_t z = cordic_vector(ax, y, &xf);
+
+    return (q23_8_t)(atan2_quadrant_bias[idx] + ((x < 0) ? (q23_8_t)-z : z));
+}
+
+q23_8_t q23_8_atan(q23_8_t x) {{
+    // Direct vectoring pass: the x argument is the constant ONE, so the
+    // atan2 quadrant fold can never trigger and is skipped entirely.
+    // |x| > 1 needs no reciprocal identity -- the vectoring internals
+    // are wide and atan stays inside the convergence range.
+    int64_t xf;
+    return cordic_vector(Q23_8_ONE, x, &xf);
+}}
+
+void q23_8_hypot_atan2(q23_8_t y, q23_8_t x,
+                      q23_8_t* h, q23_8_t* ang) {
+    if (x == 0 && y == 0) {
+        *h = 0;
+        *ang = 0;
+        return;
+    }
+
+    // One vectoring pass yields both outputs: z converges to the angle
+    // and the final x to gain * sqrt(x^2 + y^2), undone by the same K
+    // constant the rotation mode uses. Vectoring only converges for
+    // x >= 0, so run on |x| and fold the left half-plane back by pi.
+    q23_8_t ax = (x < 0) ? (q23_8_t)-x : x;
+    int64_t xf;
+    q23_8_t z = cordic_vector(ax, y, &xf);
+    if (x < 0) {
+        z = (y >= 0) ? (q23_8_t)(Q23_8_PI - z)
+                     : (q23_8_t)(-Q23_8_PI - z);
+    }
+
+    int64_t mag = (xf * CORDIC_K_8) >> 8;
+    if (mag > Q23_8_MAX) mag = Q23_8_MAX;
+
+    *h = (q23_8_t)mag;
+    *ang = z;
+}
+
+// 1/(4*K_h^2) in Q8+18, K_h over the full repetition schedule
+#define CORDIC_INV_4KH2_8 ((int64_t)24462006)
+// 18 fractional guard bits carried through normalization and
+// vectoring, with the iteration count extended to match, so the
+// residual stays below the format's LSB after the shift back.
+#define CORDIC_SQRT_GUARD_8 18
+#define CORDIC_SQRT_ITERS_8 26
+
+// CORDIC hyperbolic vectoring mode: drives y toward 0 and returns the
+// final x, which is sqrt(x0^2 - y0^2) scaled by K_h. Iterations start
+// at i=1; indices 4, 13, 40, ... repeat per the Walther convergence rule.
+static int64_t cordic_hyperbolic_vector(int64_t x, int64_t y) {
+    int repeat = 4;
+    for (int i = 1; i <= CORDIC_SQRT_ITERS_8; i++) {
+        int reps = 1;
+        if (i == repeat) {
+            reps = 2;
+            repeat = 3 * repeat + 1;
+        }
+        while (reps--) {
+            // Branchless conditional negate keyed on the sign of y
+            const int64_t sign = -(int64_t)(y < 0);
+            int64_t dx = ((y >> i) ^ sign) - sign;
+            int64_t dy = ((x >> i) ^ sign) - sign;
+            x -= dx;
+            y -= dy;
+        }
+    }
+    return x;
+}
+
+q23_8_t q23_8_sqrt(q23_8_t x) {
+    if (x <= 0) return 0;
+
+    // Normalize x = mant * 4^e with mant in [1/4, 1) so the vectoring
+    // angle stays inside the scheme's convergence bound (~1.11). The
+    // exponent comes straight from the highest set bit; mant lands in
+    // the guarded scale through a rounded shift, so the 2e low bits
+    // contribute instead of being discarded.
+    int e = (q23_8_hibit(x) - 8 + 2) >> 1;
+    int sh = 2 * e - CORDIC_SQRT_GUARD_8;
+    int64_t mant = (sh > 0)
+        ? ((int64_t)x + ((int64_t)1 << (sh - 1))) >> sh
+        : (int64_t)x << -sh;
+
+    // x0 = mant + 1/(4*Kh^2), y0 = mant - 1/(4*Kh^2) gives
+    // sqrt(x0^2 - y0^2) = sqrt(mant)/K_h, so the K_h vectoring gain
+    // cancels and x_n is sqrt(mant) directly -- no post-scaling.
+    int64_t xn = cordic_hyperbolic_vector(mant + CORDIC_INV_4KH2_8,
+                                              mant - CORDIC_INV_4KH2_8);
+
+    // Undo the normalization and drop the guard bits in one rounded
+    // shift: sqrt(mant * 4^e) = sqrt(mant) * 2^e, and e < guard always,
+    // so the count stays positive. Rounding up can graze one past the
+    // top of a zero-integer-bit range, hence the clamp.
+    int shr = CORDIC_SQRT_GUARD_8 - e;
+    int64_t res = (xn + ((int64_t)1 << (shr - 1))) >> shr;
+    if (res > Q23_8_MAX) res = Q23_8_MAX;
+    return (q23_8_t)res;
+}
+
+// 2^f on [0, 1): 5th-order minimax Horner (truncated Chebyshev fit)
+#define EXP2_POLY_C0_8 ((int64_t)256)
+#define EXP2_POLY_C1_8 ((int64_t)177)
+#define EXP2_POLY_C2_8 ((int64_t)61)
+#define EXP2_POLY_C3_8 ((int64_t)14)
+#define EXP2_POLY_C4_8 ((int64_t)2)
+#define EXP2_POLY_C5_8 ((int64_t)0)
+
+q23_8_t q23_8_exp2(q23_8_t x) {
+    // Arithmetic shift floors toward -inf, so frac_part is in [0, 1)
+    int int_part = x >> 8;
+    q23_8_t frac_part = x & (Q23_8_ONE - 1);
+
+    if (int_part >= 23) return Q23_8_MAX;
+    if (int_part < -8 - 1) return 0;
+
+    int64_t r = EXP2_POLY_C5_8;
+    r = ((r * frac_part + 128) >> 8) + EXP2_POLY_C4_8;
+    r = ((r * frac_part + 128) >> 8) + EXP2_POLY_C3_8;
+    r = ((r * frac_part + 128) >> 8) + EXP2_POLY_C2_8;
+    r = ((r * frac_part + 128) >> 8) + EXP2_POLY_C1_8;
+    r = ((r * frac_part + 128) >> 8) + EXP2_POLY_C0_8;
+
+    // Scale by 2^int_part; negative exponents shift right instead of
+    // invoking the old left-shift-by-negative
+    int64_t res = (int_part >= 0) ? (r << int_part) : (r >> -int_part);
+    if (res > Q23_8_MAX) res = Q23_8_MAX;
+    return (q23_8_t)res;
+}
+
+// e^r on [0, ln2): 5th-order minimax Horner (truncated Chebyshev fit)
+#define EXP_POLY_C0_8 ((int64_t)256)
+#define EXP_POLY_C1_8 ((int64_t)256)
+#define EXP_POLY_C2_8 ((int64_t)128)
+#define EXP_POLY_C3_8 ((int64_t)43)
+#define EXP_POLY_C4_8 ((int64_t)10)
+#define EXP_POLY_C5_8 ((int64_t)3)
+#define EXP_INV_LN2_8 ((int64_t)369)  // 2^8 / ln2
+#define EXP_LN2_8     ((int64_t)177)
+
+q23_8_t q23_8_exp(q23_8_t x) {
+    // Decompose x = k*ln2 + r with k = floor(x / ln2), r in [0, ln2),
+    // then e^x = e^r << k directly. The old path rescaled by log2(e)
+    // and had exp2 multiply the scale right back out -- two wide
+    // multiplies that cancel.
+    int k = (int)(((int64_t)x * EXP_INV_LN2_8) >> 16);
+
+    // The floored reciprocal can undershoot k by one; one correction
+    // step keeps r inside the kernel's fit range.
+    int64_t r = (int64_t)x - ((int64_t)k * EXP_LN2_8);
+    if (r >= EXP_LN2_8) {
+        r -= EXP_LN2_8;
+        k++;
+    }
+
+    if (k >= 23) return Q23_8_MAX;
+    if (k < -8 - 1) return 0;
+
+    int64_t er = EXP_POLY_C5_8;
+    er = ((er * r + 128) >> 8) + EXP_POLY_C4_8;
+    er = ((er * r + 128) >> 8) + EXP_POLY_C3_8;
+    er = ((er * r + 128) >> 8) + EXP_POLY_C2_8;
+    er = ((er * r + 128) >> 8) + EXP_POLY_C1_8;
+    er = ((er * r + 128) >> 8) + EXP_POLY_C0_8;
+
+    int64_t res = (k >= 0) ? (er << k) : (er >> -k);
+    if (res > Q23_8_MAX) res = Q23_8_MAX;
+    return (q23_8_t)res;
+}
+
+// log2(1 + u) on [0, 1): order-4 minimax Horner (truncated Chebyshev fit)
+#define LOG2_POLY_C0_8 ((int64_t)0)
+#define LOG2_POLY_C1_8 ((int64_t)368)
+#define LOG2_POLY_C2_8 ((int64_t)-172)
+#define LOG2_POLY_C3_8 ((int64_t)81)
+#define LOG2_POLY_C4_8 ((int64_t)-20)
+
+q23_8_t q23_8_log2(q23_8_t x) {
+    if (x <= 0) return Q23_8_MIN;
+
+    // Position of the highest set bit: single bit-scan, no shift loop
+    int bit_pos = q23_8_hibit(x);
+
+    int int_part = bit_pos - 8;
+    
+    // Normalize to [1, 2)
+    q23_8_t normalized;
+    if (bit_pos >= 8) {
+        normalized = x >> (bit_pos - 8);
+    } else {
+        normalized = x << (8 - bit_pos);
+    }
+    
+    // log2(1 + u) on [0, 1): order-4 minimax Horner replaces the old
+    // linear approximation (worst case ~0.086 absolute)
+    q23_8_t u = normalized - Q23_8_ONE;
+    int64_t lf = LOG2_POLY_C4_8;
+    lf = ((lf * u + 128) >> 8) + LOG2_POLY_C3_8;
+    lf = ((lf * u + 128) >> 8) + LOG2_POLY_C2_8;
+    lf = ((lf * u + 128) >> 8) + LOG2_POLY_C1_8;
+    lf = ((lf * u + 128) >> 8) + LOG2_POLY_C0_8;
+
+    return (q23_8_t)(((int64_t)int_part << 8) + lf);
+}
+
+q23_8_t q23_8_log(q23_8_t x) {
+    q23_8_t log2_val = q23_8_log2(x);
+    q23_8_t ln2 = (q23_8_t)(0.693147 * (1LL << 8));
+    return (q23_8_t)(((int64_t)log2_val * ln2) >> 8);
+}
+
+q23_8_t q23_8_pow(q23_8_t base, q23_8_t exponent) {
+    if (base <= 0) return 0;
+    // x^y = 2^(y * log2(x)); wide multiply with saturation, as in exp
+    q23_8_t log_base = q23_8_log2(base);
+    int64_t scaled = ((int64_t)exponent * log_base) >> 8;
+    if (scaled > Q23_8_MAX) scaled = Q23_8_MAX;
+    if (scaled < Q23_8_MIN) scaled = Q23_8_MIN;
+    return q23_8_exp2((q23_8_t)scaled);
+}
@@ -0,0 +1,256 @@
+#include "q31_0_math.h"
+#include "cordic_atan_table_N0.h"
+#include "fixp_cordic_impl.h"
+#include <stdint.h>
+
+// CORDIC constants
+#define CORDIC_K_0 ((q31_0_t)1)
+#define CORDIC_ITERATIONS 0
+
+// Shared across all Qm.0 formats; values fit in q31_0_t.
+#define cordic_atan_table(i) ((q31_0_t)cordic_atan_table_N0[i])
+
+// First rotation index whose gain factor is 1 at this precision
+#define CORDIC_SCALE_FREE_0 0
+
+FIXP_CORDIC_DEFINE(31, 0, int32_t, int64_t)
+
+void q31_0_sincos(q31_0_t angle, q31_0_t* s, q31_0_t* c) {
+    // Range reduction to [-π, π]
+    while (angle > Q31_0_PI) angle -= 2 * Q31_0_PI;
+    while (angle < -Q31_0_PI) angle += 2 * Q31_0_PI;
+
+    q31_0_t x, y;
+    bool negate = false;
+
+    if (angle < 0) {
+        angle = -angle;
+        negate = true;
+    }
+
+    cordic_rotate(&x, &y, angle);
+
+    *s = negate ? -y : y;
+    *c = x;
+}
+
+q31_0_t q31_0_sin(q31_0_t angle) {
+    q31_0_t s, c;
+    q31_0_sincos(angle, &s, &c);
+    return s;
+}
+
+q31_0_t q31_0_cos(q31_0_t angle) {
+    q31_0_t s, c;
+    q31_0_sincos(angle, &s, &c);
+    return c;
+}
+
+
+q31_0_t q31_0_tan(q31_0_t angle) {
+    q31_0_t s, c;
+    q31_0_sincos(angle, &s, &c);
+    
+    if (c == 0) return (s >= 0) ? Q31_0_MAX : Q31_0_MIN;
+    
+    // Wide quotient: s << n overflows the storage type once |sin| >= 0.5,
+    // and near ±π/2 the true tangent exceeds the format range anyway.
+    int64_t t = ((int64_t)s << 0) / c;
+    if (t > Q31_0_MAX) t = Q31_0_MAX;
+    if (t < Q31_0_MIN) t = Q31_0_MIN;
+    return (q31_0_t)t;
+}
+
+q31_0_t q31_0_atan2(q31_0_t y, q31_0_t x) {
+    // Half-plane bias indexed by the sign pair; replaces the nested
+    // quadrant branches. Vectoring runs on |x| (it only converges for
+    // x >= 0, and feeding a negative x also broke the y == 0, x < 0
+    // branch cut), then the left half-plane folds back through the
+    // table.
+    static const q31_0_t atan2_quadrant_bias[4] = {
+        0, Q31_0_PI, 0, (q31_0_t)-Q31_0_PI,
+    };
+
+    if (x == 0 && y == 0) return 0;
+
+    int idx = ((y < 0) << 1) | (x < 0);
+    q31_0_t ax = (x < 0) ? (q31_0_t)-x : x;
+    int64_t xf;
+    q31_0_t z = cordic_vector(ax, y, &xf);
+
+    return (q31_0_t)(atan2_quadrant_bias[idx] + ((x < 0) ? (q31_0_t)-z : z));
+}
+
+q31_0_t q31_0_atan(q31_0_t x) {{
+    // Direct vectoring pass: the x argument is the constant ONE, so the
+    // atan2 quadrant fold can never trigger and is skipped entirely.
+    // |x| > 1 needs no reciprocal identity -- the vectoring internals
+    // are wide and atan stays inside the convergence range.
+    int64_t xf;
+    return cordic_vector(Q31_0_ONE, x, &xf);
+}}
+
+void q31_0_hypot_atan2(q31_0_t y, q31_0_t x,
+                      q31_0_t* h, q31_0_t* ang) {
+    if (x == 0 && y == 0) {
+        *h = 0;
+        *ang = 0;
+        return;
+    }
+
+    // One vectoring pass yields both outputs: z converges to the angle
+    // and the final x to gain * sqrt(x^2 + y^2), undone by the same K
+    // constant the rotation mode uses. Vectoring only converges for
+    // x >= 0, so run on |x| and fold the left half-plane back by pi.
+    q31_0_t ax = (x < 0) ? (q31_0_t)-x : x;
+    int64_t xf;
+    q31_0_t z = cordic_vector(ax, y, &xf);
+    if (x < 0) {
+        z = (y >= 0) ? (q31_0_t)(Q31_0_PI - z)
+                     : (q31_0_t)(-Q31_0_PI - z);
+    }
+
+    int64_t mag = (xf * CORDIC_K_0) >> 0;
+    if (mag > Q31_0_MAX) mag = Q31_0_MAX;
+
+    *h = (q31_0_t)mag;
+    *ang = z;
+}
+
+q31_0_t q31_0_sqrt(q31_0_t x) {
+    if (x <= 0) return 0;
+
+    // Seed at 2^(hibit/2 + 1) >= sqrt(x), within a factor of 2 of the
+    // result, so the Newton steps below converge to full precision.
+    q31_0_t guess = (q31_0_t)1 << ((q31_0_hibit(x) >> 1) + 1);
+    if (guess < Q31_0_ONE) guess = Q31_0_ONE;
+
+    // Newton-Raphson iterations
+    for (int i = 0; i < 4; i++) {
+        q31_0_t div = ((int32_t)x << 0) / guess;
+        guess = (guess + div) >> 1;
+    }
+
+    return guess;
+}
+
+// 2^f on [0, 1): 5th-order minimax Horner (truncated Chebyshev fit)
+#define EXP2_POLY_C0_0 ((int64_t)1)
+#define EXP2_POLY_C1_0 ((int64_t)1)
+#define EXP2_POLY_C2_0 ((int64_t)0)
+#define EXP2_POLY_C3_0 ((int64_t)0)
+#define EXP2_POLY_C4_0 ((int64_t)0)
+#define EXP2_POLY_C5_0 ((int64_t)0)
+
+q31_0_t q31_0_exp2(q31_0_t x) {
+    // Arithmetic shift floors toward -inf, so frac_part is in [0, 1)
+    int int_part = x >> 0;
+    q31_0_t frac_part = x & (Q31_0_ONE - 1);
+
+    if (int_part >= 31) return Q31_0_MAX;
+    if (int_part < -0 - 1) return 0;
+
+    int64_t r = EXP2_POLY_C5_0;
+    r = ((r * frac_part + 0) >> 0) + EXP2_POLY_C4_0;
+    r = ((r * frac_part + 0) >> 0) + EXP2_POLY_C3_0;
+    r = ((r * frac_part + 0) >> 0) + EXP2_POLY_C2_0;
+    r = ((r * frac_part + 0) >> 0) + EXP2_POLY_C1_0;
+    r = ((r * frac_part + 0) >> 0) + EXP2_POLY_C0_0;
+
+    // Scale by 2^int_part; negative exponents shift right instead of
+    // invoking the old left-shift-by-negative
+    int64_t res = (int_part >= 0) ? (r << int_part) : (r >> -int_part);
+    if (res > Q31_0_MAX) res = Q31_0_MAX;
+    return (q31_0_t)res;
+}
+
+// e^r on [0, ln2): 5th-order minimax Horner (truncated Chebyshev fit)
+#define EXP_POLY_C0_0 ((int64_t)1)
+#define EXP_POLY_C1_0 ((int64_t)1)
+#define EXP_POLY_C2_0 ((int64_t)0)
+#define EXP_POLY_C3_0 ((int64_t)0)
+#define EXP_POLY_C4_0 ((int64_t)0)
+#define EXP_POLY_C5_0 ((int64_t)0)
+#define EXP_INV_LN2_0 ((int64_t)1)  // 2^0 / ln2
+#define EXP_LN2_0     ((int64_t)1)
+
+q31_0_t q31_0_exp(q31_0_t x) {
+    // Decompose x = k*ln2 + r with k = floor(x / ln2), r in [0, ln2),
+    // then e^x = e^r << k directly. The old path rescaled by log2(e)
+    // and had exp2 multiply the scale right back out -- two wide
+    // multiplies that cancel.
+    int k = (int)(((int64_t)x * EXP_INV_LN2_0) >> 0);
+
+    // The floored reciprocal can undershoot k by one; one correction
+    // step keeps r inside the kernel's fit range.
+    int64_t r = (int64_t)x - ((int64_t)k * EXP_LN2_0);
+    if (r >= EXP_LN2_0) {
+        r -= EXP_LN2_0;
+        k++;
+    }
+
+    if (k >= 31) return Q31_0_MAX;
+    if (k < -0 - 1) return 0;
+
+    int64_t er = EXP_POLY_C5_0;
+    er = ((er * r + 0) >> 0) + EXP_POLY_C4_0;
+    er = ((er * r + 0) >> 0) + EXP_POLY_C3_0;
+    er = ((er * r + 0) >> 0) + EXP_POLY_C2_0;
+    er = ((er * r + 0) >> 0) + EXP_POLY_C1_0;
+    er = ((er * r + 0) >> 0) + EXP_POLY_C0_0;
+
+    int64_t res = (k >= 0) ? (er << k) : (er >> -k);
+    if (res > Q31_0_MAX) res = Q31_0_MAX;
+    return (q31_0_t)res;
+}
+
+// log2(1 + u) on [0, 1): order-4 minimax Horner (truncated Chebyshev fit)
+#define LOG2_POLY_C0_0 ((int64_t)0)
+#define LOG2_POLY_C1_0 ((int64_t)1)
+#define LOG2_POLY_C2_0 ((int64_t)-1)
+#define LOG2_POLY_C3_0 ((int64_t)0)
+#define LOG2_POLY_C4_0 ((int64_t)0)
+
+q31_0_t q31_0_log2(q31_0_t x) {
+    if (x <= 0) return Q31_0_MIN;
+
+    // Position of the highest set bit: single bit-scan, no shift loop
+    int bit_pos = q31_0_hibit(x);
+
+    int int_part = bit_pos - 0;
+    
+    // Normalize to [1, 2)
+    q31_0_t normalized;
+    if (bit_pos >= 0) {
+        normalized = x >> (bit_pos - 0);
+    } else {
+        normalized = x << (0 - bit_pos);
+    }
+    
+    // log2(1 + u) on [0, 1): order-4 minimax Horner replaces the old
+    // linear approximation (worst case ~0.086 absolute)
+    q31_0_t u = normalized - Q31_0_ONE;
+    int64_t lf = LOG2_POLY_C4_0;
+    lf = ((lf * u + 0) >> 0) + LOG2_POLY_C3_0;
+    lf = ((lf * u + 0) >> 0) + LOG2_POLY_C2_0;
+    lf = ((lf * u + 0) >> 0) + LOG2_POLY_C1_0;
+    lf = ((lf * u + 0) >> 0) + LOG2_POLY_C0_0;
+
+    return (q31_0_t)(((int64_t)int_part << 0) + lf);
+}
+
+q31_0_t q31_0_log(q31_0_t x) {
+    q31_0_t log2_val = q31_0_log2(x);
+    q31_0_t ln2 = (q31_0_t)(0.693147 * (1LL << 0));
+    return (q31_0_t)(((int64_t)log2_val * ln2) >> 0);
+}
+
+q31_0_t q31_0_pow(q31_0_t base, q31_0_t exponent) {
+    if (base <= 0) return 0;
+    // x^y = 2^(y * log2(x)); wide multiply with saturation, as in exp
+    q31_0_t log_base = q31_0_log2(base);
+    int64_t scaled = ((int64_t)exponent * log_base) >> 0;
+    if (scaled > Q31_0_MAX) scaled = Q31_0_MAX;
+    if (scaled < Q31_0_MIN) scaled = Q31_0_MIN;
+    return q31_0_exp2((q31_0_t)scaled);
+}
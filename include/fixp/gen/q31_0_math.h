@@ -0,0 +1,246 @@
+#ifndef FIXP_Q31_0_MATH_H
+#define FIXP_Q31_0_MATH_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include <stddef.h>
+
+#if defined(__AVX2__)
+#include <immintrin.h>
+#elif defined(__ARM_NEON)
+#include <arm_neon.h>
+#endif
+
+// Function attributes (GCC/Clang): const lets the compiler CSE repeated
+// calls with the same arguments, always_inline keeps the small helpers
+// inline even at -Os, and pure marks the out-of-line math functions,
+// which read only their arguments and immutable tables.
+#ifndef FIXP_ATTR_CONST
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ATTR_CONST __attribute__((const, always_inline))
+#define FIXP_ATTR_CONST_FN __attribute__((const))
+#define FIXP_ATTR_PURE __attribute__((pure))
+#else
+#define FIXP_ATTR_CONST
+#define FIXP_ATTR_CONST_FN
+#define FIXP_ATTR_PURE
+#endif
+#endif
+
+// Batch-pointer contract: restrict promises the source and destination
+// arrays of the *_v kernels never overlap, and the 64-byte alignment
+// assumption lets the vectorizer drop its runtime overlap checks and
+// unaligned-head peel loops. Callers must pass non-overlapping arrays
+// in 64-byte-aligned storage (alignas(64) / aligned_alloc).
+#ifndef FIXP_RESTRICT
+#ifdef __cplusplus
+#define FIXP_RESTRICT __restrict
+#else
+#define FIXP_RESTRICT restrict
+#endif
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ASSUME_ALIGNED64_(p) ((p) = (__typeof__(p))__builtin_assume_aligned((p), 64))
+#else
+#define FIXP_ASSUME_ALIGNED64_(p) ((void)0)
+#endif
+#endif
+
+// Vectorization hint ahead of the plain batch loops: `omp simd` under
+// OpenMP (also honoured by -fopenmp-simd), otherwise the compiler's
+// own no-loop-carried-dependence assertion.
+#ifndef FIXP_VEC_LOOP_
+#if defined(_OPENMP)
+#define FIXP_VEC_LOOP_ _Pragma("omp simd")
+#elif defined(__clang__)
+#define FIXP_VEC_LOOP_ _Pragma("clang loop vectorize(enable)")
+#elif defined(__GNUC__)
+#define FIXP_VEC_LOOP_ _Pragma("GCC ivdep")
+#else
+#define FIXP_VEC_LOOP_
+#endif
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+// Q31.0 format: 32-bit signed fixed-point
+// 31 integer bits, 0 fractional bits
+typedef int32_t q31_0_t;
+
+// Constants. ONE/MAX/MIN are shared with the arithmetic header for
+// formats that have one, so each is guarded to keep the headers
+// composable in either include order.
+#define Q31_0_PI       ((q31_0_t)(3.14159265358979323846 * (1LL << 0)))
+#define Q31_0_E        ((q31_0_t)(2.71828182845904523536 * (1LL << 0)))
+#ifndef Q31_0_ONE
+#define Q31_0_ONE      ((q31_0_t)(1LL << 0))
+#endif
+#define Q31_0_HALF     ((q31_0_t)(1LL << (0 - 1)))
+#ifndef Q31_0_MAX
+#define Q31_0_MAX      ((q31_0_t)((1LL << (32 - 1)) - 1))
+#endif
+#ifndef Q31_0_MIN
+#define Q31_0_MIN      ((q31_0_t)(-(1LL << (32 - 1))))
+#endif
+
+// Basic operations
+static inline FIXP_ATTR_CONST q31_0_t q31_0_abs(q31_0_t x) {
+    return (x < 0) ? -x : x;
+}
+
+static inline FIXP_ATTR_CONST q31_0_t q31_0_min(q31_0_t a, q31_0_t b) {
+    return (a < b) ? a : b;
+}
+
+static inline FIXP_ATTR_CONST q31_0_t q31_0_max(q31_0_t a, q31_0_t b) {
+    return (a > b) ? a : b;
+}
+
+static inline FIXP_ATTR_CONST q31_0_t q31_0_clamp(q31_0_t x, q31_0_t lo, q31_0_t hi) {
+    return q31_0_min(q31_0_max(x, lo), hi);
+}
+
+// Batch operations over arrays. SIMD-accelerated on AVX2/NEON, with a
+// scalar tail that also serves as the portable fallback.
+
+static inline void q31_0_abs_v(const q31_0_t* FIXP_RESTRICT src, q31_0_t* FIXP_RESTRICT dst, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + 8 <= count; i += 8) {
+        __m256i v = _mm256_loadu_si256((const __m256i*)(src + i));
+        _mm256_storeu_si256((__m256i*)(dst + i), _mm256_abs_epi32(v));
+    }
+#elif defined(__ARM_NEON)
+    for (; i + 4 <= count; i += 4) {
+        vst1q_s32(dst + i, vabsq_s32(vld1q_s32(src + i)));
+    }
+#endif
+    for (; i < count; i++) {
+        dst[i] = q31_0_abs(src[i]);
+    }
+}
+
+static inline void q31_0_min_v(const q31_0_t* FIXP_RESTRICT a, const q31_0_t* FIXP_RESTRICT b,
+                                 q31_0_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + 8 <= count; i += 8) {
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i));
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i));
+        _mm256_storeu_si256((__m256i*)(out + i), _mm256_min_epi32(va, vb));
+    }
+#elif defined(__ARM_NEON)
+    for (; i + 4 <= count; i += 4) {
+        vst1q_s32(out + i, vminq_s32(vld1q_s32(a + i), vld1q_s32(b + i)));
+    }
+#endif
+    for (; i < count; i++) {
+        out[i] = q31_0_min(a[i], b[i]);
+    }
+}
+
+static inline void q31_0_max_v(const q31_0_t* FIXP_RESTRICT a, const q31_0_t* FIXP_RESTRICT b,
+                                 q31_0_t* FIXP_RESTRICT out, size_t count) {
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + 8 <= count; i += 8) {
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i));
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i));
+        _mm256_storeu_si256((__m256i*)(out + i), _mm256_max_epi32(va, vb));
+    }
+#elif defined(__ARM_NEON)
+    for (; i + 4 <= count; i += 4) {
+        vst1q_s32(out + i, vmaxq_s32(vld1q_s32(a + i), vld1q_s32(b + i)));
+    }
+#endif
+    for (; i < count; i++) {
+        out[i] = q31_0_max(a[i], b[i]);
+    }
+}
+
+static inline void q31_0_clamp_v(const q31_0_t* FIXP_RESTRICT src, q31_0_t* FIXP_RESTRICT dst, size_t count,
+                                   q31_0_t lo, q31_0_t hi) {
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst);
+    size_t i = 0;
+#if defined(__AVX2__)
+    const __m256i vlo = _mm256_set1_epi32(lo);
+    const __m256i vhi = _mm256_set1_epi32(hi);
+    for (; i + 8 <= count; i += 8) {
+        __m256i v = _mm256_loadu_si256((const __m256i*)(src + i));
+        v = _mm256_min_epi32(_mm256_max_epi32(v, vlo), vhi);
+        _mm256_storeu_si256((__m256i*)(dst + i), v);
+    }
+#elif defined(__ARM_NEON)
+    const int32x4_t vlo = vdupq_n_s32(lo);
+    const int32x4_t vhi = vdupq_n_s32(hi);
+    for (; i + 4 <= count; i += 4) {
+        int32x4_t v = vld1q_s32(src + i);
+        vst1q_s32(dst + i, vminq_s32(vmaxq_s32(v, vlo), vhi));
+    }
+#endif
+    for (; i < count; i++) {
+        dst[i] = q31_0_clamp(src[i], lo, hi);
+    }
+}
+
+// Rounding functions
+static inline FIXP_ATTR_CONST q31_0_t q31_0_floor(q31_0_t x) {
+    const q31_0_t frac_mask = Q31_0_ONE - 1;
+    if (x >= 0) {
+        return x & ~frac_mask;
+    } else {
+        return (x & frac_mask) ? ((x & ~frac_mask) - Q31_0_ONE) : x;
+    }
+}
+
+static inline FIXP_ATTR_CONST q31_0_t q31_0_ceil(q31_0_t x) {
+    const q31_0_t frac_mask = Q31_0_ONE - 1;
+    if (x >= 0) {
+        return (x & frac_mask) ? ((x & ~frac_mask) + Q31_0_ONE) : x;
+    } else {
+        return x & ~frac_mask;
+    }
+}
+
+static inline FIXP_ATTR_CONST q31_0_t q31_0_round(q31_0_t x) {
+    if (x >= 0) {
+        return (x + Q31_0_HALF) & ~(Q31_0_ONE - 1);
+    } else {
+        return (x - Q31_0_HALF) & ~(Q31_0_ONE - 1);
+    }
+}
+
+static inline FIXP_ATTR_CONST q31_0_t q31_0_trunc(q31_0_t x) {
+    return x & ~(Q31_0_ONE - 1);
+}
+
+// Square root (Newton-Raphson)
+FIXP_ATTR_PURE q31_0_t q31_0_sqrt(q31_0_t x);
+
+// Trigonometric functions (CORDIC-based)
+FIXP_ATTR_PURE q31_0_t q31_0_sin(q31_0_t angle);
+FIXP_ATTR_PURE q31_0_t q31_0_cos(q31_0_t angle);
+// Fused: one range reduction and one CORDIC pass for both outputs.
+void q31_0_sincos(q31_0_t angle, q31_0_t* s, q31_0_t* c);
+FIXP_ATTR_PURE q31_0_t q31_0_tan(q31_0_t angle);
+FIXP_ATTR_PURE q31_0_t q31_0_atan(q31_0_t x);
+FIXP_ATTR_PURE q31_0_t q31_0_atan2(q31_0_t y, q31_0_t x);
+// Fused vectoring: magnitude and angle from a single CORDIC pass
+void q31_0_hypot_atan2(q31_0_t y, q31_0_t x, q31_0_t* h, q31_0_t* ang);
+
+// Exponential and logarithmic
+FIXP_ATTR_PURE q31_0_t q31_0_exp(q31_0_t x);
+FIXP_ATTR_PURE q31_0_t q31_0_log(q31_0_t x);
+FIXP_ATTR_PURE q31_0_t q31_0_exp2(q31_0_t x);
+FIXP_ATTR_PURE q31_0_t q31_0_log2(q31_0_t x);
+FIXP_ATTR_PURE q31_0_t q31_0_pow(q31_0_t base, q31_0_t exponent);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // FIXP_Q31_0_MATH_H
@@ -0,0 +1,62 @@
+/**
+ * @file q7_8.h
+ * @brief Q7.8 Fixed-Point Implementation (Generated)
+ *
+ * Format: 1 sign bit, 7 integer bits, 8 fractional bits.
+ * Underlying storage: int16_t (16-bit).
+ */
+
+#ifndef FIXP_GEN_Q7_8_H
+#define FIXP_GEN_Q7_8_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include "fixp_common.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef int16_t q7_8_t;
+
+#ifdef __cplusplus
+#define Q7_8_WRAP(raw) (q7_8_t{(raw)})
+#else
+#define Q7_8_WRAP(raw) ((q7_8_t)(raw))
+#endif
+
+#define Q7_8_RAW(x) (x)
+
+#define Q7_8_FRAC_BITS 8
+// Guarded: the math header for this format defines the same constants
+#ifndef Q7_8_ONE
+#define Q7_8_ONE Q7_8_WRAP(256)
+#endif
+#ifndef Q7_8_MAX
+#define Q7_8_MAX Q7_8_WRAP(INT16_MAX)
+#endif
+#ifndef Q7_8_MIN
+#define Q7_8_MIN Q7_8_WRAP(INT16_MIN)
+#endif
+
+// One expansion emits the scalar operation set for this format
+FIXP_DEFINE_Q(7, 8, int16_t, uint16_t, int32_t)
+
+// Division with a compile-time-constant denominator. When b folds to a
+// constant, the compiler strength-reduces the wide quotient inside
+// q7_8_div to an exact, branch-free multiply-high ("magic
+// number") sequence -- no hardware divide, and bit-identical to
+// q7_8_div for every input. A rounded-reciprocal multiply
+// would save one shift but costs up to |a| / 2^9 raw units of
+// error, half the format's precision. The denominator is the format's
+// raw representation, so e.g. dividing by 2.0 means b = 2 * Q7_8_ONE.
+#define q7_8_div_const(a, b) q7_8_div((a), (b))
+
+// Batch operations over arrays (SIMD on AVX2/NEON, scalar fallback)
+FIXP_DEFINE_Q_BATCH_W16(7, 8)
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // FIXP_GEN_Q7_8_H
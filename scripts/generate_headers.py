@@ -1,6 +1,461 @@
 #!/usr/bin/env python3
-import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Shared macro layer emitted once per generation run. Every q{m}_{n}.h
+# expands FIXP_DEFINE_Q (and a width-keyed batch macro) instead of
+# carrying its own copy of the ~300 lines of inlines, which cuts what
+# the preprocessor feeds the compiler for every includer and lets LTO
+# fold the bodies across formats.
+#
+# Preprocessor conditionals cannot appear inside a macro body, so the
+# batch macros are defined in one variant per architecture (AVX2, NEON,
+# portable scalar) under ordinary #if blocks; the bodies are otherwise
+# the same code the generator used to emit per format. Comments stay
+# outside the macro definitions -- a // comment would swallow the line
+# continuation backslash.
+FIXP_COMMON = """/**
+ * @file fixp_common.h
+ * @brief Shared operation set for generated Qm.n formats (Generated)
+ *
+ * FIXP_DEFINE_Q(m, n, S, U, W) expands the scalar inline operations
+ * for one format: S is the storage type, U its unsigned counterpart
+ * (wraparound add/sub without signed-overflow UB), W the wide type
+ * used for products and quotients. The per-format Q{m}_{n}_WRAP/_ONE/
+ * _MAX/_MIN macros must be defined before the expansion; the bodies
+ * reference them by pasted name.
+ *
+ * FIXP_DEFINE_Q_BATCH_W16/W32(m, n) expand the batch (array) kernels
+ * for 16-bit and 32-bit storage formats. SIMD-accelerated on AVX2 and
+ * NEON with a scalar tail that doubles as the portable fallback;
+ * results are bit-exact with the scalar inlines.
+ */
+
+#ifndef FIXP_GEN_FIXP_COMMON_H
+#define FIXP_GEN_FIXP_COMMON_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include <stddef.h>
+
+#if defined(__AVX2__)
+#include <immintrin.h>
+#elif defined(__ARM_NEON)
+#include <arm_neon.h>
+#endif
+
+/*
+ * Function attributes (GCC/Clang): const lets the compiler CSE repeated
+ * calls with the same arguments; always_inline keeps the arithmetic
+ * inline even at -Os so callers stay vectorizable. The double
+ * conversions are const but stay eligible for out-of-lining.
+ */
+#ifndef FIXP_ATTR_CONST
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ATTR_CONST __attribute__((const, always_inline))
+#define FIXP_ATTR_CONST_FN __attribute__((const))
+#define FIXP_ATTR_PURE __attribute__((pure))
+#else
+#define FIXP_ATTR_CONST
+#define FIXP_ATTR_CONST_FN
+#define FIXP_ATTR_PURE
+#endif
+#endif
+
+/*
+ * Batch-pointer contract: restrict promises the source and destination
+ * arrays of the *_v kernels never overlap, and the 64-byte alignment
+ * assumption lets the vectorizer drop its runtime overlap checks and
+ * unaligned-head peel loops. Callers must pass non-overlapping arrays
+ * in 64-byte-aligned storage (alignas(64) / aligned_alloc).
+ */
+#ifndef FIXP_RESTRICT
+#ifdef __cplusplus
+#define FIXP_RESTRICT __restrict
+#else
+#define FIXP_RESTRICT restrict
+#endif
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ASSUME_ALIGNED64_(p) ((p) = (__typeof__(p))__builtin_assume_aligned((p), 64))
+#else
+#define FIXP_ASSUME_ALIGNED64_(p) ((void)0)
+#endif
+#endif
+
+/*
+ * Vectorization hint ahead of the plain batch loops: `omp simd` under
+ * OpenMP (also honoured by -fopenmp-simd), otherwise the compiler's
+ * own no-loop-carried-dependence assertion.
+ */
+#ifndef FIXP_VEC_LOOP_
+#if defined(_OPENMP)
+#define FIXP_VEC_LOOP_ _Pragma("omp simd")
+#elif defined(__clang__)
+#define FIXP_VEC_LOOP_ _Pragma("clang loop vectorize(enable)")
+#elif defined(__GNUC__)
+#define FIXP_VEC_LOOP_ _Pragma("GCC ivdep")
+#else
+#define FIXP_VEC_LOOP_
+#endif
+#endif
+
+/*
+ * Multiply rounding. The default rounds half to even: plain
+ * (prod + half) >> n always resolves ties upward, a bias that
+ * accumulates over long filter chains. Adding (half - 1) plus the low
+ * bit of the pre-shift quotient rounds ties to the even neighbour
+ * instead. Define FIXP_FAST_ROUND to keep the cheaper biased form.
+ * The rounding constant is built in the wide type; a plain int literal
+ * would be undefined for n >= 31.
+ */
+#ifndef FIXP_FAST_ROUND
+#define FIXP_MUL_BIAS_(W, n) (((W)1 << ((n) - 1)) - 1)
+#define FIXP_MUL_ROUND_(prod, n, W) \\
+    (((prod) + FIXP_MUL_BIAS_(W, n) + (((prod) >> (n)) & 1)) >> (n))
+#else
+#define FIXP_MUL_BIAS_(W, n) ((W)1 << ((n) - 1))
+#define FIXP_MUL_ROUND_(prod, n, W) (((prod) + FIXP_MUL_BIAS_(W, n)) >> (n))
+#endif
+
+/*
+ * Double -> fixed conversion. llrint maps to a single CVTSD2SI with the
+ * current rounding mode instead of a compare-and-branch on the sign;
+ * llrint rather than lrint so the scaled value fits even where long is
+ * 32 bits. The fallback keeps the old round-half-away form.
+ */
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_LRINT_(d) __builtin_llrint(d)
+#else
+#define FIXP_LRINT_(d) ((long long)((d) >= 0 ? (d) + 0.5 : (d) - 0.5))
+#endif
+
+#define FIXP_DEFINE_Q(m, n, S, U, W) \\
+static inline FIXP_ATTR_CONST q##m##_##n##_t q##m##_##n##_add(q##m##_##n##_t a, q##m##_##n##_t b) { \\
+    return Q##m##_##n##_WRAP((S)((U)a + (U)b)); \\
+} \\
+static inline FIXP_ATTR_CONST q##m##_##n##_t q##m##_##n##_sub(q##m##_##n##_t a, q##m##_##n##_t b) { \\
+    return Q##m##_##n##_WRAP((S)((U)a - (U)b)); \\
+} \\
+static inline FIXP_ATTR_CONST q##m##_##n##_t q##m##_##n##_mul(q##m##_##n##_t a, q##m##_##n##_t b) { \\
+    W prod = (W)a * (W)b; \\
+    return Q##m##_##n##_WRAP((S)FIXP_MUL_ROUND_(prod, n, W)); \\
+} \\
+static inline FIXP_ATTR_CONST q##m##_##n##_t q##m##_##n##_div(q##m##_##n##_t a, q##m##_##n##_t b) { \\
+    if (b == 0) return (a >= 0) ? Q##m##_##n##_MAX : Q##m##_##n##_MIN; \\
+    W dividend = (W)a << (n); \\
+    return Q##m##_##n##_WRAP((S)(dividend / b)); \\
+} \\
+static inline FIXP_ATTR_CONST_FN q##m##_##n##_t q##m##_##n##_from_double(double d) { \\
+    return Q##m##_##n##_WRAP((S)FIXP_LRINT_(d * (double)((W)1 << (n)))); \\
+} \\
+static inline FIXP_ATTR_CONST_FN double q##m##_##n##_to_double(q##m##_##n##_t a) { \\
+    return (double)a / (double)((W)1 << (n)); \\
+}
+
+#if defined(__AVX2__)
+
+/*
+ * Vector half of the round-half-to-even correction: add back the low
+ * bit of the pre-shift quotient (bit n). Identity under
+ * FIXP_FAST_ROUND, keeping the batch kernels bit-exact with the
+ * scalar mul in both modes.
+ */
+#ifndef FIXP_FAST_ROUND
+#define FIXP_MUL_TIEFIX32_(p, n) \\
+    _mm256_add_epi32(p, _mm256_and_si256(_mm256_srli_epi32(p, n), _mm256_set1_epi32(1)))
+#define FIXP_MUL_TIEFIX64_(p, n) \\
+    _mm256_add_epi64(p, _mm256_and_si256(_mm256_srli_epi64(p, n), _mm256_set1_epi64x(1)))
+#else
+#define FIXP_MUL_TIEFIX32_(p, n) (p)
+#define FIXP_MUL_TIEFIX64_(p, n) (p)
+#endif
+
+#define FIXP_DEFINE_Q_BATCH_ADDSUB_W16_(m, n, op, intrin) \\
+static inline void q##m##_##n##_##op##_v(const q##m##_##n##_t* FIXP_RESTRICT a, const q##m##_##n##_t* FIXP_RESTRICT b, \\
+                                q##m##_##n##_t* FIXP_RESTRICT out, size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out); \\
+    size_t i = 0; \\
+    for (; i + 16 <= count; i += 16) { \\
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i)); \\
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i)); \\
+        _mm256_storeu_si256((__m256i*)(out + i), intrin(va, vb)); \\
+    } \\
+    for (; i < count; i++) { \\
+        out[i] = q##m##_##n##_##op(a[i], b[i]); \\
+    } \\
+}
+
+#define FIXP_DEFINE_Q_BATCH_ADDSUB_W32_(m, n, op, intrin) \\
+static inline void q##m##_##n##_##op##_v(const q##m##_##n##_t* FIXP_RESTRICT a, const q##m##_##n##_t* FIXP_RESTRICT b, \\
+                                q##m##_##n##_t* FIXP_RESTRICT out, size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out); \\
+    size_t i = 0; \\
+    for (; i + 8 <= count; i += 8) { \\
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i)); \\
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i)); \\
+        _mm256_storeu_si256((__m256i*)(out + i), intrin(va, vb)); \\
+    } \\
+    for (; i < count; i++) { \\
+        out[i] = q##m##_##n##_##op(a[i], b[i]); \\
+    } \\
+}
+
+#define FIXP_DEFINE_Q_BATCH_MUL_W16_(m, n) \\
+static inline void q##m##_##n##_mul_v(const q##m##_##n##_t* FIXP_RESTRICT a, const q##m##_##n##_t* FIXP_RESTRICT b, \\
+                                q##m##_##n##_t* FIXP_RESTRICT out, size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out); \\
+    size_t i = 0; \\
+    const __m256i bias = _mm256_set1_epi32((int32_t)FIXP_MUL_BIAS_(int32_t, n)); \\
+    const __m256i lo16 = _mm256_set1_epi32(0xFFFF); \\
+    for (; i + 16 <= count; i += 16) { \\
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i)); \\
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i)); \\
+        __m256i alo = _mm256_cvtepi16_epi32(_mm256_castsi256_si128(va)); \\
+        __m256i ahi = _mm256_cvtepi16_epi32(_mm256_extracti128_si256(va, 1)); \\
+        __m256i blo = _mm256_cvtepi16_epi32(_mm256_castsi256_si128(vb)); \\
+        __m256i bhi = _mm256_cvtepi16_epi32(_mm256_extracti128_si256(vb, 1)); \\
+        __m256i plo = _mm256_srai_epi32(FIXP_MUL_TIEFIX32_(_mm256_add_epi32(_mm256_mullo_epi32(alo, blo), bias), (n)), (n)); \\
+        __m256i phi = _mm256_srai_epi32(FIXP_MUL_TIEFIX32_(_mm256_add_epi32(_mm256_mullo_epi32(ahi, bhi), bias), (n)), (n)); \\
+        plo = _mm256_and_si256(plo, lo16); \\
+        phi = _mm256_and_si256(phi, lo16); \\
+        __m256i r = _mm256_packus_epi32(plo, phi); \\
+        _mm256_storeu_si256((__m256i*)(out + i), _mm256_permute4x64_epi64(r, 0xD8)); \\
+    } \\
+    for (; i < count; i++) { \\
+        out[i] = q##m##_##n##_mul(a[i], b[i]); \\
+    } \\
+}
+
+#define FIXP_DEFINE_Q_BATCH_MUL_W32_(m, n) \\
+static inline void q##m##_##n##_mul_v(const q##m##_##n##_t* FIXP_RESTRICT a, const q##m##_##n##_t* FIXP_RESTRICT b, \\
+                                q##m##_##n##_t* FIXP_RESTRICT out, size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out); \\
+    size_t i = 0; \\
+    const __m256i bias = _mm256_set1_epi64x(FIXP_MUL_BIAS_(int64_t, n)); \\
+    const __m256i pack_idx = _mm256_setr_epi32(0, 2, 4, 6, 0, 2, 4, 6); \\
+    for (; i + 8 <= count; i += 8) { \\
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i)); \\
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i)); \\
+        __m256i alo = _mm256_cvtepi32_epi64(_mm256_castsi256_si128(va)); \\
+        __m256i ahi = _mm256_cvtepi32_epi64(_mm256_extracti128_si256(va, 1)); \\
+        __m256i blo = _mm256_cvtepi32_epi64(_mm256_castsi256_si128(vb)); \\
+        __m256i bhi = _mm256_cvtepi32_epi64(_mm256_extracti128_si256(vb, 1)); \\
+        __m256i plo = FIXP_MUL_TIEFIX64_(_mm256_add_epi64(_mm256_mul_epi32(alo, blo), bias), (n)); \\
+        __m256i phi = FIXP_MUL_TIEFIX64_(_mm256_add_epi64(_mm256_mul_epi32(ahi, bhi), bias), (n)); \\
+        __m256i zero = _mm256_setzero_si256(); \\
+        plo = _mm256_or_si256(_mm256_srli_epi64(plo, (n)), \\
+                              _mm256_slli_epi64(_mm256_cmpgt_epi64(zero, plo), 64 - (n))); \\
+        phi = _mm256_or_si256(_mm256_srli_epi64(phi, (n)), \\
+                              _mm256_slli_epi64(_mm256_cmpgt_epi64(zero, phi), 64 - (n))); \\
+        __m256i rlo = _mm256_permutevar8x32_epi32(plo, pack_idx); \\
+        __m256i rhi = _mm256_permutevar8x32_epi32(phi, pack_idx); \\
+        _mm256_storeu_si256((__m256i*)(out + i), \\
+                            _mm256_permute2x128_si256(rlo, rhi, 0x20)); \\
+    } \\
+    for (; i < count; i++) { \\
+        out[i] = q##m##_##n##_mul(a[i], b[i]); \\
+    } \\
+}
+
+/*
+ * Batch double -> fixed. VCVTPD2DQ converts 4 doubles per instruction
+ * with the current rounding mode, matching the scalar llrint path. The
+ * 16-bit variant narrows through a saturating pack; equivalent to the
+ * scalar wrap for in-range inputs.
+ */
+#define FIXP_DEFINE_Q_BATCH_FROMD_W16_(m, n) \\
+static inline void q##m##_##n##_from_double_v(const double* FIXP_RESTRICT src, q##m##_##n##_t* FIXP_RESTRICT dst, \\
+                                size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst); \\
+    size_t i = 0; \\
+    const __m256d scale = _mm256_set1_pd((double)((int64_t)1 << (n))); \\
+    for (; i + 8 <= count; i += 8) { \\
+        __m128i lo = _mm256_cvtpd_epi32(_mm256_mul_pd(_mm256_loadu_pd(src + i), scale)); \\
+        __m128i hi = _mm256_cvtpd_epi32(_mm256_mul_pd(_mm256_loadu_pd(src + i + 4), scale)); \\
+        _mm_storeu_si128((__m128i*)(dst + i), _mm_packs_epi32(lo, hi)); \\
+    } \\
+    for (; i < count; i++) { \\
+        dst[i] = q##m##_##n##_from_double(src[i]); \\
+    } \\
+}
+
+#define FIXP_DEFINE_Q_BATCH_FROMD_W32_(m, n) \\
+static inline void q##m##_##n##_from_double_v(const double* FIXP_RESTRICT src, q##m##_##n##_t* FIXP_RESTRICT dst, \\
+                                size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst); \\
+    size_t i = 0; \\
+    const __m256d scale = _mm256_set1_pd((double)((int64_t)1 << (n))); \\
+    for (; i + 4 <= count; i += 4) { \\
+        __m256d v = _mm256_mul_pd(_mm256_loadu_pd(src + i), scale); \\
+        _mm_storeu_si128((__m128i*)(dst + i), _mm256_cvtpd_epi32(v)); \\
+    } \\
+    for (; i < count; i++) { \\
+        dst[i] = q##m##_##n##_from_double(src[i]); \\
+    } \\
+}
+
+#define FIXP_DEFINE_Q_BATCH_W16(m, n) \\
+FIXP_DEFINE_Q_BATCH_ADDSUB_W16_(m, n, add, _mm256_add_epi16) \\
+FIXP_DEFINE_Q_BATCH_ADDSUB_W16_(m, n, sub, _mm256_sub_epi16) \\
+FIXP_DEFINE_Q_BATCH_MUL_W16_(m, n) \\
+FIXP_DEFINE_Q_BATCH_FROMD_W16_(m, n)
+
+#define FIXP_DEFINE_Q_BATCH_W32(m, n) \\
+FIXP_DEFINE_Q_BATCH_ADDSUB_W32_(m, n, add, _mm256_add_epi32) \\
+FIXP_DEFINE_Q_BATCH_ADDSUB_W32_(m, n, sub, _mm256_sub_epi32) \\
+FIXP_DEFINE_Q_BATCH_MUL_W32_(m, n) \\
+FIXP_DEFINE_Q_BATCH_FROMD_W32_(m, n)
+
+#elif defined(__ARM_NEON)
+
+/*
+ * NEON spelling of the round-half-to-even correction the AVX2 section
+ * defines above: add back the low bit of the pre-shift quotient
+ * (bit n). Identity under FIXP_FAST_ROUND, keeping the batch kernels
+ * bit-exact with the scalar mul in both modes.
+ */
+#ifndef FIXP_FAST_ROUND
+#define FIXP_MUL_TIEFIX32_(p, n) \\
+    vaddq_s32(p, vandq_s32(vshrq_n_s32(p, n), vdupq_n_s32(1)))
+#define FIXP_MUL_TIEFIX64_(p, n) \\
+    vaddq_s64(p, vandq_s64(vshrq_n_s64(p, n), vdupq_n_s64(1)))
+#else
+#define FIXP_MUL_TIEFIX32_(p, n) (p)
+#define FIXP_MUL_TIEFIX64_(p, n) (p)
+#endif
+
+#define FIXP_DEFINE_Q_BATCH_ADDSUB_W16_(m, n, op, intrin) \\
+static inline void q##m##_##n##_##op##_v(const q##m##_##n##_t* FIXP_RESTRICT a, const q##m##_##n##_t* FIXP_RESTRICT b, \\
+                                q##m##_##n##_t* FIXP_RESTRICT out, size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out); \\
+    size_t i = 0; \\
+    for (; i + 8 <= count; i += 8) { \\
+        int16x8_t va = vld1q_s16(a + i); \\
+        int16x8_t vb = vld1q_s16(b + i); \\
+        vst1q_s16(out + i, intrin(va, vb)); \\
+    } \\
+    for (; i < count; i++) { \\
+        out[i] = q##m##_##n##_##op(a[i], b[i]); \\
+    } \\
+}
+
+#define FIXP_DEFINE_Q_BATCH_ADDSUB_W32_(m, n, op, intrin) \\
+static inline void q##m##_##n##_##op##_v(const q##m##_##n##_t* FIXP_RESTRICT a, const q##m##_##n##_t* FIXP_RESTRICT b, \\
+                                q##m##_##n##_t* FIXP_RESTRICT out, size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out); \\
+    size_t i = 0; \\
+    for (; i + 4 <= count; i += 4) { \\
+        int32x4_t va = vld1q_s32(a + i); \\
+        int32x4_t vb = vld1q_s32(b + i); \\
+        vst1q_s32(out + i, intrin(va, vb)); \\
+    } \\
+    for (; i < count; i++) { \\
+        out[i] = q##m##_##n##_##op(a[i], b[i]); \\
+    } \\
+}
+
+#define FIXP_DEFINE_Q_BATCH_MUL_W16_(m, n) \\
+static inline void q##m##_##n##_mul_v(const q##m##_##n##_t* FIXP_RESTRICT a, const q##m##_##n##_t* FIXP_RESTRICT b, \\
+                                q##m##_##n##_t* FIXP_RESTRICT out, size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out); \\
+    size_t i = 0; \\
+    const int32x4_t bias = vdupq_n_s32((int32_t)FIXP_MUL_BIAS_(int32_t, n)); \\
+    for (; i + 8 <= count; i += 8) { \\
+        int16x8_t va = vld1q_s16(a + i); \\
+        int16x8_t vb = vld1q_s16(b + i); \\
+        int32x4_t p0 = FIXP_MUL_TIEFIX32_(vaddq_s32(vmull_s16(vget_low_s16(va), vget_low_s16(vb)), bias), (n)); \\
+        int32x4_t p1 = FIXP_MUL_TIEFIX32_(vaddq_s32(vmull_s16(vget_high_s16(va), vget_high_s16(vb)), bias), (n)); \\
+        p0 = vshrq_n_s32(p0, (n)); \\
+        p1 = vshrq_n_s32(p1, (n)); \\
+        vst1q_s16(out + i, vcombine_s16(vmovn_s32(p0), vmovn_s32(p1))); \\
+    } \\
+    for (; i < count; i++) { \\
+        out[i] = q##m##_##n##_mul(a[i], b[i]); \\
+    } \\
+}
+
+#define FIXP_DEFINE_Q_BATCH_MUL_W32_(m, n) \\
+static inline void q##m##_##n##_mul_v(const q##m##_##n##_t* FIXP_RESTRICT a, const q##m##_##n##_t* FIXP_RESTRICT b, \\
+                                q##m##_##n##_t* FIXP_RESTRICT out, size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out); \\
+    size_t i = 0; \\
+    const int64x2_t bias = vdupq_n_s64(FIXP_MUL_BIAS_(int64_t, n)); \\
+    for (; i + 4 <= count; i += 4) { \\
+        int32x4_t va = vld1q_s32(a + i); \\
+        int32x4_t vb = vld1q_s32(b + i); \\
+        int64x2_t p0 = FIXP_MUL_TIEFIX64_(vaddq_s64(vmull_s32(vget_low_s32(va), vget_low_s32(vb)), bias), (n)); \\
+        int64x2_t p1 = FIXP_MUL_TIEFIX64_(vaddq_s64(vmull_s32(vget_high_s32(va), vget_high_s32(vb)), bias), (n)); \\
+        p0 = vshrq_n_s64(p0, (n)); \\
+        p1 = vshrq_n_s64(p1, (n)); \\
+        vst1q_s32(out + i, vcombine_s32(vmovn_s64(p0), vmovn_s64(p1))); \\
+    } \\
+    for (; i < count; i++) { \\
+        out[i] = q##m##_##n##_mul(a[i], b[i]); \\
+    } \\
+}
+
+/*
+ * Plain loop for double -> fixed; on AArch64 the compiler vectorizes it
+ * with FCVTNS, which already honours the rounding mode.
+ */
+#define FIXP_DEFINE_Q_BATCH_FROMD_LOOP_(m, n) \\
+static inline void q##m##_##n##_from_double_v(const double* FIXP_RESTRICT src, q##m##_##n##_t* FIXP_RESTRICT dst, \\
+                                size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst); \\
+    FIXP_VEC_LOOP_ \\
+    for (size_t i = 0; i < count; i++) { \\
+        dst[i] = q##m##_##n##_from_double(src[i]); \\
+    } \\
+}
+
+#define FIXP_DEFINE_Q_BATCH_W16(m, n) \\
+FIXP_DEFINE_Q_BATCH_ADDSUB_W16_(m, n, add, vaddq_s16) \\
+FIXP_DEFINE_Q_BATCH_ADDSUB_W16_(m, n, sub, vsubq_s16) \\
+FIXP_DEFINE_Q_BATCH_MUL_W16_(m, n) \\
+FIXP_DEFINE_Q_BATCH_FROMD_LOOP_(m, n)
+
+#define FIXP_DEFINE_Q_BATCH_W32(m, n) \\
+FIXP_DEFINE_Q_BATCH_ADDSUB_W32_(m, n, add, vaddq_s32) \\
+FIXP_DEFINE_Q_BATCH_ADDSUB_W32_(m, n, sub, vsubq_s32) \\
+FIXP_DEFINE_Q_BATCH_MUL_W32_(m, n) \\
+FIXP_DEFINE_Q_BATCH_FROMD_LOOP_(m, n)
+
+#else
+
+#define FIXP_DEFINE_Q_BATCH_OP_SCALAR_(m, n, op) \\
+static inline void q##m##_##n##_##op##_v(const q##m##_##n##_t* FIXP_RESTRICT a, const q##m##_##n##_t* FIXP_RESTRICT b, \\
+                                q##m##_##n##_t* FIXP_RESTRICT out, size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out); \\
+    FIXP_VEC_LOOP_ \\
+    for (size_t i = 0; i < count; i++) { \\
+        out[i] = q##m##_##n##_##op(a[i], b[i]); \\
+    } \\
+}
+
+#define FIXP_DEFINE_Q_BATCH_FROMD_SCALAR_(m, n) \\
+static inline void q##m##_##n##_from_double_v(const double* FIXP_RESTRICT src, q##m##_##n##_t* FIXP_RESTRICT dst, \\
+                                size_t count) { \\
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst); \\
+    FIXP_VEC_LOOP_ \\
+    for (size_t i = 0; i < count; i++) { \\
+        dst[i] = q##m##_##n##_from_double(src[i]); \\
+    } \\
+}
+
+#define FIXP_DEFINE_Q_BATCH_SCALAR_(m, n) \\
+FIXP_DEFINE_Q_BATCH_OP_SCALAR_(m, n, add) \\
+FIXP_DEFINE_Q_BATCH_OP_SCALAR_(m, n, sub) \\
+FIXP_DEFINE_Q_BATCH_OP_SCALAR_(m, n, mul) \\
+FIXP_DEFINE_Q_BATCH_FROMD_SCALAR_(m, n)
+
+#define FIXP_DEFINE_Q_BATCH_W16(m, n) FIXP_DEFINE_Q_BATCH_SCALAR_(m, n)
+#define FIXP_DEFINE_Q_BATCH_W32(m, n) FIXP_DEFINE_Q_BATCH_SCALAR_(m, n)
+
+#endif
+
+#endif // FIXP_GEN_FIXP_COMMON_H
+"""
 
 def generate_header(m, n, output_dir, filename_override=None):
     total_bits = m + n + 1 # +1 for sign
@@ -52,6 +507,16 @@ def generate_header(m, n, output_dir, filename_override=None):
     # Calculate constants
     one_val = 1 << n
 
+    # Only 16-bit and 32-bit storage formats get batch kernels: AVX2
+    # processes 16 or 8 lanes per iteration, NEON 8 or 4.
+    if storage_bits in (16, 32):
+        batch_section = f"""
+// Batch operations over arrays (SIMD on AVX2/NEON, scalar fallback)
+FIXP_DEFINE_Q_BATCH_W{storage_bits}({m}, {n})
+"""
+    else:
+        batch_section = ""
+
     content = f"""/**
  * @file {filename}
  * @brief Q{m}.{n} Fixed-Point Implementation (Generated)
@@ -65,6 +530,7 @@ def generate_header(m, n, output_dir, filename_override=None):
 
 #include <stdint.h>
 #include <stdbool.h>
+#include "fixp_common.h"
 
 #ifdef __cplusplus
 extern "C" {{
@@ -81,38 +547,30 @@ typedef {storage_type} {type_name};
 #define {macro_prefix}_RAW(x) (x)
 
 #define {macro_prefix}_FRAC_BITS {n}
+// Guarded: the math header for this format defines the same constants
+#ifndef {macro_prefix}_ONE
 #define {macro_prefix}_ONE {macro_prefix}_WRAP({one_val})
+#endif
+#ifndef {macro_prefix}_MAX
 #define {macro_prefix}_MAX {macro_prefix}_WRAP({storage_max})
+#endif
+#ifndef {macro_prefix}_MIN
 #define {macro_prefix}_MIN {macro_prefix}_WRAP({storage_min})
+#endif
 
-static inline {type_name} q{m}_{n}_add({type_name} a, {type_name} b) {{
-    // Use unsigned arithmetic to avoid signed overflow UB
-    return {macro_prefix}_WRAP(({storage_type})(({unsigned_type})a + ({unsigned_type})b));
-}}
-
-static inline {type_name} q{m}_{n}_sub({type_name} a, {type_name} b) {{
-    return {macro_prefix}_WRAP(({storage_type})(({unsigned_type})a - ({unsigned_type})b));
-}}
-
-static inline {type_name} q{m}_{n}_mul({type_name} a, {type_name} b) {{
-    {wide_type} prod = ({wide_type})a * ({wide_type})b;
-    return {macro_prefix}_WRAP(({storage_type})((prod + (1 << ({n}-1))) >> {n}));
-}}
-
-static inline {type_name} q{m}_{n}_div({type_name} a, {type_name} b) {{
-    if (b == 0) return (a >= 0) ? {macro_prefix}_MAX : {macro_prefix}_MIN;
-    {wide_type} dividend = ({wide_type})a << {n};
-    return {macro_prefix}_WRAP(({storage_type})(dividend / b));
-}}
-
-static inline {type_name} q{m}_{n}_from_double(double d) {{
-    return {macro_prefix}_WRAP(({storage_type})(d * {float(1<<n)} + (d >= 0 ? 0.5 : -0.5)));
-}}
-
-static inline double q{m}_{n}_to_double({type_name} a) {{
-    return (double)a / {float(1<<n)};
-}}
+// One expansion emits the scalar operation set for this format
+FIXP_DEFINE_Q({m}, {n}, {storage_type}, {unsigned_type}, {wide_type})
 
+// Division with a compile-time-constant denominator. When b folds to a
+// constant, the compiler strength-reduces the wide quotient inside
+// {type_name[:-2]}_div to an exact, branch-free multiply-high ("magic
+// number") sequence -- no hardware divide, and bit-identical to
+// {type_name[:-2]}_div for every input. A rounded-reciprocal multiply
+// would save one shift but costs up to |a| / 2^{n + 1} raw units of
+// error, half the format's precision. The denominator is the format's
+// raw representation, so e.g. dividing by 2.0 means b = 2 * {macro_prefix}_ONE.
+#define {type_name[:-2]}_div_const(a, b) {type_name[:-2]}_div((a), (b))
+{batch_section}
 #ifdef __cplusplus
 }}
 #endif
@@ -120,30 +578,30 @@ static inline double q{m}_{n}_to_double({type_name} a) {{
 #endif // {guard}
 """
 
-    with open(os.path.join(output_dir, filename), "w") as f:
-        f.write(content)
+    # Single-shot write: the content is already one in-memory string
+    (output_dir / filename).write_text(content)
 
 def main():
-    output_dir = "include/fixp/gen"
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Q15.16 (32-bit standard "Q16.16")
-    generate_header(15, 16, output_dir)
-
-    # Literal Q16.16 (33-bit -> 64-bit)
-    generate_header(16, 16, output_dir)
-
-    # Q0.7 (Standard 8-bit)
-    generate_header(0, 7, output_dir)
+    output_dir = Path("include/fixp/gen")
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Q8.8 (Standard 16-bit) -> m=7, n=8
-    generate_header(7, 8, output_dir)
+    (output_dir / "fixp_common.h").write_text(FIXP_COMMON)
 
-    # Q24.8 (32-bit). 1 sign + 23 int + 8 frac.
-    generate_header(23, 8, output_dir)
+    formats = [
+        (15, 16),  # Q15.16 (32-bit standard "Q16.16")
+        (16, 16),  # Literal Q16.16 (33-bit -> 64-bit)
+        (0, 7),    # Q0.7 (Standard 8-bit)
+        (7, 8),    # Q8.8 (Standard 16-bit) -> m=7, n=8
+        (23, 8),   # Q24.8 (32-bit). 1 sign + 23 int + 8 frac.
+        (1, 30),   # Q2.30 (32-bit). 1 sign + 1 int + 30 frac.
+    ]
 
-    # Q2.30 (32-bit). 1 sign + 1 int + 30 frac.
-    generate_header(1, 30, output_dir)
+    # One worker per format; each assembles its header in memory and
+    # writes it in a single call.
+    with ProcessPoolExecutor() as ex:
+        jobs = [ex.submit(generate_header, m, n, output_dir) for m, n in formats]
+        for job in jobs:
+            job.result()
 
     print(f"Generated key headers in {output_dir}")
 
@@ -4,30 +4,210 @@ Generate C23 fixed-point math function headers.
 Clean-room implementation generating wrappers around core algorithms.
 """
 
+import functools
+import math
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+def generate_batch_math_section(m_bits, n_bits, storage_bits, type_name):
+    """Generate batch abs/min/max/clamp kernels with SIMD fast paths.
+
+    Mirrors the batch arithmetic in generate_headers.py: 16/32-bit storage
+    formats get AVX2/NEON bodies, everything falls through to a scalar tail
+    loop that is bit-exact with the scalar inlines.
+    """
+    if storage_bits == 32:
+        lanes = 8
+        sfx = "epi32"
+        neon_lanes = 4
+        neon_vec = "int32x4_t"
+        neon_sfx = "s32"
+    elif storage_bits == 16:
+        lanes = 16
+        sfx = "epi16"
+        neon_lanes = 8
+        neon_vec = "int16x8_t"
+        neon_sfx = "s16"
+    else:
+        return ""
+
+    return f"""
+// Batch operations over arrays. SIMD-accelerated on AVX2/NEON, with a
+// scalar tail that also serves as the portable fallback.
+
+static inline void q{m_bits}_{n_bits}_abs_v(const {type_name}* FIXP_RESTRICT src, {type_name}* FIXP_RESTRICT dst, size_t count) {{
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + {lanes} <= count; i += {lanes}) {{
+        __m256i v = _mm256_loadu_si256((const __m256i*)(src + i));
+        _mm256_storeu_si256((__m256i*)(dst + i), _mm256_abs_{sfx}(v));
+    }}
+#elif defined(__ARM_NEON)
+    for (; i + {neon_lanes} <= count; i += {neon_lanes}) {{
+        vst1q_{neon_sfx}(dst + i, vabsq_{neon_sfx}(vld1q_{neon_sfx}(src + i)));
+    }}
+#endif
+    for (; i < count; i++) {{
+        dst[i] = q{m_bits}_{n_bits}_abs(src[i]);
+    }}
+}}
+
+static inline void q{m_bits}_{n_bits}_min_v(const {type_name}* FIXP_RESTRICT a, const {type_name}* FIXP_RESTRICT b,
+                                 {type_name}* FIXP_RESTRICT out, size_t count) {{
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + {lanes} <= count; i += {lanes}) {{
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i));
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i));
+        _mm256_storeu_si256((__m256i*)(out + i), _mm256_min_{sfx}(va, vb));
+    }}
+#elif defined(__ARM_NEON)
+    for (; i + {neon_lanes} <= count; i += {neon_lanes}) {{
+        vst1q_{neon_sfx}(out + i, vminq_{neon_sfx}(vld1q_{neon_sfx}(a + i), vld1q_{neon_sfx}(b + i)));
+    }}
+#endif
+    for (; i < count; i++) {{
+        out[i] = q{m_bits}_{n_bits}_min(a[i], b[i]);
+    }}
+}}
+
+static inline void q{m_bits}_{n_bits}_max_v(const {type_name}* FIXP_RESTRICT a, const {type_name}* FIXP_RESTRICT b,
+                                 {type_name}* FIXP_RESTRICT out, size_t count) {{
+    FIXP_ASSUME_ALIGNED64_(a); FIXP_ASSUME_ALIGNED64_(b); FIXP_ASSUME_ALIGNED64_(out);
+    size_t i = 0;
+#if defined(__AVX2__)
+    for (; i + {lanes} <= count; i += {lanes}) {{
+        __m256i va = _mm256_loadu_si256((const __m256i*)(a + i));
+        __m256i vb = _mm256_loadu_si256((const __m256i*)(b + i));
+        _mm256_storeu_si256((__m256i*)(out + i), _mm256_max_{sfx}(va, vb));
+    }}
+#elif defined(__ARM_NEON)
+    for (; i + {neon_lanes} <= count; i += {neon_lanes}) {{
+        vst1q_{neon_sfx}(out + i, vmaxq_{neon_sfx}(vld1q_{neon_sfx}(a + i), vld1q_{neon_sfx}(b + i)));
+    }}
+#endif
+    for (; i < count; i++) {{
+        out[i] = q{m_bits}_{n_bits}_max(a[i], b[i]);
+    }}
+}}
+
+static inline void q{m_bits}_{n_bits}_clamp_v(const {type_name}* FIXP_RESTRICT src, {type_name}* FIXP_RESTRICT dst, size_t count,
+                                   {type_name} lo, {type_name} hi) {{
+    FIXP_ASSUME_ALIGNED64_(src); FIXP_ASSUME_ALIGNED64_(dst);
+    size_t i = 0;
+#if defined(__AVX2__)
+    const __m256i vlo = _mm256_set1_{sfx}(lo);
+    const __m256i vhi = _mm256_set1_{sfx}(hi);
+    for (; i + {lanes} <= count; i += {lanes}) {{
+        __m256i v = _mm256_loadu_si256((const __m256i*)(src + i));
+        v = _mm256_min_{sfx}(_mm256_max_{sfx}(v, vlo), vhi);
+        _mm256_storeu_si256((__m256i*)(dst + i), v);
+    }}
+#elif defined(__ARM_NEON)
+    const {neon_vec} vlo = vdupq_n_{neon_sfx}(lo);
+    const {neon_vec} vhi = vdupq_n_{neon_sfx}(hi);
+    for (; i + {neon_lanes} <= count; i += {neon_lanes}) {{
+        {neon_vec} v = vld1q_{neon_sfx}(src + i);
+        vst1q_{neon_sfx}(dst + i, vminq_{neon_sfx}(vmaxq_{neon_sfx}(v, vlo), vhi));
+    }}
+#endif
+    for (; i < count; i++) {{
+        dst[i] = q{m_bits}_{n_bits}_clamp(src[i], lo, hi);
+    }}
+}}
+"""
+
 def generate_math_header(m_bits, n_bits):
     """Generate math functions for Qm.n format"""
     total_bits = m_bits + n_bits + 1  # +1 for sign bit
     type_name = f"q{m_bits}_{n_bits}_t"
-    
+
     if total_bits <= 8:
         base_type = "int8_t"
+        storage_bits = 8
     elif total_bits <= 16:
         base_type = "int16_t"
+        storage_bits = 16
     elif total_bits <= 32:
         base_type = "int32_t"
+        storage_bits = 32
     elif total_bits <= 64:
         base_type = "int64_t"
+        storage_bits = 64
     else:
         raise ValueError(f"Total bits {total_bits} exceeds 64")
-    
+
+    batch_section = generate_batch_math_section(m_bits, n_bits, storage_bits, type_name)
+    trig_batch_protos, _ = generate_trig_batch_impl(m_bits, n_bits, type_name, storage_bits)
+    if batch_section:
+        simd_includes = """#include <stddef.h>
+
+#if defined(__AVX2__)
+#include <immintrin.h>
+#elif defined(__ARM_NEON)
+#include <arm_neon.h>
+#endif
+"""
+    else:
+        simd_includes = ""
+
     header = f"""#ifndef FIXP_Q{m_bits}_{n_bits}_MATH_H
 #define FIXP_Q{m_bits}_{n_bits}_MATH_H
 
 #include <stdint.h>
 #include <stdbool.h>
+{simd_includes}
+// Function attributes (GCC/Clang): const lets the compiler CSE repeated
+// calls with the same arguments, always_inline keeps the small helpers
+// inline even at -Os, and pure marks the out-of-line math functions,
+// which read only their arguments and immutable tables.
+#ifndef FIXP_ATTR_CONST
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ATTR_CONST __attribute__((const, always_inline))
+#define FIXP_ATTR_CONST_FN __attribute__((const))
+#define FIXP_ATTR_PURE __attribute__((pure))
+#else
+#define FIXP_ATTR_CONST
+#define FIXP_ATTR_CONST_FN
+#define FIXP_ATTR_PURE
+#endif
+#endif
+
+// Batch-pointer contract: restrict promises the source and destination
+// arrays of the *_v kernels never overlap, and the 64-byte alignment
+// assumption lets the vectorizer drop its runtime overlap checks and
+// unaligned-head peel loops. Callers must pass non-overlapping arrays
+// in 64-byte-aligned storage (alignas(64) / aligned_alloc).
+#ifndef FIXP_RESTRICT
+#ifdef __cplusplus
+#define FIXP_RESTRICT __restrict
+#else
+#define FIXP_RESTRICT restrict
+#endif
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ASSUME_ALIGNED64_(p) ((p) = (__typeof__(p))__builtin_assume_aligned((p), 64))
+#else
+#define FIXP_ASSUME_ALIGNED64_(p) ((void)0)
+#endif
+#endif
+
+// Vectorization hint ahead of the plain batch loops: `omp simd` under
+// OpenMP (also honoured by -fopenmp-simd), otherwise the compiler's
+// own no-loop-carried-dependence assertion.
+#ifndef FIXP_VEC_LOOP_
+#if defined(_OPENMP)
+#define FIXP_VEC_LOOP_ _Pragma("omp simd")
+#elif defined(__clang__)
+#define FIXP_VEC_LOOP_ _Pragma("clang loop vectorize(enable)")
+#elif defined(__GNUC__)
+#define FIXP_VEC_LOOP_ _Pragma("GCC ivdep")
+#else
+#define FIXP_VEC_LOOP_
+#endif
+#endif
 
 #ifdef __cplusplus
 extern "C" {{
@@ -37,33 +217,41 @@ extern "C" {{
 // {m_bits} integer bits, {n_bits} fractional bits
 typedef {base_type} {type_name};
 
-// Constants
+// Constants. ONE/MAX/MIN are shared with the arithmetic header for
+// formats that have one, so each is guarded to keep the headers
+// composable in either include order.
 #define Q{m_bits}_{n_bits}_PI       (({type_name})(3.14159265358979323846 * (1LL << {n_bits})))
 #define Q{m_bits}_{n_bits}_E        (({type_name})(2.71828182845904523536 * (1LL << {n_bits})))
+#ifndef Q{m_bits}_{n_bits}_ONE
 #define Q{m_bits}_{n_bits}_ONE      (({type_name})(1LL << {n_bits}))
+#endif
 #define Q{m_bits}_{n_bits}_HALF     (({type_name})(1LL << ({n_bits} - 1)))
+#ifndef Q{m_bits}_{n_bits}_MAX
 #define Q{m_bits}_{n_bits}_MAX      (({type_name})((1LL << ({total_bits} - 1)) - 1))
+#endif
+#ifndef Q{m_bits}_{n_bits}_MIN
 #define Q{m_bits}_{n_bits}_MIN      (({type_name})(-(1LL << ({total_bits} - 1))))
+#endif
 
 // Basic operations
-static inline {type_name} q{m_bits}_{n_bits}_abs({type_name} x) {{
+static inline FIXP_ATTR_CONST {type_name} q{m_bits}_{n_bits}_abs({type_name} x) {{
     return (x < 0) ? -x : x;
 }}
 
-static inline {type_name} q{m_bits}_{n_bits}_min({type_name} a, {type_name} b) {{
+static inline FIXP_ATTR_CONST {type_name} q{m_bits}_{n_bits}_min({type_name} a, {type_name} b) {{
     return (a < b) ? a : b;
 }}
 
-static inline {type_name} q{m_bits}_{n_bits}_max({type_name} a, {type_name} b) {{
+static inline FIXP_ATTR_CONST {type_name} q{m_bits}_{n_bits}_max({type_name} a, {type_name} b) {{
     return (a > b) ? a : b;
 }}
 
-static inline {type_name} q{m_bits}_{n_bits}_clamp({type_name} x, {type_name} lo, {type_name} hi) {{
+static inline FIXP_ATTR_CONST {type_name} q{m_bits}_{n_bits}_clamp({type_name} x, {type_name} lo, {type_name} hi) {{
     return q{m_bits}_{n_bits}_min(q{m_bits}_{n_bits}_max(x, lo), hi);
 }}
-
+{batch_section}
 // Rounding functions
-static inline {type_name} q{m_bits}_{n_bits}_floor({type_name} x) {{
+static inline FIXP_ATTR_CONST {type_name} q{m_bits}_{n_bits}_floor({type_name} x) {{
     const {type_name} frac_mask = Q{m_bits}_{n_bits}_ONE - 1;
     if (x >= 0) {{
         return x & ~frac_mask;
@@ -72,7 +260,7 @@ static inline {type_name} q{m_bits}_{n_bits}_floor({type_name} x) {{
     }}
 }}
 
-static inline {type_name} q{m_bits}_{n_bits}_ceil({type_name} x) {{
+static inline FIXP_ATTR_CONST {type_name} q{m_bits}_{n_bits}_ceil({type_name} x) {{
     const {type_name} frac_mask = Q{m_bits}_{n_bits}_ONE - 1;
     if (x >= 0) {{
         return (x & frac_mask) ? ((x & ~frac_mask) + Q{m_bits}_{n_bits}_ONE) : x;
@@ -81,7 +269,7 @@ static inline {type_name} q{m_bits}_{n_bits}_ceil({type_name} x) {{
     }}
 }}
 
-static inline {type_name} q{m_bits}_{n_bits}_round({type_name} x) {{
+static inline FIXP_ATTR_CONST {type_name} q{m_bits}_{n_bits}_round({type_name} x) {{
     if (x >= 0) {{
         return (x + Q{m_bits}_{n_bits}_HALF) & ~(Q{m_bits}_{n_bits}_ONE - 1);
     }} else {{
@@ -89,26 +277,30 @@ static inline {type_name} q{m_bits}_{n_bits}_round({type_name} x) {{
     }}
 }}
 
-static inline {type_name} q{m_bits}_{n_bits}_trunc({type_name} x) {{
+static inline FIXP_ATTR_CONST {type_name} q{m_bits}_{n_bits}_trunc({type_name} x) {{
     return x & ~(Q{m_bits}_{n_bits}_ONE - 1);
 }}
 
 // Square root (Newton-Raphson)
-{type_name} q{m_bits}_{n_bits}_sqrt({type_name} x);
+FIXP_ATTR_PURE {type_name} q{m_bits}_{n_bits}_sqrt({type_name} x);
 
 // Trigonometric functions (CORDIC-based)
-{type_name} q{m_bits}_{n_bits}_sin({type_name} angle);
-{type_name} q{m_bits}_{n_bits}_cos({type_name} angle);
-{type_name} q{m_bits}_{n_bits}_tan({type_name} angle);
-{type_name} q{m_bits}_{n_bits}_atan({type_name} x);
-{type_name} q{m_bits}_{n_bits}_atan2({type_name} y, {type_name} x);
-
+FIXP_ATTR_PURE {type_name} q{m_bits}_{n_bits}_sin({type_name} angle);
+FIXP_ATTR_PURE {type_name} q{m_bits}_{n_bits}_cos({type_name} angle);
+// Fused: one range reduction and one CORDIC pass for both outputs.
+void q{m_bits}_{n_bits}_sincos({type_name} angle, {type_name}* s, {type_name}* c);
+FIXP_ATTR_PURE {type_name} q{m_bits}_{n_bits}_tan({type_name} angle);
+FIXP_ATTR_PURE {type_name} q{m_bits}_{n_bits}_atan({type_name} x);
+FIXP_ATTR_PURE {type_name} q{m_bits}_{n_bits}_atan2({type_name} y, {type_name} x);
+// Fused vectoring: magnitude and angle from a single CORDIC pass
+void q{m_bits}_{n_bits}_hypot_atan2({type_name} y, {type_name} x, {type_name}* h, {type_name}* ang);
+{trig_batch_protos}
 // Exponential and logarithmic
-{type_name} q{m_bits}_{n_bits}_exp({type_name} x);
-{type_name} q{m_bits}_{n_bits}_log({type_name} x);
-{type_name} q{m_bits}_{n_bits}_exp2({type_name} x);
-{type_name} q{m_bits}_{n_bits}_log2({type_name} x);
-{type_name} q{m_bits}_{n_bits}_pow({type_name} base, {type_name} exponent);
+FIXP_ATTR_PURE {type_name} q{m_bits}_{n_bits}_exp({type_name} x);
+FIXP_ATTR_PURE {type_name} q{m_bits}_{n_bits}_log({type_name} x);
+FIXP_ATTR_PURE {type_name} q{m_bits}_{n_bits}_exp2({type_name} x);
+FIXP_ATTR_PURE {type_name} q{m_bits}_{n_bits}_log2({type_name} x);
+FIXP_ATTR_PURE {type_name} q{m_bits}_{n_bits}_pow({type_name} base, {type_name} exponent);
 
 #ifdef __cplusplus
 }}
@@ -118,235 +310,1252 @@ static inline {type_name} q{m_bits}_{n_bits}_trunc({type_name} x) {{
 """
     return header
 
+# CORDIC table-value kernel, optionally JIT-compiled. The loops are tiny
+# for today's formats but sit on the build's critical path once n_bits
+# grows toward 63 and more widths are emitted; numba's on-disk cache
+# then amortizes the compile across builds. The import is deferred to
+# first use and the pure-Python loop stays as the fallback, so numba
+# remains an optional dependency.
+_table_values_jit = None
+_table_values_jit_tried = False
+
+
+def _cordic_table_values(mode, count, start):
+    """Float table entries for one CORDIC mode.
+
+    mode 0 is circular (atan(2^-i)), mode 1 hyperbolic (atanh(2^-i)),
+    for i = start .. start + count - 1.
+    """
+    global _table_values_jit, _table_values_jit_tried
+    if not _table_values_jit_tried:
+        _table_values_jit_tried = True
+        try:
+            import numpy as np
+            from numba import njit
+
+            @njit(cache=True)
+            def _values(mode, count, start):
+                out = np.empty(count)
+                for j in range(count):
+                    x = 2.0 ** -(start + j)
+                    out[j] = math.atan(x) if mode == 0 else math.atanh(x)
+                return out
+
+            _table_values_jit = _values
+        except ImportError:
+            pass
+
+    if _table_values_jit is not None:
+        return list(_table_values_jit(mode, count, start))
+
+    fn = math.atan if mode == 0 else math.atanh
+    return [fn(2.0 ** -(start + j)) for j in range(count)]
+
+
+@functools.lru_cache(maxsize=None)
 def generate_cordic_tables(n_bits):
-    """Generate CORDIC tables for given fractional bits"""
-    import math
-    
-    k = 0.60725293500888  # CORDIC gain
+    """Generate CORDIC tables for given fractional bits.
+
+    The tables depend only on n_bits, so results are cached and shared
+    across every Qm.n format with the same fractional width. The gain K
+    is computed from the iteration product rather than a decimal literal
+    so it stays exact for large n.
+    """
+    iterations = min(n_bits, 16) if n_bits > 0 else 0
+    k = math.prod(1.0 / math.sqrt(1.0 + 2.0 ** (-2 * i)) for i in range(iterations))
     k_fixed = int(k * (1 << n_bits))
-    
-    atan_table = []
-    for i in range(min(n_bits, 32)):
-        atan_val = math.atan(2.0 ** -i)
-        atan_fixed = int(atan_val * (1 << n_bits))
-        atan_table.append(atan_fixed)
-    
+
+    atan_values = _cordic_table_values(0, min(n_bits, 32), 0)
+    atan_table = tuple(int(v * (1 << n_bits)) for v in atan_values)
+
     return k_fixed, atan_table
 
-def generate_cordic_c_file(m_bits, n_bits):
-    """Generate C implementation file with CORDIC algorithms"""
-    total_bits = m_bits + n_bits + 1
-    type_name = f"q{m_bits}_{n_bits}_t"
-    
-    if total_bits <= 8:
-        base_type = "int8_t"
-    elif total_bits <= 16:
-        base_type = "int16_t"
-    elif total_bits <= 32:
-        base_type = "int32_t"
-    elif total_bits <= 64:
-        base_type = "int64_t"
-    else:
-        raise ValueError(f"Total bits {total_bits} exceeds 64")
-    
-    k_fixed, atan_table = generate_cordic_tables(n_bits)
-    
-    atan_table_str = ",\n    ".join(str(x) for x in atan_table)
-    
-    impl = f"""#include "q{m_bits}_{n_bits}_math.h"
+
+def hyperbolic_schedule(n_bits, iters=None):
+    """Iteration schedule for hyperbolic CORDIC (Walther convergence rule).
+
+    Hyperbolic iterations start at i=1 and indices 4, 13, 40, ... (each
+    3k+1) must be executed twice for the expansion to converge. `iters`
+    overrides the default min(n_bits, 16) count for kernels that carry
+    guard bits and iterate deeper.
+    """
+    if iters is None:
+        iters = min(n_bits, 16)
+    schedule = []
+    repeat = 4
+    for i in range(1, iters + 1):
+        schedule.append(i)
+        if i == repeat:
+            schedule.append(i)
+            repeat = 3 * repeat + 1
+    return schedule
+
+
+@functools.lru_cache(maxsize=None)
+def generate_cordic_hyperbolic_constants(n_bits):
+    """Hyperbolic CORDIC tables and gain for given fractional bits.
+
+    Returns (inv_4kh2_fixed, atanh_table) where inv_4kh2_fixed is
+    1/(4*K_h^2) in Qm.n (K_h computed over the full repetition schedule)
+    and atanh_table holds atanh(2^-i) for i = 1..min(n_bits, 32).
+    """
+    schedule = hyperbolic_schedule(n_bits)
+    k_h = math.prod(math.sqrt(1.0 - 2.0 ** (-2 * i)) for i in schedule)
+    inv_4kh2_fixed = round(1.0 / (4.0 * k_h * k_h) * (1 << n_bits))
+
+    atanh_values = _cordic_table_values(1, min(n_bits, 32), 1)
+    atanh_table = tuple(int(v * (1 << n_bits)) for v in atanh_values)
+
+    return inv_4kh2_fixed, atanh_table
+
+
+def generate_cordic_table_files(n_bits):
+    """Generate the shared atan-table TU and its extern header.
+
+    Every qM_N_math.c with the same n_bits includes the header and links
+    against the single table, instead of each carrying a private copy.
+    """
+    _, atan_table = generate_cordic_tables(n_bits)
+    _, atanh_table = generate_cordic_hyperbolic_constants(n_bits)
+    # Zero-fraction formats have no table; emit a single placeholder entry
+    # so the arrays are never empty.
+    entries = atan_table if atan_table else (0,)
+    table_str = ",\n    ".join(str(x) for x in entries)
+    atanh_entries = atanh_table if atanh_table else (0,)
+    atanh_table_str = ",\n    ".join(str(x) for x in atanh_entries)
+
+    header = f"""#ifndef FIXP_CORDIC_ATAN_TABLE_N{n_bits}_H
+#define FIXP_CORDIC_ATAN_TABLE_N{n_bits}_H
+
 #include <stdint.h>
 
-// CORDIC constants
-#define CORDIC_K_{n_bits} (({type_name}){k_fixed})
-#define CORDIC_ITERATIONS {min(n_bits, 16)}
+// Cacheline alignment keeps each table on as few lines as possible and
+// gives vector gathers an aligned base.
+#ifndef FIXP_ATTR_ALIGN64
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_ATTR_ALIGN64 __attribute__((aligned(64)))
+#else
+#define FIXP_ATTR_ALIGN64
+#endif
+#endif
+
+// Shared CORDIC tables for all Qm.{n_bits} formats:
+// atan(2^-i) scaled by 2^{n_bits}, i = 0..{len(entries) - 1}
+#define CORDIC_ATAN_TABLE_N{n_bits}_LEN {len(entries)}
+extern const int64_t cordic_atan_table_N{n_bits}[CORDIC_ATAN_TABLE_N{n_bits}_LEN] FIXP_ATTR_ALIGN64;
 
-static const {type_name} cordic_atan_table[CORDIC_ITERATIONS] = {{
-    {atan_table_str}
+// atanh(2^-i) scaled by 2^{n_bits}, i = 1..{len(atanh_entries)} (index i-1)
+#define CORDIC_ATANH_TABLE_N{n_bits}_LEN {len(atanh_entries)}
+extern const int64_t cordic_atanh_table_N{n_bits}[CORDIC_ATANH_TABLE_N{n_bits}_LEN] FIXP_ATTR_ALIGN64;
+
+#endif // FIXP_CORDIC_ATAN_TABLE_N{n_bits}_H
+"""
+
+    impl = f"""#include "cordic_atan_table_N{n_bits}.h"
+
+const int64_t cordic_atan_table_N{n_bits}[CORDIC_ATAN_TABLE_N{n_bits}_LEN] FIXP_ATTR_ALIGN64 = {{
+    {table_str}
 }};
 
-// CORDIC rotation mode
-static void cordic_rotate({type_name}* x, {type_name}* y, {type_name} z) {{
-    {type_name} x_val = CORDIC_K_{n_bits};
-    {type_name} y_val = 0;
-    
-    for (int i = 0; i < CORDIC_ITERATIONS; i++) {{
-        {type_name} x_new, y_new, z_new;
-        
-        if (z >= 0) {{
-            x_new = x_val - (y_val >> i);
-            y_new = y_val + (x_val >> i);
-            z_new = z - cordic_atan_table[i];
-        }} else {{
-            x_new = x_val + (y_val >> i);
-            y_new = y_val - (x_val >> i);
-            z_new = z + cordic_atan_table[i];
-        }}
-        
-        x_val = x_new;
-        y_val = y_new;
-        z = z_new;
+const int64_t cordic_atanh_table_N{n_bits}[CORDIC_ATANH_TABLE_N{n_bits}_LEN] FIXP_ATTR_ALIGN64 = {{
+    {atanh_table_str}
+}};
+"""
+    return header, impl
+
+def generate_sqrt_impl(m_bits, n_bits, type_name, base_type, wide_type, storage_bits):
+    """Generate the q{m}_{n}_sqrt body.
+
+    Formats with fractional bits use CORDIC hyperbolic vectoring, which
+    reaches n-bit precision with shift-add iterations and no divides.
+    Integer formats (n_bits == 0) keep the Newton-Raphson path since the
+    hyperbolic scheme needs a fractional normalization interval.
+    """
+    if n_bits == 0:
+        return f"""{type_name} q{m_bits}_{n_bits}_sqrt({type_name} x) {{
+    if (x <= 0) return 0;
+
+    // Seed at 2^(hibit/2 + 1) >= sqrt(x), within a factor of 2 of the
+    // result, so the Newton steps below converge to full precision.
+    {type_name} guess = ({type_name})1 << ((q{m_bits}_{n_bits}_hibit(x) >> 1) + 1);
+    if (guess < Q{m_bits}_{n_bits}_ONE) guess = Q{m_bits}_{n_bits}_ONE;
+
+    // Newton-Raphson iterations
+    for (int i = 0; i < 4; i++) {{
+        {type_name} div = (({base_type})x << {n_bits}) / guess;
+        guess = (guess + div) >> 1;
     }}
-    
-    *x = x_val;
-    *y = y_val;
-}}
 
-// CORDIC vectoring mode
-static {type_name} cordic_vector({type_name} x, {type_name} y) {{
-    {type_name} z = 0;
-    
-    for (int i = 0; i < CORDIC_ITERATIONS; i++) {{
-        {type_name} x_new, y_new, z_new;
-        
-        if (y < 0) {{
-            x_new = x - (y >> i);
-            y_new = y + (x >> i);
-            z_new = z - cordic_atan_table[i];
-        }} else {{
-            x_new = x + (y >> i);
-            y_new = y - (x >> i);
-            z_new = z + cordic_atan_table[i];
+    return guess;
+}}"""
+
+    # Guard bits: the kernel runs at Qn+guard so the 2e bits the
+    # normalization shifts out and the vectoring residual both land
+    # below the format's LSB once shifted back. guard must cover the
+    # largest e (bounded by the integer width) with margin, inside the
+    # wide type's headroom above the shifted input.
+    e_max = (m_bits + 1) >> 1
+    guard = min(2 * storage_bits - (m_bits + n_bits) - 4, max(8, e_max + 6))
+    iters = n_bits + guard
+    schedule = hyperbolic_schedule(n_bits, iters)
+    k_h = math.prod(math.sqrt(1.0 - 2.0 ** (-2 * i)) for i in schedule)
+    inv_4kh2_fixed = round(1.0 / (4.0 * k_h * k_h) * (1 << (n_bits + guard)))
+    return f"""// 1/(4*K_h^2) in Q{n_bits}+{guard}, K_h over the full repetition schedule
+#define CORDIC_INV_4KH2_{n_bits} (({wide_type}){inv_4kh2_fixed})
+// {guard} fractional guard bits carried through normalization and
+// vectoring, with the iteration count extended to match, so the
+// residual stays below the format's LSB after the shift back.
+#define CORDIC_SQRT_GUARD_{n_bits} {guard}
+#define CORDIC_SQRT_ITERS_{n_bits} {iters}
+
+// CORDIC hyperbolic vectoring mode: drives y toward 0 and returns the
+// final x, which is sqrt(x0^2 - y0^2) scaled by K_h. Iterations start
+// at i=1; indices 4, 13, 40, ... repeat per the Walther convergence rule.
+static {wide_type} cordic_hyperbolic_vector({wide_type} x, {wide_type} y) {{
+    int repeat = 4;
+    for (int i = 1; i <= CORDIC_SQRT_ITERS_{n_bits}; i++) {{
+        int reps = 1;
+        if (i == repeat) {{
+            reps = 2;
+            repeat = 3 * repeat + 1;
+        }}
+        while (reps--) {{
+            // Branchless conditional negate keyed on the sign of y
+            const {wide_type} sign = -({wide_type})(y < 0);
+            {wide_type} dx = ((y >> i) ^ sign) - sign;
+            {wide_type} dy = ((x >> i) ^ sign) - sign;
+            x -= dx;
+            y -= dy;
         }}
-        
-        x = x_new;
-        y = y_new;
-        z = z_new;
     }}
-    
-    return z;
+    return x;
 }}
 
-{type_name} q{m_bits}_{n_bits}_sin({type_name} angle) {{
+{type_name} q{m_bits}_{n_bits}_sqrt({type_name} x) {{
+    if (x <= 0) return 0;
+
+    // Normalize x = mant * 4^e with mant in [1/4, 1) so the vectoring
+    // angle stays inside the scheme's convergence bound (~1.11). The
+    // exponent comes straight from the highest set bit; mant lands in
+    // the guarded scale through a rounded shift, so the 2e low bits
+    // contribute instead of being discarded.
+    int e = (q{m_bits}_{n_bits}_hibit(x) - {n_bits} + 2) >> 1;
+    int sh = 2 * e - CORDIC_SQRT_GUARD_{n_bits};
+    {wide_type} mant = (sh > 0)
+        ? (({wide_type})x + (({wide_type})1 << (sh - 1))) >> sh
+        : ({wide_type})x << -sh;
+
+    // x0 = mant + 1/(4*Kh^2), y0 = mant - 1/(4*Kh^2) gives
+    // sqrt(x0^2 - y0^2) = sqrt(mant)/K_h, so the K_h vectoring gain
+    // cancels and x_n is sqrt(mant) directly -- no post-scaling.
+    {wide_type} xn = cordic_hyperbolic_vector(mant + CORDIC_INV_4KH2_{n_bits},
+                                              mant - CORDIC_INV_4KH2_{n_bits});
+
+    // Undo the normalization and drop the guard bits in one rounded
+    // shift: sqrt(mant * 4^e) = sqrt(mant) * 2^e, and e < guard always,
+    // so the count stays positive. Rounding up can graze one past the
+    // top of a zero-integer-bit range, hence the clamp.
+    int shr = CORDIC_SQRT_GUARD_{n_bits} - e;
+    {wide_type} res = (xn + (({wide_type})1 << (shr - 1))) >> shr;
+    if (res > Q{m_bits}_{n_bits}_MAX) res = Q{m_bits}_{n_bits}_MAX;
+    return ({type_name})res;
+}}"""
+
+def _use_lut_trig(n_bits):
+    """Low-precision formats use a quarter-wave sine LUT instead of CORDIC.
+
+    Below 16 fractional bits a 257-entry int16 table with linear
+    interpolation sits under the format's quantization noise: one
+    multiply and two loads against a 16-step shift-add dependency
+    chain, and the 514-byte table stays cache-resident.
+    """
+    return 0 < n_bits < 16
+
+
+def _chebyshev_fit(f, lo, hi, deg, samples=64):
+    """Least-maximum-error degree-`deg` fit of f on [lo, hi].
+
+    Truncated Chebyshev series computed at Chebyshev-Gauss nodes (a
+    near-minimax fit), converted back to monomial coefficients in x,
+    lowest order first.
+    """
+    c = []
+    for j in range(deg + 1):
+        acc = 0.0
+        for k in range(samples):
+            theta = math.pi * (k + 0.5) / samples
+            x = (lo + hi) / 2.0 + (hi - lo) / 2.0 * math.cos(theta)
+            acc += f(x) * math.cos(j * theta)
+        c.append(2.0 * acc / samples)
+    c[0] /= 2.0
+
+    # Collapse the T_j basis to monomials in t via the recurrence
+    # T_{k+1} = 2t*T_k - T_{k-1}.
+    t_basis = [[1.0], [0.0, 1.0]]
+    while len(t_basis) <= deg:
+        prev, cur = t_basis[-2], t_basis[-1]
+        nxt = [0.0] + [2.0 * v for v in cur]
+        for i, v in enumerate(prev):
+            nxt[i] -= v
+        t_basis.append(nxt)
+    mono_t = [0.0] * (deg + 1)
+    for j, cj in enumerate(c):
+        for i, v in enumerate(t_basis[j]):
+            mono_t[i] += cj * v
+
+    # Substitute t = (x - mid) / half_span by Horner over the linear map.
+    half_span = (hi - lo) / 2.0
+    mid = (lo + hi) / 2.0
+    lin = (-mid / half_span, 1.0 / half_span)
+    acc = [0.0]
+    for ck in reversed(mono_t):
+        nxt = [0.0] * (len(acc) + 1)
+        for i, v in enumerate(acc):
+            nxt[i] += v * lin[0]
+            nxt[i + 1] += v * lin[1]
+        nxt[0] += ck
+        acc = nxt
+    return tuple(acc[:deg + 1])
+
+
+@functools.lru_cache(maxsize=None)
+def generate_exp2_log2_coeffs(n_bits):
+    """Fixed-point Horner coefficients for the exp2 and log2 kernels.
+
+    exp2 is a 5th-order fit of 2^f on [0, 1); log2 an order-4 fit of
+    log2(1 + u) on [0, 1). Integer-only formats degenerate gracefully:
+    the fractional argument is always 0 there.
+    """
+    scale = 1 << n_bits
+    exp2_c = tuple(round(a * scale) for a in _chebyshev_fit(lambda x: 2.0 ** x, 0.0, 1.0, 5))
+    log2_c = tuple(round(a * scale) for a in _chebyshev_fit(lambda u: math.log2(1.0 + u), 0.0, 1.0, 4))
+    return exp2_c, log2_c
+
+
+@functools.lru_cache(maxsize=None)
+def generate_exp_coeffs(n_bits):
+    """Fixed-point Horner coefficients for the natural-base exp kernel.
+
+    5th-order fit of e^r on [0, ln2), the residual range left by the
+    k*ln2 decomposition in q{m}_{n}_exp. Same pipeline as the exp2
+    coefficients; rounded to Qn.
+    """
+    scale = 1 << n_bits
+    return tuple(
+        round(a * scale) for a in _chebyshev_fit(math.exp, 0.0, math.log(2.0), 5)
+    )
+
+
+def _generate_lut_trig_kernels(m_bits, n_bits, type_name):
+    """Emit the quarter-wave table and the sin_lut / cos_lut kernels.
+
+    One 257-entry Qn table of sin on [0, pi/2] serves both functions
+    and all four quadrants: cos walks the same table from the far end,
+    and the dispatch in sin/cos supplies the quadrant signs. The extra
+    endpoint entry lets the interpolation read entry i+1 unconditionally.
+    """
+    reduced = m_bits > 0
+    domain = "[0, \u03c0/2)" if reduced else "(-1, 1)"
+    scale = 1 << n_bits
+    # sin(pi/2) rounds to exactly 1.0, which formats with no integer
+    # bits cannot store; saturate those endpoint entries to the format
+    # maximum so the kernels never wrap in the storage type.
+    fmt_max = (1 << (m_bits + n_bits)) - 1
+    table = [
+        min(round(math.sin(i * (math.pi / 2.0) / 256.0) * scale), fmt_max)
+        for i in range(257)
+    ]
+    rows = "\n".join(
+        "    " + ", ".join(str(v) for v in table[i:i + 10]) + ","
+        for i in range(0, 257, 10)
+    )
+    # Floored so the 8.8 coordinate stays below 256.0 for every
+    # representable r; rounding up could index past the table.
+    inv_halfpi = int((1 << 32) / (math.pi / 2.0 * scale))
+    return f"""// Quarter-wave sine table, Q{n_bits}: sin on [0, \u03c0/2] at 257 points.
+// 514 bytes -- cacheline-aligned so it spans the minimum nine lines.
+static const int16_t sin_quad_{n_bits}[257] FIXP_ATTR_ALIGN64 = {{
+{rows}
+}};
+
+// Maps r in {domain} (Q{n_bits}) to an 8.8 table coordinate in one multiply
+#define SIN_LUT_INV_HALFPI_{n_bits} {inv_halfpi}u
+
+// sin(r) by linear interpolation between adjacent table entries
+static {type_name} sin_lut(int32_t r) {{
+    uint32_t t = ((uint32_t)r * SIN_LUT_INV_HALFPI_{n_bits}) >> 16;
+    uint32_t i = t >> 8;
+    int32_t frac = (int32_t)(t & 0xFF);
+    int32_t s0 = sin_quad_{n_bits}[i];
+    int32_t s1 = sin_quad_{n_bits}[i + 1];
+    return ({type_name})(s0 + (((s1 - s0) * frac) >> 8));
+}}
+
+// cos(r) = sin(\u03c0/2 - r): walk the same table from the far end
+static {type_name} cos_lut(int32_t r) {{
+    uint32_t t = ((uint32_t)r * SIN_LUT_INV_HALFPI_{n_bits}) >> 16;
+    uint32_t i = t >> 8;
+    int32_t frac = (int32_t)(t & 0xFF);
+    int32_t c0 = sin_quad_{n_bits}[256 - i];
+    int32_t c1 = sin_quad_{n_bits}[255 - i];
+    return ({type_name})(c0 + (((c1 - c0) * frac) >> 8));
+}}"""
+
+
+def generate_trig_impl(m_bits, n_bits, type_name, wide_type, storage_bits):
+    """Generate the q{m}_{n}_sincos / sin / cos bodies.
+
+    sincos is the primary entry point on the CORDIC paths: the rotation
+    produces sin and cos together, so sin and cos are thin wrappers and
+    callers needing both (tan, NCOs, rotation matrices) pay for one
+    reduction and one rotation. LUT formats share only the reduction;
+    their two kernels remain separate lookups.
+
+    Range reduction is constant-time: one multiply by the reciprocal of
+    2*pi, a shift, a subtract and a single bounded correction -- no
+    unbounded while-loops. A 2-bit quadrant index then maps the CORDIC
+    result on [0, pi/2) to the right sign and sin/cos swap.
+
+    Formats with no integer bits can only represent |angle| < 1 < pi/2,
+    so they skip reduction entirely. Integer-only formats (n_bits == 0)
+    keep the legacy subtract loop; their angle resolution is 1 radian
+    and the reciprocal constants would all round to 0.
+
+    Low-precision formats (see _use_lut_trig) interpolate a quarter-wave
+    sine table on the reduced argument instead of CORDIC: one multiply
+    and two loads with no loop-carried shift-add chain, and the
+    interpolation error sits below the format's quantization step.
+    """
+    if n_bits == 0:
+        return f"""void q{m_bits}_{n_bits}_sincos({type_name} angle, {type_name}* s, {type_name}* c) {{
     // Range reduction to [-π, π]
     while (angle > Q{m_bits}_{n_bits}_PI) angle -= 2 * Q{m_bits}_{n_bits}_PI;
     while (angle < -Q{m_bits}_{n_bits}_PI) angle += 2 * Q{m_bits}_{n_bits}_PI;
-    
+
     {type_name} x, y;
     bool negate = false;
-    
+
     if (angle < 0) {{
         angle = -angle;
         negate = true;
     }}
-    
+
     cordic_rotate(&x, &y, angle);
-    
-    return negate ? -y : y;
+
+    *s = negate ? -y : y;
+    *c = x;
+}}
+
+{type_name} q{m_bits}_{n_bits}_sin({type_name} angle) {{
+    {type_name} s, c;
+    q{m_bits}_{n_bits}_sincos(angle, &s, &c);
+    return s;
 }}
 
 {type_name} q{m_bits}_{n_bits}_cos({type_name} angle) {{
-    // Range reduction to [-π, π]
-    while (angle > Q{m_bits}_{n_bits}_PI) angle -= 2 * Q{m_bits}_{n_bits}_PI;
-    while (angle < -Q{m_bits}_{n_bits}_PI) angle += 2 * Q{m_bits}_{n_bits}_PI;
-    
-    {type_name} x, y;
-    
-    if (angle < 0) {{
-        angle = -angle;
+    {type_name} s, c;
+    q{m_bits}_{n_bits}_sincos(angle, &s, &c);
+    return c;
+}}"""
+
+    if m_bits == 0:
+        if _use_lut_trig(n_bits):
+            kernels = _generate_lut_trig_kernels(m_bits, n_bits, type_name)
+            return f"""{kernels}
+
+{type_name} q{m_bits}_{n_bits}_sin({type_name} angle) {{
+    // |angle| < 1 < π/2: no reduction needed. The sign fold runs in
+    // int32 so negating the most negative storage value stays defined.
+    int32_t r = angle;
+    return r < 0 ? ({type_name})-sin_lut(-r) : sin_lut(r);
+}}
+
+{type_name} q{m_bits}_{n_bits}_cos({type_name} angle) {{
+    int32_t r = angle;
+    return cos_lut(r < 0 ? -r : r);
+}}
+
+void q{m_bits}_{n_bits}_sincos({type_name} angle, {type_name}* s, {type_name}* c) {{
+    // No shared reduction to fuse here; two independent lookups.
+    int32_t r = angle;
+    if (r < 0) {{
+        *s = ({type_name})-sin_lut(-r);
+        *c = cos_lut(-r);
+    }} else {{
+        *s = sin_lut(r);
+        *c = cos_lut(r);
     }}
-    
+}}"""
+
+        return f"""void q{m_bits}_{n_bits}_sincos({type_name} angle, {type_name}* s, {type_name}* c) {{
+    // |angle| < 1 < π/2: already inside the CORDIC convergence range,
+    // and the rotation produces both outputs in one pass.
+    {type_name} x, y;
     cordic_rotate(&x, &y, angle);
-    
-    return x;
+    *s = y;
+    *c = x;
 }}
 
-{type_name} q{m_bits}_{n_bits}_tan({type_name} angle) {{
-    {type_name} s = q{m_bits}_{n_bits}_sin(angle);
-    {type_name} c = q{m_bits}_{n_bits}_cos(angle);
-    
-    if (c == 0) return Q{m_bits}_{n_bits}_MAX;
-    
-    // Division: (s << n_bits) / c
-    return (({base_type})s << {n_bits}) / c;
+{type_name} q{m_bits}_{n_bits}_sin({type_name} angle) {{
+    {type_name} s, c;
+    q{m_bits}_{n_bits}_sincos(angle, &s, &c);
+    return s;
 }}
 
-{type_name} q{m_bits}_{n_bits}_atan2({type_name} y, {type_name} x) {{
-    if (x == 0 && y == 0) return 0;
-    
-    {type_name} result = cordic_vector(x, y);
-    
-    // Quadrant adjustment
-    if (x < 0) {{
-        if (y >= 0) {{
-            result = Q{m_bits}_{n_bits}_PI - result;
-        }} else {{
-            result = -Q{m_bits}_{n_bits}_PI + result;
+{type_name} q{m_bits}_{n_bits}_cos({type_name} angle) {{
+    {type_name} s, c;
+    q{m_bits}_{n_bits}_sincos(angle, &s, &c);
+    return c;
+}}"""
+
+    # Guard bits keep the accumulated per-wrap rounding of the 2π
+    # constant below ~1 LSB even at the edge of the storage range.
+    # One wrap contributes up to half an LSB of the guarded constant, and
+    # a format can wrap ~2^m_bits / 2pi times, so the guard must scale
+    # with m_bits. Capped so all intermediates still fit the wide type.
+    guard = min(storage_bits - 3, max(8, m_bits + 2))
+    two_pi_g = round(2.0 * math.pi * (1 << (n_bits + guard)))
+    half_pi_g = round(math.pi / 2.0 * (1 << (n_bits + guard)))
+    # Reciprocals scaled by 2^storage_bits: enough precision that the
+    # computed quotient is off by at most 1 anywhere in the input range.
+    inv_2pi = round((1 << (storage_bits - n_bits)) / (2.0 * math.pi))
+    inv_half_pi = round((1 << (storage_bits - n_bits)) / (math.pi / 2.0))
+
+    reduce_block = f"""// Range-reduction constants, carried with {guard} guard bits (Q{n_bits}+{guard})
+#define CORDIC_TWO_PI_G_{n_bits}    (({wide_type}){two_pi_g})
+#define CORDIC_HALF_PI_G_{n_bits}   (({wide_type}){half_pi_g})
+#define CORDIC_INV_2PI_{n_bits}     (({wide_type}){inv_2pi})      // 2^{storage_bits - n_bits} / 2π
+#define CORDIC_INV_HALF_PI_{n_bits} (({wide_type}){inv_half_pi})  // 2^{storage_bits - n_bits} / (π/2)
+
+// Constant-time reduction: writes r in [0, π/2) and returns the 2-bit
+// quadrant index, so angle ≈ quadrant * π/2 + r (mod 2π). The multiply
+// by the 2π reciprocal replaces the O(angle/π) subtract loop; the
+// reciprocal's rounding makes the quotient off by at most 1, fixed by
+// a single correction step. The remainder itself is computed in
+// Q{n_bits}+{guard} so the rounding of 2π does not accumulate across wraps.
+static int cordic_reduce_angle({type_name} angle, {type_name}* r_out) {{
+    {wide_type} k = (({wide_type})angle * CORDIC_INV_2PI_{n_bits}) >> {storage_bits};
+    {wide_type} a = (({wide_type})angle << {guard}) - k * CORDIC_TWO_PI_G_{n_bits};
+    if (a < 0) a += CORDIC_TWO_PI_G_{n_bits};
+    else if (a >= CORDIC_TWO_PI_G_{n_bits}) a -= CORDIC_TWO_PI_G_{n_bits};
+
+    int quadrant = (int)((a * CORDIC_INV_HALF_PI_{n_bits}) >> {storage_bits + guard});
+    {wide_type} r = a - ({wide_type})quadrant * CORDIC_HALF_PI_G_{n_bits};
+    if (r < 0) {{
+        r += CORDIC_HALF_PI_G_{n_bits};
+        quadrant--;
+    }} else if (r >= CORDIC_HALF_PI_G_{n_bits}) {{
+        r -= CORDIC_HALF_PI_G_{n_bits};
+        quadrant++;
+    }}
+
+    *r_out = ({type_name})(r >> {guard});
+    return quadrant & 3;
+}}"""
+
+    if _use_lut_trig(n_bits):
+        kernels = _generate_lut_trig_kernels(m_bits, n_bits, type_name)
+        return f"""{kernels}
+
+{reduce_block}
+
+{type_name} q{m_bits}_{n_bits}_sin({type_name} angle) {{
+    {type_name} r;
+    int quadrant = cordic_reduce_angle(angle, &r);
+
+    switch (quadrant) {{
+        case 0: return sin_lut(r);
+        case 1: return cos_lut(r);
+        case 2: return ({type_name})-sin_lut(r);
+        default: return ({type_name})-cos_lut(r);
+    }}
+}}
+
+{type_name} q{m_bits}_{n_bits}_cos({type_name} angle) {{
+    {type_name} r;
+    int quadrant = cordic_reduce_angle(angle, &r);
+
+    switch (quadrant) {{
+        case 0: return cos_lut(r);
+        case 1: return ({type_name})-sin_lut(r);
+        case 2: return ({type_name})-cos_lut(r);
+        default: return sin_lut(r);
+    }}
+}}
+
+void q{m_bits}_{n_bits}_sincos({type_name} angle, {type_name}* s, {type_name}* c) {{
+    // Fuses the reduction; the two kernels stay separate lookups.
+    {type_name} r;
+    int quadrant = cordic_reduce_angle(angle, &r);
+    {type_name} sp = sin_lut(r);
+    {type_name} cp = cos_lut(r);
+
+    switch (quadrant) {{
+        case 0:  *s = sp;                   *c = cp;                   break;
+        case 1:  *s = cp;                   *c = ({type_name})-sp;     break;
+        case 2:  *s = ({type_name})-sp;     *c = ({type_name})-cp;     break;
+        default: *s = ({type_name})-cp;     *c = sp;                   break;
+    }}
+}}"""
+
+    return f"""{reduce_block}
+
+void q{m_bits}_{n_bits}_sincos({type_name} angle, {type_name}* s, {type_name}* c) {{
+    // One reduction and one rotation serve both outputs; the quadrant
+    // only decides the sign and sin/cos swap.
+    {type_name} r, x, y;
+    int quadrant = cordic_reduce_angle(angle, &r);
+
+    cordic_rotate(&x, &y, r);
+
+    switch (quadrant) {{
+        case 0:  *s = y;                   *c = x;                   break;
+        case 1:  *s = x;                   *c = ({type_name})-y;     break;
+        case 2:  *s = ({type_name})-y;     *c = ({type_name})-x;     break;
+        default: *s = ({type_name})-x;     *c = y;                   break;
+    }}
+}}
+
+{type_name} q{m_bits}_{n_bits}_sin({type_name} angle) {{
+    {type_name} s, c;
+    q{m_bits}_{n_bits}_sincos(angle, &s, &c);
+    return s;
+}}
+
+{type_name} q{m_bits}_{n_bits}_cos({type_name} angle) {{
+    {type_name} s, c;
+    q{m_bits}_{n_bits}_sincos(angle, &s, &c);
+    return c;
+}}"""
+
+def generate_trig_batch_impl(m_bits, n_bits, type_name, storage_bits):
+    """Generate batch sin/cos and hypot_atan2 over SoA arrays.
+
+    Returns (header_prototypes, impl) strings. The AVX2 kernel runs all
+    eight lanes through the shared iteration index, so every lane reads
+    the same atan-table entry and the per-lane sign dispatch becomes a
+    vector conditional negate. 16-bit formats are widened to 32-bit
+    lanes, which also gives them the wide-intermediate headroom the
+    scalar kernel gets from its wide type. Range reduction stays scalar
+    per lane (a handful of ops against 16 CORDIC iterations).
+
+    LUT formats get a plain element loop instead: the kernel is one
+    multiply and two gather-unfriendly table loads, so there is no
+    shift-add dependency chain for the vector form to amortize.
+    """
+    if n_bits == 0 or storage_bits not in (16, 32):
+        return "", ""
+
+    protos = f"""
+// Batch trigonometry over angle arrays (SoA layout); AVX2-accelerated
+void q{m_bits}_{n_bits}_sin_v(const {type_name}* FIXP_RESTRICT angles,
+                {type_name}* FIXP_RESTRICT out, size_t count);
+void q{m_bits}_{n_bits}_cos_v(const {type_name}* FIXP_RESTRICT angles,
+                {type_name}* FIXP_RESTRICT out, size_t count);
+void q{m_bits}_{n_bits}_hypot_atan2_v(const {type_name}* FIXP_RESTRICT y, const {type_name}* FIXP_RESTRICT x,
+                        {type_name}* FIXP_RESTRICT h, {type_name}* FIXP_RESTRICT ang, size_t count);
+"""
+
+    if _use_lut_trig(n_bits):
+        def poly_batch(op):
+            return f"""void q{m_bits}_{n_bits}_{op}_v(const {type_name}* FIXP_RESTRICT angles,
+                {type_name}* FIXP_RESTRICT out, size_t count) {{
+    FIXP_ASSUME_ALIGNED64_(angles); FIXP_ASSUME_ALIGNED64_(out);
+    FIXP_VEC_LOOP_
+    for (size_t idx = 0; idx < count; idx++) {{
+        out[idx] = q{m_bits}_{n_bits}_{op}(angles[idx]);
+    }}
+}}"""
+
+        return protos, f"""
+{poly_batch("sin")}
+
+{poly_batch("cos")}
+
+void q{m_bits}_{n_bits}_hypot_atan2_v(const {type_name}* FIXP_RESTRICT y, const {type_name}* FIXP_RESTRICT x,
+                        {type_name}* FIXP_RESTRICT h, {type_name}* FIXP_RESTRICT ang, size_t count) {{
+    FIXP_ASSUME_ALIGNED64_(y); FIXP_ASSUME_ALIGNED64_(x);
+    FIXP_ASSUME_ALIGNED64_(h); FIXP_ASSUME_ALIGNED64_(ang);
+    FIXP_VEC_LOOP_
+    for (size_t idx = 0; idx < count; idx++) {{
+        q{m_bits}_{n_bits}_hypot_atan2(y[idx], x[idx], &h[idx], &ang[idx]);
+    }}
+}}"""
+
+    if m_bits == 0:
+        gather = f"""        int32_t r[8];
+        for (size_t l = 0; l < 8; l++) {{
+            r[l] = angles[idx + l];
+        }}"""
+        sin_dispatch = "int32_t v = ys[l];"
+        cos_dispatch = "int32_t v = xs[l];"
+    else:
+        gather = f"""        int32_t r[8];
+        int quadrant[8];
+        for (size_t l = 0; l < 8; l++) {{
+            {type_name} rl;
+            quadrant[l] = cordic_reduce_angle(angles[idx + l], &rl);
+            r[l] = rl;
+        }}"""
+        sin_dispatch = """int32_t v;
+            switch (quadrant[l]) {
+                case 0: v = ys[l]; break;
+                case 1: v = xs[l]; break;
+                case 2: v = -ys[l]; break;
+                default: v = -xs[l]; break;
+            }"""
+        cos_dispatch = """int32_t v;
+            switch (quadrant[l]) {
+                case 0: v = xs[l]; break;
+                case 1: v = -ys[l]; break;
+                case 2: v = -xs[l]; break;
+                default: v = ys[l]; break;
+            }"""
+
+    def batch_fn(op, dispatch):
+        return f"""void q{m_bits}_{n_bits}_{op}_v(const {type_name}* FIXP_RESTRICT angles,
+                {type_name}* FIXP_RESTRICT out, size_t count) {{
+    FIXP_ASSUME_ALIGNED64_(angles); FIXP_ASSUME_ALIGNED64_(out);
+    size_t idx = 0;
+#if defined(__AVX2__)
+    for (; idx + 8 <= count; idx += 8) {{
+{gather}
+
+        __m256i x, y;
+        cordic_rotate_v8(&x, &y, _mm256_loadu_si256((const __m256i*)r));
+
+        int32_t xs[8], ys[8];
+        _mm256_storeu_si256((__m256i*)xs, x);
+        _mm256_storeu_si256((__m256i*)ys, y);
+
+        for (size_t l = 0; l < 8; l++) {{
+            {dispatch}
+            if (v > Q{m_bits}_{n_bits}_MAX) v = Q{m_bits}_{n_bits}_MAX;
+            if (v < Q{m_bits}_{n_bits}_MIN) v = Q{m_bits}_{n_bits}_MIN;
+            out[idx + l] = ({type_name})v;
         }}
     }}
-    
-    return result;
+#endif
+    for (; idx < count; idx++) {{
+        out[idx] = q{m_bits}_{n_bits}_{op}(angles[idx]);
+    }}
+}}"""
+
+    impl = f"""
+#if defined(__AVX2__)
+// 8-lane SoA CORDIC rotation in 32-bit lanes. All lanes share the
+// iteration index and table entry; the sign dispatch is a vector
+// conditional negate on sign(z) via _mm256_sign_epi32. Lanes keep the
+// fixed iteration schedule -- the scalar path's closest-angle recoding
+// is data-dependent per lane -- so vector results may differ from the
+// scalar functions by an LSB.
+static void cordic_rotate_v8(__m256i* x_out, __m256i* y_out, __m256i z) {{
+    __m256i x = _mm256_set1_epi32((int32_t)CORDIC_K_{n_bits});
+    __m256i y = _mm256_setzero_si256();
+    const __m256i one = _mm256_set1_epi32(1);
+
+    for (int i = 0; i < CORDIC_ITERATIONS; i++) {{
+        __m128i cnt = _mm_cvtsi32_si128(i);
+        __m256i at = _mm256_set1_epi32((int32_t)cordic_atan_table(i));
+        // dir = +1 where z >= 0, -1 where z < 0
+        __m256i dir = _mm256_or_si256(_mm256_srai_epi32(z, 31), one);
+        __m256i ys = _mm256_sra_epi32(y, cnt);
+        __m256i xs = _mm256_sra_epi32(x, cnt);
+        x = _mm256_sub_epi32(x, _mm256_sign_epi32(ys, dir));
+        y = _mm256_add_epi32(y, _mm256_sign_epi32(xs, dir));
+        z = _mm256_sub_epi32(z, _mm256_sign_epi32(at, dir));
+    }}
+
+    *x_out = x;
+    *y_out = y;
 }}
+#endif // __AVX2__
+
+{batch_fn("sin", sin_dispatch)}
+
+{batch_fn("cos", cos_dispatch)}
 
-{type_name} q{m_bits}_{n_bits}_atan({type_name} x) {{
-    return q{m_bits}_{n_bits}_atan2(x, Q{m_bits}_{n_bits}_ONE);
+#if defined(__AVX2__)
+// 8-lane SoA CORDIC vectoring, same structure as cordic_rotate_v8 with
+// the sign dispatch keyed on sign(y). Writes the final x (magnitude
+// times the vectoring gain) and the accumulated angle.
+static void cordic_vector_v8(__m256i x, __m256i y, __m256i* x_final, __m256i* z_out) {{
+    __m256i z = _mm256_setzero_si256();
+    const __m256i one = _mm256_set1_epi32(1);
+
+    for (int i = 0; i < CORDIC_ITERATIONS; i++) {{
+        __m128i cnt = _mm_cvtsi32_si128(i);
+        __m256i at = _mm256_set1_epi32((int32_t)cordic_atan_table(i));
+        // dir = +1 where y >= 0, -1 where y < 0
+        __m256i dir = _mm256_or_si256(_mm256_srai_epi32(y, 31), one);
+        __m256i ys = _mm256_sra_epi32(y, cnt);
+        __m256i xs = _mm256_sra_epi32(x, cnt);
+        x = _mm256_add_epi32(x, _mm256_sign_epi32(ys, dir));
+        y = _mm256_sub_epi32(y, _mm256_sign_epi32(xs, dir));
+        z = _mm256_add_epi32(z, _mm256_sign_epi32(at, dir));
+    }}
+
+    *x_final = x;
+    *z_out = z;
 }}
+#endif // __AVX2__
 
-{type_name} q{m_bits}_{n_bits}_sqrt({type_name} x) {{
-    if (x <= 0) return 0;
-    
-    // Find highest bit
-    {type_name} bit = 1;
-    {type_name} val = x;
-    while (val > 0) {{
-        val >>= 1;
-        bit <<= 1;
+void q{m_bits}_{n_bits}_hypot_atan2_v(const {type_name}* FIXP_RESTRICT y, const {type_name}* FIXP_RESTRICT x,
+                        {type_name}* FIXP_RESTRICT h, {type_name}* FIXP_RESTRICT ang, size_t count) {{
+    FIXP_ASSUME_ALIGNED64_(y); FIXP_ASSUME_ALIGNED64_(x);
+    FIXP_ASSUME_ALIGNED64_(h); FIXP_ASSUME_ALIGNED64_(ang);
+    size_t idx = 0;
+#if defined(__AVX2__)
+    for (; idx + 8 <= count; idx += 8) {{
+        // Scalar prepass: fold into the right half-plane and pre-shift
+        // lanes whose magnitude would overflow 32-bit lanes once the
+        // vectoring gain (~1.65, times sqrt(2) worst case) applies.
+        int32_t xs[8], ys[8];
+        int sh[8];
+        for (size_t l = 0; l < 8; l++) {{
+            int32_t xv = x[idx + l];
+            int32_t yv = y[idx + l];
+            int32_t axv = (xv < 0) ? -xv : xv;
+            int32_t ayv = (yv < 0) ? -yv : yv;
+            int32_t mx = (axv > ayv) ? axv : ayv;
+            int shl = 0;
+            if (mx >> {storage_bits - 4}) {{
+                shl = q{m_bits}_{n_bits}_hibit(mx) - {storage_bits - 4};
+            }}
+            sh[l] = shl;
+            xs[l] = axv >> shl;
+            ys[l] = yv >> shl;
+        }}
+
+        __m256i xf, zf;
+        cordic_vector_v8(_mm256_loadu_si256((const __m256i*)xs),
+                         _mm256_loadu_si256((const __m256i*)ys), &xf, &zf);
+
+        int32_t xo[8], zo[8];
+        _mm256_storeu_si256((__m256i*)xo, xf);
+        _mm256_storeu_si256((__m256i*)zo, zf);
+
+        for (size_t l = 0; l < 8; l++) {{
+            int32_t xv = x[idx + l];
+            int32_t yv = y[idx + l];
+            if (xv == 0 && yv == 0) {{
+                h[idx + l] = 0;
+                ang[idx + l] = 0;
+                continue;
+            }}
+            int32_t z = zo[l];
+            if (xv < 0) {{
+                z = (yv >= 0) ? (int32_t)(Q{m_bits}_{n_bits}_PI - z)
+                              : (int32_t)(-Q{m_bits}_{n_bits}_PI - z);
+            }}
+            int64_t mag = (((int64_t)xo[l] * CORDIC_K_{n_bits}) >> {n_bits}) << sh[l];
+            if (mag > Q{m_bits}_{n_bits}_MAX) mag = Q{m_bits}_{n_bits}_MAX;
+            h[idx + l] = ({type_name})mag;
+            ang[idx + l] = ({type_name})z;
+        }}
     }}
+#endif
+    for (; idx < count; idx++) {{
+        q{m_bits}_{n_bits}_hypot_atan2(y[idx], x[idx], &h[idx], &ang[idx]);
+    }}
+}}"""
+
+    return protos, impl
+
+FIXP_CORDIC_IMPL = r"""/**
+ * @file fixp_cordic_impl.h
+ * @brief Shared CORDIC kernel set for generated Qm.n formats (Generated)
+ *
+ * FIXP_CORDIC_DEFINE(M, N, ST, WT) expands the bit-scan helper and the
+ * rotation and vectoring kernels for one format: ST is the storage
+ * type, WT the wide type used for internals. The invoking .c file must
+ * define CORDIC_K_N, CORDIC_ITERATIONS, CORDIC_SCALE_FREE_N and the
+ * cordic_atan_table() accessor before the expansion; the Q{M}_{N}_MAX/
+ * MIN limits come from the format's math header. The kernels are
+ * static, so each implementation file expands a private copy and names
+ * never collide across translation units. Formats that serve sin/cos
+ * from the quarter-wave LUT expand only FIXP_CORDIC_HIBIT_DEFINE and
+ * FIXP_CORDIC_VECTOR_DEFINE, keeping the unused rotation kernel out of
+ * the TU (-Wunused-function).
+ */
+
+#ifndef FIXP_GEN_FIXP_CORDIC_IMPL_H
+#define FIXP_GEN_FIXP_CORDIC_IMPL_H
+
+#include <stdint.h>
+
+/*
+ * Index of the highest set bit; v must be positive. A single bit-scan
+ * instruction instead of the O(bits) shift loop; the sizeof selection
+ * folds at compile time.
+ */
+#if defined(__GNUC__) || defined(__clang__)
+#define FIXP_CORDIC_HIBIT_DEFINE(M, N, ST) \
+static inline int q##M##_##N##_hibit(ST v) { \
+    return (int)(sizeof(ST) <= 4 ? 31 - __builtin_clz((uint32_t)v) \
+                                 : 63 - __builtin_clzll((uint64_t)v)); \
+}
+#elif defined(_MSC_VER) && (defined(_M_X64) || defined(_M_ARM64))
+#include <intrin.h>
+#define FIXP_CORDIC_HIBIT_DEFINE(M, N, ST) \
+static inline int q##M##_##N##_hibit(ST v) { \
+    unsigned long idx; \
+    if (sizeof(ST) <= 4) _BitScanReverse(&idx, (unsigned long)(uint32_t)v); \
+    else _BitScanReverse64(&idx, (unsigned __int64)v); \
+    return (int)idx; \
+}
+#else
+#define FIXP_CORDIC_HIBIT_DEFINE(M, N, ST) \
+static inline int q##M##_##N##_hibit(ST v) { \
+    int bit_pos = -1; \
+    while (v > 0) { \
+        v >>= 1; \
+        bit_pos++; \
+    } \
+    return bit_pos; \
+}
+#endif
+
+/*
+ * CORDIC rotation mode. Internals run in the wide type: the rotation
+ * gain drives the magnitude toward 1.0, which formats without integer
+ * bits cannot represent, so the results saturate on store.
+ *
+ * Phase 1 walks the fixed schedule below CORDIC_SCALE_FREE_N; the K
+ * constant assumes every one of those rotations is taken, so none may
+ * be skipped. Phase 2 is closest-angle recoding: jump straight to the
+ * rotation index nearest the residual angle instead of burning an
+ * iteration per zero-rotation of the fixed schedule; each step at
+ * least halves |z|, so the tail finishes in about half the iterations.
+ * Residuals above atan(1) would index past the front of the table and
+ * are clamped to the largest angle available.
+ *
+ * The sign dispatch is a branchless conditional negate -- sign is 0 or
+ * -1, and (v ^ sign) - sign conditionally negates v. Random angles
+ * mispredict a real branch ~50% of the time, costing more than the
+ * whole iteration body.
+ */
+#define FIXP_CORDIC_ROTATE_DEFINE(M, N, ST, WT) \
+static void cordic_rotate(q##M##_##N##_t* x, q##M##_##N##_t* y, q##M##_##N##_t z_in) { \
+    WT x_val = CORDIC_K_##N; \
+    WT y_val = 0; \
+    WT z = z_in; \
+ \
+    for (int i = 0; i < CORDIC_SCALE_FREE_##N; i++) { \
+        const WT sign = -(WT)(z < 0); \
+        WT dy = ((y_val >> i) ^ sign) - sign; \
+        WT dx = ((x_val >> i) ^ sign) - sign; \
+        WT da = ((WT)cordic_atan_table(i) ^ sign) - sign; \
+ \
+        x_val -= dy; \
+        y_val += dx; \
+        z -= da; \
+    } \
+ \
+    WT sign = -(WT)(z < 0); \
+    WT az = (z ^ sign) - sign; \
+    while (az != 0) { \
+        int k = (N) - q##M##_##N##_hibit((ST)az); \
+        if (k < 0) k = 0; \
+        if (k >= CORDIC_ITERATIONS) break; \
+        WT dy = ((y_val >> k) ^ sign) - sign; \
+        WT dx = ((x_val >> k) ^ sign) - sign; \
+        WT da = ((WT)cordic_atan_table(k) ^ sign) - sign; \
+ \
+        x_val -= dy; \
+        y_val += dx; \
+        z -= da; \
+        sign = -(WT)(z < 0); \
+        az = (z ^ sign) - sign; \
+    } \
+ \
+    if (x_val > Q##M##_##N##_MAX) x_val = Q##M##_##N##_MAX; \
+    if (x_val < Q##M##_##N##_MIN) x_val = Q##M##_##N##_MIN; \
+    if (y_val > Q##M##_##N##_MAX) y_val = Q##M##_##N##_MAX; \
+    if (y_val < Q##M##_##N##_MIN) y_val = Q##M##_##N##_MIN; \
+    *x = (q##M##_##N##_t)x_val; \
+    *y = (q##M##_##N##_t)y_val; \
+}
+
+/*
+ * CORDIC vectoring mode. Wide internals: the vectoring gain (~1.65)
+ * can push intermediates past the storage range for large inputs.
+ * Returns the rotation angle; the final x -- the input magnitude times
+ * the vectoring gain 1/K -- lands in *x_final for hypot_atan2. Same
+ * branchless conditional negate as rotation mode, keyed on the sign
+ * of y instead of the residual angle.
+ */
+#define FIXP_CORDIC_VECTOR_DEFINE(M, N, ST, WT) \
+static q##M##_##N##_t cordic_vector(q##M##_##N##_t x_in, q##M##_##N##_t y_in, WT* x_final) { \
+    WT x = x_in; \
+    WT y = y_in; \
+    WT z = 0; \
+ \
+    for (int i = 0; i < CORDIC_ITERATIONS; i++) { \
+        const WT sign = -(WT)(y < 0); \
+        WT dx = ((y >> i) ^ sign) - sign; \
+        WT dy = ((x >> i) ^ sign) - sign; \
+        WT da = ((WT)cordic_atan_table(i) ^ sign) - sign; \
+ \
+        x += dx; \
+        y -= dy; \
+        z += da; \
+    } \
+ \
+    *x_final = x; \
+    return (q##M##_##N##_t)z; \
+}
+
+// The full kernel set: bit-scan helper, rotation and vectoring.
+#define FIXP_CORDIC_DEFINE(M, N, ST, WT) \
+FIXP_CORDIC_HIBIT_DEFINE(M, N, ST) \
+FIXP_CORDIC_ROTATE_DEFINE(M, N, ST, WT) \
+FIXP_CORDIC_VECTOR_DEFINE(M, N, ST, WT)
+
+#endif // FIXP_GEN_FIXP_CORDIC_IMPL_H
+"""
+
+
+def generate_cordic_c_file(m_bits, n_bits):
+    """Generate C implementation file with CORDIC algorithms"""
+    total_bits = m_bits + n_bits + 1
+    type_name = f"q{m_bits}_{n_bits}_t"
     
-    // Initial guess
-    {type_name} guess = bit >> 1;
-    if (guess < Q{m_bits}_{n_bits}_ONE) guess = Q{m_bits}_{n_bits}_ONE;
+    if total_bits <= 8:
+        base_type = "int8_t"
+        wide_type = "int16_t"
+        storage_bits = 8
+    elif total_bits <= 16:
+        base_type = "int16_t"
+        wide_type = "int32_t"
+        storage_bits = 16
+    elif total_bits <= 32:
+        base_type = "int32_t"
+        wide_type = "int64_t"
+        storage_bits = 32
+    elif total_bits <= 64:
+        base_type = "int64_t"
+        wide_type = "__int128_t"
+        storage_bits = 64
+    else:
+        raise ValueError(f"Total bits {total_bits} exceeds 64")
+
+    k_fixed, _ = generate_cordic_tables(n_bits)
+    exp2_c, log2_c = generate_exp2_log2_coeffs(n_bits)
+    exp_c = generate_exp_coeffs(n_bits)
+    poly_rnd = (1 << (n_bits - 1)) if n_bits else 0
+    exp2_defs = "\n".join(
+        f"#define EXP2_POLY_C{i}_{n_bits} (({wide_type}){v})" for i, v in enumerate(exp2_c)
+    )
+    log2_defs = "\n".join(
+        f"#define LOG2_POLY_C{i}_{n_bits} (({wide_type}){v})" for i, v in enumerate(log2_c)
+    )
+    exp_defs = "\n".join(
+        f"#define EXP_POLY_C{i}_{n_bits} (({wide_type}){v})" for i, v in enumerate(exp_c)
+    )
+    exp2_horner = "\n".join(
+        f"    r = ((r * frac_part + {poly_rnd}) >> {n_bits}) + EXP2_POLY_C{i}_{n_bits};"
+        for i in range(4, -1, -1)
+    )
+    log2_horner = "\n".join(
+        f"    lf = ((lf * u + {poly_rnd}) >> {n_bits}) + LOG2_POLY_C{i}_{n_bits};"
+        for i in range(3, -1, -1)
+    )
+    exp_horner = "\n".join(
+        f"    er = ((er * r + {poly_rnd}) >> {n_bits}) + EXP_POLY_C{i}_{n_bits};"
+        for i in range(4, -1, -1)
+    )
+    # exp decomposition constants: floor(x / ln2) needs the reciprocal
+    # rounded down, so the computed k never overshoots and r stays >= 0.
+    inv_ln2 = int((1 << n_bits) / math.log(2.0)) if n_bits else 1
+    ln2_fixed = round(math.log(2.0) * (1 << n_bits))
+    sqrt_impl = generate_sqrt_impl(m_bits, n_bits, type_name, base_type, wide_type, storage_bits)
+    if m_bits == 0 and n_bits > 0:
+        # ONE overflows the storage type when there are no integer bits;
+        # halving both vectoring inputs leaves the angle unchanged and
+        # costs one bit of y. atan of an in-range argument stays below
+        # pi/4, which the format can represent.
+        atan_impl = f"""{type_name} q{m_bits}_{n_bits}_atan({type_name} x) {{{{
+    // Direct vectoring pass; the atan2 quadrant fold can never trigger
+    // for a positive constant x input and is skipped entirely. ONE is
+    // not representable here, so vector on (ONE/2, x/2) -- same ratio,
+    // same angle.
+    {wide_type} xf;
+    return cordic_vector(({type_name})(1 << {n_bits - 1}), ({type_name})(x >> 1), &xf);
+}}}}"""
+    else:
+        atan_impl = f"""{type_name} q{m_bits}_{n_bits}_atan({type_name} x) {{{{
+    // Direct vectoring pass: the x argument is the constant ONE, so the
+    // atan2 quadrant fold can never trigger and is skipped entirely.
+    // |x| > 1 needs no reciprocal identity -- the vectoring internals
+    // are wide and atan stays inside the convergence range.
+    {wide_type} xf;
+    return cordic_vector(Q{m_bits}_{n_bits}_ONE, x, &xf);
+}}}}"""
+    trig_impl = generate_trig_impl(m_bits, n_bits, type_name, wide_type, storage_bits)
+    _, trig_batch_impl = generate_trig_batch_impl(m_bits, n_bits, type_name, storage_bits)
+
+    # Kernels expand from the shared macro header (fixp_cordic_impl.h),
+    # parameterized on format, storage and wide type. LUT trig formats
+    # only keep CORDIC for vectoring mode (atan2); expanding the unused
+    # rotation kernel would trip -Wunused-function. Iterations below
+    # CORDIC_SCALE_FREE carry a cos(atan(2^-i)) factor that is visible
+    # at n bits of precision; from there up the factor rounds to 1, so
+    # the rotation kernel's closest-angle tail may skip rotations freely.
+    scale_free = min(n_bits // 2 + 1, min(n_bits, 16))
+    if _use_lut_trig(n_bits):
+        cordic_defs = f"""// Vectoring-mode kernels only; rotation trig is served by the sine LUT
+FIXP_CORDIC_HIBIT_DEFINE({m_bits}, {n_bits}, {base_type})
+FIXP_CORDIC_VECTOR_DEFINE({m_bits}, {n_bits}, {base_type}, {wide_type})"""
+    else:
+        cordic_defs = f"""// First rotation index whose gain factor is 1 at this precision
+#define CORDIC_SCALE_FREE_{n_bits} {scale_free}
+
+FIXP_CORDIC_DEFINE({m_bits}, {n_bits}, {base_type}, {wide_type})"""
+
+    impl = f"""#include "q{m_bits}_{n_bits}_math.h"
+#include "cordic_atan_table_N{n_bits}.h"
+#include "fixp_cordic_impl.h"
+#include <stdint.h>
+
+// CORDIC constants
+#define CORDIC_K_{n_bits} (({type_name}){k_fixed})
+#define CORDIC_ITERATIONS {min(n_bits, 16)}
+
+// Shared across all Qm.{n_bits} formats; values fit in {type_name}.
+#define cordic_atan_table(i) (({type_name})cordic_atan_table_N{n_bits}[i])
+
+{cordic_defs}
+
+{trig_impl}
+{trig_batch_impl}
+
+{type_name} q{m_bits}_{n_bits}_tan({type_name} angle) {{
+    {type_name} s, c;
+    q{m_bits}_{n_bits}_sincos(angle, &s, &c);
     
-    // Newton-Raphson iterations
-    for (int i = 0; i < 4; i++) {{
-        {type_name} div = (({base_type})x << {n_bits}) / guess;
-        guess = (guess + div) >> 1;
-    }}
+    if (c == 0) return (s >= 0) ? Q{m_bits}_{n_bits}_MAX : Q{m_bits}_{n_bits}_MIN;
     
-    return guess;
+    // Wide quotient: s << n overflows the storage type once |sin| >= 0.5,
+    // and near ±π/2 the true tangent exceeds the format range anyway.
+    {wide_type} t = (({wide_type})s << {n_bits}) / c;
+    if (t > Q{m_bits}_{n_bits}_MAX) t = Q{m_bits}_{n_bits}_MAX;
+    if (t < Q{m_bits}_{n_bits}_MIN) t = Q{m_bits}_{n_bits}_MIN;
+    return ({type_name})t;
+}}
+
+{type_name} q{m_bits}_{n_bits}_atan2({type_name} y, {type_name} x) {{
+    // Half-plane bias indexed by the sign pair; replaces the nested
+    // quadrant branches. Vectoring runs on |x| (it only converges for
+    // x >= 0, and feeding a negative x also broke the y == 0, x < 0
+    // branch cut), then the left half-plane folds back through the
+    // table.
+    static const {type_name} atan2_quadrant_bias[4] = {{
+        0, Q{m_bits}_{n_bits}_PI, 0, ({type_name})-Q{m_bits}_{n_bits}_PI,
+    }};
+
+    if (x == 0 && y == 0) return 0;
+
+    int idx = ((y < 0) << 1) | (x < 0);
+    {type_name} ax = (x < 0) ? ({type_name})-x : x;
+    {wide_type} xf;
+    {type_name} z = cordic_vector(ax, y, &xf);
+
+    return ({type_name})(atan2_quadrant_bias[idx] + ((x < 0) ? ({type_name})-z : z));
 }}
 
+{atan_impl}
+
+void q{m_bits}_{n_bits}_hypot_atan2({type_name} y, {type_name} x,
+                      {type_name}* h, {type_name}* ang) {{
+    if (x == 0 && y == 0) {{
+        *h = 0;
+        *ang = 0;
+        return;
+    }}
+
+    // One vectoring pass yields both outputs: z converges to the angle
+    // and the final x to gain * sqrt(x^2 + y^2), undone by the same K
+    // constant the rotation mode uses. Vectoring only converges for
+    // x >= 0, so run on |x| and fold the left half-plane back by pi.
+    {type_name} ax = (x < 0) ? ({type_name})-x : x;
+    {wide_type} xf;
+    {type_name} z = cordic_vector(ax, y, &xf);
+    if (x < 0) {{
+        z = (y >= 0) ? ({type_name})(Q{m_bits}_{n_bits}_PI - z)
+                     : ({type_name})(-Q{m_bits}_{n_bits}_PI - z);
+    }}
+
+    {wide_type} mag = (xf * CORDIC_K_{n_bits}) >> {n_bits};
+    if (mag > Q{m_bits}_{n_bits}_MAX) mag = Q{m_bits}_{n_bits}_MAX;
+
+    *h = ({type_name})mag;
+    *ang = z;
+}}
+
+{sqrt_impl}
+
+// 2^f on [0, 1): 5th-order minimax Horner (truncated Chebyshev fit)
+{exp2_defs}
+
 {type_name} q{m_bits}_{n_bits}_exp2({type_name} x) {{
-    // Extract integer part
+    // Arithmetic shift floors toward -inf, so frac_part is in [0, 1)
     int int_part = x >> {n_bits};
     {type_name} frac_part = x & (Q{m_bits}_{n_bits}_ONE - 1);
-    
-    // Check overflow
+
     if (int_part >= {m_bits}) return Q{m_bits}_{n_bits}_MAX;
-    if (int_part < -{n_bits}) return 0;
-    
-    // Compute 2^int_part
-    {type_name} int_result = Q{m_bits}_{n_bits}_ONE << int_part;
-    
-    // Approximate 2^frac using polynomial
-    // 2^x ≈ 1 + x*ln(2) + (x*ln(2))^2/2
-    {type_name} ln2 = ({type_name})(0.693147 * (1LL << {n_bits}));
-    {type_name} term = (({base_type})frac_part * ln2) >> {n_bits};
-    {type_name} result = Q{m_bits}_{n_bits}_ONE + term;
-    term = (({base_type})term * term) >> ({n_bits} + 1);
-    result += term;
-    
-    return (({base_type})int_result * result) >> {n_bits};
+    if (int_part < -{n_bits} - 1) return 0;
+
+    {wide_type} r = EXP2_POLY_C5_{n_bits};
+{exp2_horner}
+
+    // Scale by 2^int_part; negative exponents shift right instead of
+    // invoking the old left-shift-by-negative
+    {wide_type} res = (int_part >= 0) ? (r << int_part) : (r >> -int_part);
+    if (res > Q{m_bits}_{n_bits}_MAX) res = Q{m_bits}_{n_bits}_MAX;
+    return ({type_name})res;
 }}
 
+// e^r on [0, ln2): 5th-order minimax Horner (truncated Chebyshev fit)
+{exp_defs}
+#define EXP_INV_LN2_{n_bits} (({wide_type}){inv_ln2})  // 2^{n_bits} / ln2
+#define EXP_LN2_{n_bits}     (({wide_type}){ln2_fixed})
+
 {type_name} q{m_bits}_{n_bits}_exp({type_name} x) {{
-    // e^x = 2^(x * log2(e))
-    {type_name} log2e = ({type_name})(1.442695 * (1LL << {n_bits}));
-    {type_name} scaled = (({base_type})x * log2e) >> {n_bits};
-    return q{m_bits}_{n_bits}_exp2(scaled);
+    // Decompose x = k*ln2 + r with k = floor(x / ln2), r in [0, ln2),
+    // then e^x = e^r << k directly. The old path rescaled by log2(e)
+    // and had exp2 multiply the scale right back out -- two wide
+    // multiplies that cancel.
+    int k = (int)((({wide_type})x * EXP_INV_LN2_{n_bits}) >> {2 * n_bits});
+
+    // The floored reciprocal can undershoot k by one; one correction
+    // step keeps r inside the kernel's fit range.
+    {wide_type} r = ({wide_type})x - (({wide_type})k * EXP_LN2_{n_bits});
+    if (r >= EXP_LN2_{n_bits}) {{
+        r -= EXP_LN2_{n_bits};
+        k++;
+    }}
+
+    if (k >= {m_bits}) return Q{m_bits}_{n_bits}_MAX;
+    if (k < -{n_bits} - 1) return 0;
+
+    {wide_type} er = EXP_POLY_C5_{n_bits};
+{exp_horner}
+
+    {wide_type} res = (k >= 0) ? (er << k) : (er >> -k);
+    if (res > Q{m_bits}_{n_bits}_MAX) res = Q{m_bits}_{n_bits}_MAX;
+    return ({type_name})res;
 }}
 
+// log2(1 + u) on [0, 1): order-4 minimax Horner (truncated Chebyshev fit)
+{log2_defs}
+
 {type_name} q{m_bits}_{n_bits}_log2({type_name} x) {{
     if (x <= 0) return Q{m_bits}_{n_bits}_MIN;
-    
-    // Find highest bit
-    int bit_pos = 0;
-    {type_name} val = x;
-    while (val > 0) {{
-        val >>= 1;
-        bit_pos++;
-    }}
-    bit_pos--;
-    
+
+    // Position of the highest set bit: single bit-scan, no shift loop
+    int bit_pos = q{m_bits}_{n_bits}_hibit(x);
+
     int int_part = bit_pos - {n_bits};
     
     // Normalize to [1, 2)
@@ -357,30 +1566,102 @@ static {type_name} cordic_vector({type_name} x, {type_name} y) {{
         normalized = x << ({n_bits} - bit_pos);
     }}
     
-    // Approximate log2(normalized) for normalized in [1,2)
-    {type_name} frac = normalized - Q{m_bits}_{n_bits}_ONE;
-    {type_name} inv_ln2 = ({type_name})(1.442695 * (1LL << {n_bits}));
-    {type_name} log_frac = (({base_type})frac * inv_ln2) >> {n_bits};
-    
-    return (int_part << {n_bits}) + log_frac;
+    // log2(1 + u) on [0, 1): order-4 minimax Horner replaces the old
+    // linear approximation (worst case ~0.086 absolute)
+    {type_name} u = normalized - Q{m_bits}_{n_bits}_ONE;
+    {wide_type} lf = LOG2_POLY_C4_{n_bits};
+{log2_horner}
+
+    return ({type_name})((({wide_type})int_part << {n_bits}) + lf);
 }}
 
 {type_name} q{m_bits}_{n_bits}_log({type_name} x) {{
     {type_name} log2_val = q{m_bits}_{n_bits}_log2(x);
     {type_name} ln2 = ({type_name})(0.693147 * (1LL << {n_bits}));
-    return (({base_type})log2_val * ln2) >> {n_bits};
+    return ({type_name})((({wide_type})log2_val * ln2) >> {n_bits});
 }}
 
 {type_name} q{m_bits}_{n_bits}_pow({type_name} base, {type_name} exponent) {{
     if (base <= 0) return 0;
-    // x^y = 2^(y * log2(x))
+    // x^y = 2^(y * log2(x)); wide multiply with saturation, as in exp
     {type_name} log_base = q{m_bits}_{n_bits}_log2(base);
-    {type_name} scaled = (({base_type})exponent * log_base) >> {n_bits};
-    return q{m_bits}_{n_bits}_exp2(scaled);
+    {wide_type} scaled = (({wide_type})exponent * log_base) >> {n_bits};
+    if (scaled > Q{m_bits}_{n_bits}_MAX) scaled = Q{m_bits}_{n_bits}_MAX;
+    if (scaled < Q{m_bits}_{n_bits}_MIN) scaled = Q{m_bits}_{n_bits}_MIN;
+    return q{m_bits}_{n_bits}_exp2(({type_name})scaled);
 }}
 """
     return impl
 
+def generate_dispatch_header(formats):
+    """Umbrella header with format-token dispatch macros.
+
+    Dispatch is keyed on the format token rather than C23 _Generic on
+    the value: the q*_t handles are plain integer typedefs -- q15_16_t,
+    q8_8_t, q23_8_t and q31_0_t are all int32_t -- so a value-keyed
+    _Generic association list would repeat the same type (a constraint
+    violation) and could never tell those formats apart anyway.
+    """
+    includes = "\n".join(f'#include "q{m}_{n}_math.h"' for m, n in formats)
+    return f"""/**
+ * @file fixp_math.h
+ * @brief Umbrella header and format-keyed math dispatch (Generated)
+ *
+ * Pulls in every generated Qm.n math header and provides FIXP_*
+ * macros that paste the format token onto the matching entry point,
+ * e.g. FIXP_SIN(q15_16, a) -> q15_16_sin(a). Dispatch is keyed on the
+ * format token, not _Generic on the value: the q*_t handles are plain
+ * integer typedefs and several formats share one storage type, so a
+ * value-keyed _Generic could not tell them apart.
+ */
+
+#ifndef FIXP_GEN_FIXP_MATH_H
+#define FIXP_GEN_FIXP_MATH_H
+
+{includes}
+
+#define FIXP_SIN(fmt, x)                  fmt##_sin(x)
+#define FIXP_COS(fmt, x)                  fmt##_cos(x)
+#define FIXP_SINCOS(fmt, x, s, c)         fmt##_sincos(x, s, c)
+#define FIXP_TAN(fmt, x)                  fmt##_tan(x)
+#define FIXP_ATAN(fmt, x)                 fmt##_atan(x)
+#define FIXP_ATAN2(fmt, y, x)             fmt##_atan2(y, x)
+#define FIXP_HYPOT_ATAN2(fmt, y, x, h, a) fmt##_hypot_atan2(y, x, h, a)
+#define FIXP_SQRT(fmt, x)                 fmt##_sqrt(x)
+#define FIXP_EXP(fmt, x)                  fmt##_exp(x)
+#define FIXP_EXP2(fmt, x)                 fmt##_exp2(x)
+#define FIXP_LOG(fmt, x)                  fmt##_log(x)
+#define FIXP_LOG2(fmt, x)                 fmt##_log2(x)
+#define FIXP_POW(fmt, x, y)               fmt##_pow(x, y)
+
+#endif // FIXP_GEN_FIXP_MATH_H
+"""
+
+
+def _emit_tables(n, output_dir):
+    """Write the shared atan table pair for one fractional width."""
+    table_header, table_impl = generate_cordic_table_files(n)
+    header_file = output_dir / f"cordic_atan_table_N{n}.h"
+    header_file.write_text(table_header)
+    impl_file = output_dir / f"cordic_atan_table_N{n}.c"
+    impl_file.write_text(table_impl)
+    return (header_file, impl_file)
+
+
+def _emit_format(m, n, output_dir):
+    """Write the math header/impl pair for one format.
+
+    Runs in a worker process: each format's Chebyshev fits are
+    independent, and the coefficient caches repopulate per worker.
+    The content is assembled in memory and written in one shot.
+    """
+    header_file = output_dir / f"q{m}_{n}_math.h"
+    header_file.write_text(generate_math_header(m, n))
+    impl_file = output_dir / f"q{m}_{n}_math.c"
+    impl_file.write_text(generate_cordic_c_file(m, n))
+    return (header_file, impl_file)
+
+
 def main():
     output_dir = Path(__file__).parent.parent / "include" / "fixp" / "gen"
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -395,19 +1676,28 @@ def main():
         (23, 8),   # Q23.8 (32-bit)
         (31, 0),   # Q31.0 (32-bit integer)
     ]
-    
-    for m, n in formats:
-        # Generate header
-        header_content = generate_math_header(m, n)
-        header_file = output_dir / f"q{m}_{n}_math.h"
-        header_file.write_text(header_content)
-        print(f"Generated {header_file}")
-        
-        # Generate implementation
-        impl_content = generate_cordic_c_file(m, n)
-        impl_file = output_dir / f"q{m}_{n}_math.c"
-        impl_file.write_text(impl_content)
-        print(f"Generated {impl_file}")
+
+    # Shared headers: the CORDIC kernel macros the per-format .c files
+    # expand, and the umbrella dispatch header over all formats.
+    for name, content in (
+        ("fixp_cordic_impl.h", FIXP_CORDIC_IMPL),
+        ("fixp_math.h", generate_dispatch_header(formats)),
+    ):
+        shared = output_dir / name
+        shared.write_text(content)
+        print(f"Generated {shared}")
+
+    # Fan the per-width tables and per-format files out across cores;
+    # the Chebyshev fits dominate and are embarrassingly parallel.
+    with ProcessPoolExecutor() as ex:
+        table_jobs = [
+            ex.submit(_emit_tables, n, output_dir)
+            for n in sorted({n for _, n in formats})
+        ]
+        format_jobs = [ex.submit(_emit_format, m, n, output_dir) for m, n in formats]
+        for job in table_jobs + format_jobs:
+            for path in job.result():
+                print(f"Generated {path}")
 
 if __name__ == "__main__":
     main()
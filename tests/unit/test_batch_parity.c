@@ -0,0 +1,90 @@
+#include <stdio.h>
+#include <assert.h>
+#include <stdalign.h>
+#include <stdlib.h>
+#include "fixp/gen/q15_16.h"
+#include "fixp/gen/q15_16_math.h"
+
+// 37 elements: covers the 8-wide AVX2 body, the 4-wide NEON body, and a
+// non-empty scalar tail for both.
+#define N 37
+
+int main(void) {
+    alignas(64) q15_16_t a[N], b[N], out[N];
+    alignas(64) double d[N];
+
+    // Deterministic inputs spanning signs and magnitudes, including values
+    // whose products exercise the round-half-to-even tie fix.
+    for (int i = 0; i < N; i++) {
+        uint32_t u = (uint32_t)i;
+        a[i] = Q15_16_WRAP((int32_t)((u * 2654435761u) ^ (u << 20)));
+        b[i] = Q15_16_WRAP((int32_t)(u * 40503u - (1u << (i % 28))));
+        d[i] = (i - 18) * 1.6180339887 + i * 0.0078125;
+    }
+
+    // Arithmetic batches must match the scalar ops element for element
+    q15_16_add_v(a, b, out, N);
+    for (int i = 0; i < N; i++) assert(out[i] == q15_16_add(a[i], b[i]));
+
+    q15_16_sub_v(a, b, out, N);
+    for (int i = 0; i < N; i++) assert(out[i] == q15_16_sub(a[i], b[i]));
+
+    q15_16_mul_v(a, b, out, N);
+    for (int i = 0; i < N; i++) assert(out[i] == q15_16_mul(a[i], b[i]));
+
+    q15_16_from_double_v(d, out, N);
+    for (int i = 0; i < N; i++) assert(out[i] == q15_16_from_double(d[i]));
+
+    // Elementwise helpers from the math header
+    q15_16_abs_v(a, out, N);
+    for (int i = 0; i < N; i++) assert(out[i] == q15_16_abs(a[i]));
+
+    q15_16_min_v(a, b, out, N);
+    for (int i = 0; i < N; i++) assert(out[i] == q15_16_min(a[i], b[i]));
+
+    q15_16_max_v(a, b, out, N);
+    for (int i = 0; i < N; i++) assert(out[i] == q15_16_max(a[i], b[i]));
+
+    const q15_16_t lo = q15_16_from_double(-4.0);
+    const q15_16_t hi = q15_16_from_double(9.5);
+    q15_16_clamp_v(a, out, N, lo, hi);
+    for (int i = 0; i < N; i++) assert(out[i] == q15_16_clamp(a[i], lo, hi));
+
+    // Batch trig shares the CORDIC kernel with the scalars, but the
+    // vector path keeps the fixed iteration schedule where the scalar
+    // path recodes per element, so lanes can land a few LSB apart (up to 6 observed on these
+    // inputs; the hypot magnitude, spanning the full raw range, drifts
+    // up to 11). The bounds below are still ~1e-4 of full scale.
+    q15_16_sin_v(a, out, N);
+    for (int i = 0; i < N; i++) assert(llabs((long long)out[i] - q15_16_sin(a[i])) <= 8);
+
+    q15_16_cos_v(a, out, N);
+    for (int i = 0; i < N; i++) assert(llabs((long long)out[i] - q15_16_cos(a[i])) <= 8);
+
+    alignas(64) q15_16_t h[N], ang[N];
+    q15_16_hypot_atan2_v(a, b, h, ang, N);
+    for (int i = 0; i < N; i++) {
+        q15_16_t hs, angs;
+        q15_16_hypot_atan2(a[i], b[i], &hs, &angs);
+        assert(llabs((long long)h[i] - hs) <= 16 && llabs((long long)ang[i] - angs) <= 8);
+    }
+
+    // div_const must be bit-identical to div, not an approximation.
+    // The div_const calls below use a literal denominator so the
+    // compiler takes the constant-folded (magic-number multiply) path;
+    // the reference divides by a volatile copy, forcing the runtime
+    // divide. Q15_16_WRAP(-789323197) / 3.0 is a case where a
+    // rounded-reciprocal multiply drifts thousands of raw units.
+    volatile q15_16_t three_rt = Q15_16_WRAP(3 * 65536);
+    assert(q15_16_div_const(Q15_16_WRAP(-789323197), Q15_16_WRAP(3 * 65536)) ==
+           q15_16_div(Q15_16_WRAP(-789323197), three_rt));
+    for (int i = 0; i < N; i++) {
+        assert(q15_16_div_const(a[i], Q15_16_WRAP(3 * 65536)) ==
+               q15_16_div(a[i], three_rt));
+        assert(q15_16_div_const(b[i], Q15_16_WRAP(3 * 65536)) ==
+               q15_16_div(b[i], three_rt));
+    }
+
+    printf("Batch Parity Tests Passed\n");
+    return 0;
+}
@@ -80,6 +80,14 @@ int main(void) {
     
     val = q15_16_cos(Q15_16_PI / 2);
     test_function("cos(pi/2)", (double)val / (1 << 16), 0.0);
+
+    q15_16_t s, c;
+    q15_16_sincos(Q15_16_PI / 4, &s, &c);
+    test_function("sincos(pi/4).s", (double)s / (1 << 16), sin(M_PI/4));
+    test_function("sincos(pi/4).c", (double)c / (1 << 16), cos(M_PI/4));
+
+    val = q15_16_tan(Q15_16_PI / 4);
+    test_function("tan(pi/4)", (double)val / (1 << 16), 1.0);
     printf("\n");
     
     // Test atan